@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark the local title index: build, save, load and query times.
+
+Indexes synthetic provider results (distinct made-up titles, some with
+years, common words mixed in), then times exact, prefix (type-ahead) and
+misspelled queries against the loaded index.
+
+Usage:
+    python bench_index.py [-t TITLES] [-n ITERATIONS]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from bench_parsers import time_it
+from franken_stream.index import TitleIndex
+
+SYLLABLES = [
+    "ka", "ro", "mi", "sen", "tor", "la", "vi", "den", "sha", "qu", "bel", "nor", "fa", "zu",
+    "pen", "dra", "gon", "lux", "mar", "ti", "ost", "wyn", "cha", "ble", "rith", "ex", "ung",
+    "pho", "sk", "ja", "vel", "cro", "nim", "bur", "ga", "hel", "ix", "om", "stra", "eep",
+]
+COMMON_WORDS = ["the", "of", "a", "and", "in", "man", "night", "last", "day", "love", "war"]
+
+
+def synthetic_titles(count: int, seed: int = 3) -> List[str]:
+    """Build distinct-looking titles from a made-up vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = list(
+        {"".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(6000)}
+    )
+    titles = []
+    for _ in range(count):
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(1, 3))]
+        if rng.random() < 0.5:
+            words.insert(rng.randint(0, len(words)), rng.choice(COMMON_WORDS))
+        title = " ".join(words).title()
+        if rng.random() < 0.5:
+            title += f" ({rng.randint(1950, 2025)})"
+        titles.append(title)
+    return titles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-t", "--titles", type=int, default=20000)
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("TITLE INDEX BENCHMARK")
+    print("=" * 70)
+
+    titles = synthetic_titles(args.titles)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "title-index.gz"
+        index = TitleIndex(path)
+
+        start = time.perf_counter()
+        for offset in range(0, len(titles), 20):
+            page = titles[offset:offset + 20]
+            index.add(
+                f"https://provider{offset % 9}.example/search/",
+                [(title, f"/movie/{offset + i}") for i, title in enumerate(page)],
+            )
+        add_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        index.save()
+        save_ms = (time.perf_counter() - start) * 1000
+
+        index = TitleIndex(path)
+        start = time.perf_counter()
+        index.count()
+        load_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"  {len(titles)} titles: add {add_ms:7.1f} ms  save {save_ms:6.1f} ms  "
+            f"load {load_ms:6.1f} ms  file {path.stat().st_size // 1024} KB\n"
+        )
+
+        queries = [
+            ("exact", titles[5].split(" (")[0]),
+            ("prefix", titles[77][:5]),
+            ("common words", "the last"),
+            ("misspelled", titles[123].lower().replace("a", "e", 1)),
+        ]
+        for name, query in queries:
+            hits = index.search(query)
+            query_ms = time_it(lambda: index.search(query), args.iterations)
+            print(f"  {name:<14} {query!r:<28} {query_ms:6.3f} ms  {len(hits):>3} hits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Benchmark HTML parser backends over recorded provider pages.
+
+Usage:
+    python bench_parsers.py                      # synthetic provider-like pages
+    python bench_parsers.py pages/               # recorded *.html pages
+    python bench_parsers.py --record "Inception" # record search pages to pages/
+
+Each page is timed three ways: a full BeautifulSoup parse, parse plus
+extraction over the tree, and the extractors' targeted streaming scan over
+the raw bytes. Set FRANKEN_STREAM_PARSER to force the backend used by
+franken-stream itself.
+"""
+
+import argparse
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from franken_stream import scraper as scraper_module
+from franken_stream import parsing
+from franken_stream.parsing import PARSER_ENV, available_backends, make_soup
+from franken_stream.scraper import ContentScraper
+
+# Silence extractor logging while timing
+scraper_module.console.quiet = True
+
+
+def synthetic_search_page(cards: int = 400) -> str:
+    """Build a search results page shaped like the configured providers."""
+    nav = "".join(f'<li><a href="/genre/{i}">Genre {i}</a></li>' for i in range(80))
+    items = "".join(
+        f'<div class="flw-item"><div class="film-poster">'
+        f'<img data-src="https://img.example.com/{i}.jpg" alt="Movie {i}">'
+        f'<a href="/movie/watch-movie-{i}" class="film-poster-ahref"></a></div>'
+        f'<div class="film-detail"><h3 class="film-name">'
+        f'<a href="/movie/watch-movie-{i}" title="Movie Title {i}" class="film-name">'
+        f"Movie Title {i}</a></h3>"
+        f'<div class="fd-infor"><span class="fdi-item">{1990 + i % 35}</span>'
+        f'<span class="fdi-item">HD</span></div></div></div>'
+        for i in range(cards)
+    )
+    script = "<script>var cfg = {" + ",".join(f'"k{i}": {i}' for i in range(2000)) + "};</script>"
+    return (
+        f"<html><head><title>Search</title>{script}</head><body>"
+        f'<header><nav><ul class="menu">{nav}</ul></nav></header>'
+        f'<div class="film_list-wrap">{items}</div>'
+        f"<footer>{nav}</footer></body></html>"
+    )
+
+
+def synthetic_detail_page(paragraphs: int = 600) -> str:
+    """Build a detail page with the player iframe near the end of the document."""
+    filler = "".join(
+        f'<div class="comment"><p>Comment {i} about the movie.</p>'
+        f'<a href="/user/{i}">user{i}</a></div>'
+        for i in range(paragraphs)
+    )
+    script = "<script>" + "var x = 1;" * 5000 + "</script>"
+    return (
+        f"<html><head>{script}</head><body><div class='comments'>{filler}</div>"
+        f'<div class="player-container"><iframe src="https://vidplay.online/e/abc123" '
+        f'allowfullscreen></iframe></div></body></html>'
+    )
+
+
+def load_pages(directory: Path) -> List[Tuple[str, str, str]]:
+    """Load recorded pages as (name, kind, html); 'detail' in the name marks detail pages."""
+    pages = []
+    for path in sorted(directory.glob("*.html")):
+        kind = "detail" if "detail" in path.stem else "search"
+        pages.append((path.name, kind, path.read_text(encoding="utf-8", errors="replace")))
+    return pages
+
+
+def record_pages(query: str, directory: Path) -> None:
+    """Save each configured provider's search page for later benchmarking."""
+    from urllib.parse import quote, urlparse
+
+    from franken_stream.providers import ProviderManager
+
+    directory.mkdir(parents=True, exist_ok=True)
+    scraper = ContentScraper()
+    for base in ProviderManager().get_search_bases():
+        url = f"{base}{quote(query.replace(' ', '+'))}"
+        try:
+            response = scraper.session.get(url, timeout=10)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"  ✗ {url}: {e}")
+            continue
+        path = directory / f"{urlparse(base).netloc}-search.html"
+        path.write_text(response.text, encoding="utf-8")
+        print(f"  ✓ {path} ({len(response.content) // 1024} KB)")
+
+
+def time_it(func: Callable[[], object], iterations: int) -> float:
+    """Return the best per-call time in milliseconds."""
+    best = float("inf")
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def use_backend(backend: str) -> None:
+    """Force the backend used by the extractors' targeted scan."""
+    os.environ[PARSER_ENV] = backend
+    parsing.default_backend.cache_clear()
+
+
+def run(pages: List[Tuple[str, str, str]], iterations: int) -> Dict[str, Dict[str, float]]:
+    """Time full parse, full-tree extraction and targeted scan for every page and backend."""
+    timings: Dict[str, Dict[str, float]] = {}
+    for backend in available_backends():
+        use_backend(backend)
+        print(f"\n[{backend}]")
+        print("-" * 70)
+        totals = {"parse": 0.0, "extract": 0.0, "scan": 0.0}
+        for name, kind, html in pages:
+            raw = html.encode()
+            if kind == "detail":
+                extractor = lambda page: ContentScraper._extract_embed(  # noqa: E731
+                    page, "https://example.com/movie/1"
+                )
+            else:
+                extractor = ContentScraper._extract_results
+            parse_ms = time_it(lambda: make_soup(raw, backend), iterations)
+            extract_ms = time_it(lambda: extractor(make_soup(raw, backend)), iterations)
+            scan_ms = time_it(lambda: extractor(raw), iterations)
+            totals["parse"] += parse_ms
+            totals["extract"] += extract_ms
+            totals["scan"] += scan_ms
+            print(
+                f"  {name[:28]:<28} {len(html) // 1024:>5} KB  "
+                f"parse {parse_ms:7.2f} ms  parse+extract {extract_ms:7.2f} ms  "
+                f"targeted scan {scan_ms:7.2f} ms"
+            )
+        timings[backend] = totals
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="?", type=Path, help="Directory of recorded *.html pages")
+    parser.add_argument("--record", metavar="QUERY", help="Record provider search pages first")
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.record:
+        directory = args.pages or Path("pages")
+        print(f"Recording search pages for '{args.record}' into {directory}/")
+        record_pages(args.record, directory)
+        args.pages = directory
+
+    if args.pages:
+        pages = load_pages(args.pages)
+    else:
+        pages = [
+            ("synthetic-search.html", "search", synthetic_search_page()),
+            ("synthetic-detail.html", "detail", synthetic_detail_page()),
+        ]
+
+    print("=" * 70)
+    print("PARSER BACKEND BENCHMARK")
+    print("=" * 70)
+    print(f"Pages: {len(pages)}  Iterations: {args.iterations}  (best of N)")
+
+    timings = run(pages, args.iterations)
+
+    print("\n" + "=" * 70)
+    baseline = timings.get("html.parser", {}).get("extract")
+    for backend, totals in timings.items():
+        speedup = f"  ({baseline / totals['scan']:.1f}x)" if baseline else ""
+        print(
+            f"{backend:<12} parse {totals['parse']:8.2f} ms  "
+            f"parse+extract {totals['extract']:8.2f} ms  "
+            f"targeted scan {totals['scan']:8.2f} ms{speedup}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark cross-provider ranking and near-duplicate clustering.
+
+Ranks synthetic result sets shaped like real provider output (the same
+titles spelled differently across sites, release tags, years) and reports
+the time per ranking pass, cold (empty normalization cache) and warm.
+
+Usage:
+    python bench_ranking.py [-n ITERATIONS]
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from bench_parsers import time_it
+from franken_stream.ranking import normalize, rank_results
+
+TITLES = [
+    "Inception", "Interstellar", "The Dark Knight", "Dune", "Dune Part Two",
+    "Spider-Man: No Way Home", "Oppenheimer", "Tenet", "The Prestige", "Memento",
+    "Blade Runner 2049", "Arrival", "Sicario", "Prisoners", "Insidious",
+]
+DECORATIONS = ["{t}", "{t} ({y})", "{t} HD", "Watch {t} Online Free", "{t} {y} 1080p", "{t} (CAM)"]
+
+
+def synthetic_batches(
+    providers: int, per_provider: int, seed: int = 7
+) -> List[Tuple[str, List[Tuple[str, str]]]]:
+    """Build (provider, results) batches with overlapping, re-spelled titles."""
+    rng = random.Random(seed)
+    batches = []
+    for p in range(providers):
+        results = []
+        for i in range(per_provider):
+            base = rng.choice(TITLES)
+            if rng.random() < 0.5:
+                base = f"{base} {rng.randint(1, 500)}"  # long tail of distinct works
+            title = rng.choice(DECORATIONS).format(t=base, y=rng.randint(1990, 2024))
+            results.append((title, f"https://provider{p}.example/movie/{i}"))
+        batches.append((f"https://provider{p}.example/search/", results))
+    return batches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("RESULT RANKING BENCHMARK")
+    print("=" * 70)
+
+    for providers, per_provider in [(9, 20), (10, 100), (20, 250)]:
+        batches = synthetic_batches(providers, per_provider)
+        total = providers * per_provider
+
+        normalize.cache_clear()
+        start = time.perf_counter()
+        ranked = rank_results("inception 2010", batches)
+        cold_ms = (time.perf_counter() - start) * 1000
+        warm_ms = time_it(lambda: rank_results("inception 2010", batches), args.iterations)
+
+        print(
+            f"  {total:>5} results → {len(ranked):>5} works  "
+            f"cold {cold_ms:7.2f} ms  warm {warm_ms:7.2f} ms  "
+            f"top: {ranked[0].title}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the regex fallback stage of embed/result extraction.
+
+Compares the old approach (re-serialize the soup with str(), then one
+re.findall pass per pattern) with the single combined pattern run over the
+raw response bytes.
+
+Usage:
+    python bench_regex.py [-n ITERATIONS]
+"""
+
+import argparse
+import re
+
+from bench_parsers import synthetic_detail_page, synthetic_search_page, time_it
+from franken_stream.parsing import make_soup
+from franken_stream.scraper import EMBED_PATTERNS, _scan_embed_patterns
+
+LEGACY_DIRECT_PATTERN = r'(https?://[^\s\'"]+\.(m3u8|mp4))'
+
+
+def legacy_embed_fallback(soup) -> list:
+    """Old strategies 4 and 5: str(soup) plus six separate findall passes."""
+    html_str = str(soup)
+    matches = re.findall(LEGACY_DIRECT_PATTERN, html_str)
+    if matches:
+        return [matches[0][0]]
+    for pattern, _ in EMBED_PATTERNS:
+        matches = re.findall(pattern, html_str)
+        if matches and matches[0].startswith("http"):
+            return [matches[0]]
+    return []
+
+
+def combined_embed_fallback(raw: bytes) -> list:
+    """New strategies 4 and 5: one pass over the raw bytes."""
+    return _scan_embed_patterns(raw, first_only=True, stop_on_direct=True)
+
+
+def legacy_results_fallback(soup) -> list:
+    html_str = str(soup)
+    return [re.findall(pattern, html_str) for pattern, _ in EMBED_PATTERNS]
+
+
+def combined_results_fallback(raw: bytes) -> dict:
+    return _scan_embed_patterns(raw)
+
+
+def scripted_player_page(size_kb: int) -> str:
+    """Detail page whose only stream URL sits inside a player script near the end."""
+    page = synthetic_detail_page(paragraphs=size_kb * 4)
+    player = (
+        '<script>jwplayer("p").setup({file: "https://cdn.example.com/hls/abc/master.m3u8"});'
+        "</script>"
+    )
+    return page.replace("<div class=\"player-container\">", player + "<div>", 1).replace(
+        '<iframe src="https://vidplay.online/e/abc123" allowfullscreen></iframe>', ""
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("REGEX FALLBACK MICRO-BENCHMARK")
+    print("=" * 70)
+
+    cases = [
+        ("embed, small page", "embed", scripted_player_page(100)),
+        ("embed, medium page", "embed", scripted_player_page(500)),
+        ("embed, large page", "embed", scripted_player_page(2000)),
+        ("results, search page", "results", synthetic_search_page(cards=1000)),
+    ]
+
+    for name, kind, html in cases:
+        raw = html.encode()
+        soup = make_soup(raw)
+        if kind == "embed":
+            legacy = lambda: legacy_embed_fallback(soup)  # noqa: E731
+            combined = lambda: combined_embed_fallback(raw)  # noqa: E731
+        else:
+            legacy = lambda: legacy_results_fallback(soup)  # noqa: E731
+            combined = lambda: combined_results_fallback(raw)  # noqa: E731
+
+        legacy_ms = time_it(legacy, args.iterations)
+        combined_ms = time_it(combined, args.iterations)
+        print(
+            f"  {name:<22} {len(raw) // 1024:>5} KB  "
+            f"str(soup)+findall {legacy_ms:8.2f} ms  "
+            f"single pass {combined_ms:8.2f} ms  ({legacy_ms / combined_ms:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark CLI cold start per subcommand with `python -X importtime`.
+
+Runs each subcommand in a fresh interpreter against a throwaway config
+directory and reports the import time from -X importtime, minus what a
+bare interpreter imports anyway. Times are machine-dependent and only
+reported. What fails the run is a command that doesn't search loading the
+scraper stack, requests or Textual: a heavy import creeping back into
+module level is caught even when the machine is fast enough to hide it.
+
+Usage:
+    python bench_startup.py [-n ITERATIONS]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# Modules only the search, scraping and TUI code paths may import
+HEAVY_MODULES = ("textual", "bs4", "requests", "franken_stream.scraper", "franken_stream.tui")
+
+
+class Case(NamedTuple):
+    """One CLI invocation and the modules it must not import."""
+
+    args: Tuple[str, ...]
+    forbidden: Tuple[str, ...]
+
+
+CASES = [
+    Case(("--help",), HEAVY_MODULES),
+    Case(("watch", "--help"), HEAVY_MODULES),
+    Case(("tv", "--help"), HEAVY_MODULES),
+    Case(("test-providers", "--help"), HEAVY_MODULES),
+    Case(("batch", "--help"), HEAVY_MODULES),
+    Case(("update", "--help"), HEAVY_MODULES),
+    Case(("validate",), HEAVY_MODULES),
+    Case(("config",), HEAVY_MODULES),
+]
+
+
+def parse_importtime(stderr: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Parse -X importtime output.
+
+    Returns:
+        Total import time in ms, and cumulative ms per imported module
+    """
+    modules: Dict[str, float] = {}
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # column header
+        modules[name.strip()] = int(cumulative) / 1000
+        # Top-level imports are indented by a single space
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def run_python(args: List[str], env: Dict[str, str]) -> Tuple[float, float, Dict[str, float]]:
+    """Run the interpreter under -X importtime; return (import ms, wall ms, per-module ms)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=REPO_DIR,
+        timeout=60,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited with {result.returncode}")
+    import_ms, modules = parse_importtime(result.stderr)
+    return import_ms, wall_ms, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix="franken-startup-")
+    config_dir = Path(home) / ".franken-stream"
+    config_dir.mkdir()
+    # A local config, so no command tries to fetch one from GitHub
+    shutil.copy(REPO_DIR / "providers.json", config_dir / "providers.json")
+    env = dict(os.environ, HOME=home, PYTHONPATH=str(REPO_DIR))
+
+    print("=" * 70)
+    print("CLI STARTUP BENCHMARK (-X importtime, best of %d)" % args.iterations)
+    print("=" * 70)
+
+    failures: List[str] = []
+    try:
+        baseline_ms = min(
+            run_python(["-c", "pass"], env)[0] for _ in range(args.iterations)
+        )
+        print(f"  {'(bare interpreter)':<22} imports {baseline_ms:7.1f} ms, subtracted below")
+
+        for case in CASES:
+            runs = [
+                run_python(["-m", "franken_stream.main", *case.args], env)
+                for _ in range(args.iterations)
+            ]
+            import_ms, wall_ms, modules = min(runs, key=lambda run: run[0])
+            import_ms -= baseline_ms
+            loaded = [name for name in case.forbidden if name in modules]
+
+            label = " ".join(case.args)
+            print(
+                f"  {label:<22} imports {import_ms:7.1f} ms  "
+                f"wall {wall_ms:7.1f} ms  {'FAIL' if loaded else 'ok'}"
+            )
+            heaviest = sorted(
+                ((ms, name) for name, ms in modules.items() if name.startswith("franken_stream")),
+                reverse=True,
+            )[:3]
+            for ms, name in heaviest:
+                print(f"      {name:<34} {ms:7.1f} ms")
+            if loaded:
+                failures.append(f"{label}: imports {', '.join(loaded)}")
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    if failures:
+        print("\nStartup regressions:")
+        for failure in failures:
+            print(f"  ✗ {failure}")
+        sys.exit(1)
+    print("\n  No command imports the scraper stack, requests or Textual")
+
+
+if __name__ == "__main__":
+    main()
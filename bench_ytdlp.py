@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark time-to-stream-URL: yt-dlp subprocess vs in-process resolver.
+
+Compares spawning `yt-dlp --get-url` per resolution with YtDlpResolver's
+in-process extraction, both cold (first call: import plus extractor setup)
+and warm (pooled YoutubeDL instance reused). Without URL arguments a local
+server serves a small video file so the benchmark runs offline.
+
+Usage:
+    python bench_ytdlp.py [-n ITERATIONS] [URL ...]
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+from franken_stream.resolver import YtDlpResolver, _load_yt_dlp
+
+VIDEO_BYTES = b"\x00\x00\x00\x18ftypmp42" + b"\x00" * 4096
+
+
+class _VideoHandler(BaseHTTPRequestHandler):
+    """Serves the same tiny MP4 at every path."""
+
+    def _headers(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(len(VIDEO_BYTES)))
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers()
+
+    def do_GET(self):
+        self._headers()
+        self.wfile.write(VIDEO_BYTES)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def local_video_urls() -> List[str]:
+    """Start a background server and return a few video URLs on it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _VideoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    return [f"http://127.0.0.1:{port}/videos/{n}.mp4" for n in range(3)]
+
+
+def time_once(func: Callable[[], object]) -> float:
+    """Return one call's time in milliseconds, failing loudly on no URL."""
+    start = time.perf_counter()
+    if not func():
+        raise RuntimeError("yt-dlp returned no URL")
+    return (time.perf_counter() - start) * 1000
+
+
+def subprocess_get_url(url: str) -> str:
+    """The old path: one yt-dlp process per resolution."""
+    result = subprocess.run(
+        ["yt-dlp", "-f", "best", "--no-playlist", "--get-url", url],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    return result.stdout.strip().split("\n")[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("urls", nargs="*", help="URLs to resolve (default: local test server)")
+    args = parser.parse_args()
+
+    if shutil.which("yt-dlp") is None:
+        sys.exit("yt-dlp executable not found on PATH")
+    urls = args.urls or local_video_urls()
+
+    print("=" * 70)
+    print("YT-DLP TIME-TO-STREAM-URL BENCHMARK")
+    print("=" * 70)
+
+    # Cold in-process call first, before anything has imported yt_dlp
+    resolver = YtDlpResolver()
+    cold_ms = time_once(lambda: resolver.get_url(urls[0]))
+    if _load_yt_dlp() is None:
+        sys.exit("yt_dlp module not importable")
+
+    for url in urls:
+        subprocess_ms = min(
+            time_once(lambda: subprocess_get_url(url)) for _ in range(args.iterations)
+        )
+        warm_ms = min(
+            time_once(lambda: resolver.get_url(url)) for _ in range(args.iterations)
+        )
+        print(
+            f"  {url[-40:]:<40}  subprocess {subprocess_ms:8.1f} ms  "
+            f"in-process {warm_ms:7.1f} ms  ({subprocess_ms / warm_ms:5.1f}x)"
+        )
+
+    print(f"\n  First in-process call (import + extractor setup): {cold_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Shared pytest fixtures: a local HTTP server standing in for providers."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pytest
+
+
+class Route(NamedTuple):
+    """A canned response served for every path starting with a prefix."""
+
+    status: int
+    body: bytes
+    headers: Dict[str, str]
+    delay: float
+    allow_head: bool = True
+
+
+class LocalServer:
+    """Threaded HTTP server with canned responses per path prefix."""
+
+    def __init__(self):
+        self.routes: Dict[str, Route] = {}
+        # (method, path, request headers) for every request received
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base + path
+
+    def add(
+        self,
+        prefix: str,
+        body: bytes = b"",
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        delay: float = 0.0,
+        allow_head: bool = True,
+    ) -> None:
+        self.routes[prefix] = Route(status, body, headers or {}, delay, allow_head)
+
+    def hits(self, prefix: str) -> int:
+        return sum(1 for _, path, _ in self.requests if path.startswith(prefix))
+
+    def _route(self, path: str) -> Optional[Route]:
+        matches = [prefix for prefix in self.routes if path.startswith(prefix)]
+        return self.routes[max(matches, key=len)] if matches else None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, send_body: bool) -> None:
+                server.requests.append((self.command, self.path, dict(self.headers)))
+                route = server._route(self.path)
+                if route is None:
+                    route = Route(404, b"not found", {}, 0.0)
+                if route.delay:
+                    time.sleep(route.delay)
+                if self.command == "HEAD" and not route.allow_head:
+                    route = Route(405, b"", {}, 0.0)
+                etag = route.headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(route.status)
+                headers = {"Content-Type": "text/html; charset=utf-8", **route.headers}
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(route.body)))
+                self.end_headers()
+                if send_body:
+                    try:
+                        self.wfile.write(route.body)
+                    except (BrokenPipeError, ConnectionResetError):
+                        pass
+
+            def do_GET(self):
+                self._respond(send_body=True)
+
+            def do_HEAD(self):
+                self._respond(send_body=False)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "LocalServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def server():
+    local = LocalServer().start()
+    yield local
+    local.stop()
+
+
+def results_page(*titles: str, prefix: str = "/movie/") -> bytes:
+    """A provider search page listing the given titles."""
+    links = "".join(
+        f'<div class="film-poster"><a class="film-name" href="{prefix}{i}">{title}</a></div>'
+        for i, title in enumerate(titles)
+    )
+    return f"<html><body>{links}</body></html>".encode()
@@ -0,0 +1,67 @@
+"""requests transport adapter serving responses from the on-disk cache.
+
+Kept apart from franken_stream.cache so commands that only inspect the
+caches (e.g. ``config``) don't import requests.
+"""
+
+import io
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from franken_stream.cache import CachedResponse, ResponseCache
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    Transport adapter that puts a ResponseCache in front of a requests.Session.
+
+    Only successful GET responses are cached, and streamed requests are
+    never stored since their callers read the body incrementally. Responses
+    served from the cache have ``from_cache`` set to True.
+    """
+
+    def __init__(self, cache: ResponseCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if request.method != "GET":
+            return super().send(request, stream, timeout, verify, cert, proxies)
+
+        entry = self.cache.get(request.url)
+        if entry is not None and entry.is_fresh:
+            return self._build_cached_response(request, entry)
+
+        if entry is not None and entry.can_revalidate:
+            request.headers.update(entry.validators)
+
+        response = super().send(request, stream, timeout, verify, cert, proxies)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(request.url, dict(response.headers))
+            response.close()
+            return self._build_cached_response(request, entry)
+
+        if response.status_code == 200 and not stream:
+            self.cache.store_response(request.url, dict(response.headers), response.content)
+
+        return response
+
+    def _build_cached_response(self, request, entry: CachedResponse) -> Response:
+        """Construct a requests.Response from a cache entry."""
+        response = Response()
+        response.status_code = entry.status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(entry.body)
+        response._content = entry.body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
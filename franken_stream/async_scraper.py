@@ -0,0 +1,526 @@
+"""Asyncio scraping engine sharing one connection pool across requests."""
+
+import asyncio
+import time
+from functools import partial
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import quote, urlencode
+
+from rich.console import Console
+
+from franken_stream.defaults import DEFAULT_PROVIDER_TIMEOUT
+from franken_stream.parsing import body_markup, make_soup
+from franken_stream.scraper import DUCKDUCKGO_URL, ContentScraper, ProviderResults
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+console = Console()
+
+# Connection pool limits
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_MAX_PER_HOST = 8
+
+# Timeout in seconds for detail page and DuckDuckGo fetches, as in ContentScraper
+PAGE_TIMEOUT = 10
+
+
+class AsyncContentScraper:
+    """
+    Scrapes streaming content on an asyncio event loop.
+
+    All requests share a single aiohttp connection pool, so hundreds of
+    requests can be in flight without a thread per request. Everything but
+    the network I/O comes from a ContentScraper: provider rules, learned
+    selectors, charset handling, the HTTP, search result and resolution
+    caches, the title index, provider health and mirror hedging behave
+    exactly as in blocking searches, and share their on-disk state. HTML
+    parsing runs off the event loop.
+
+    Use as an async context manager, or call close() when done.
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[ContentScraper] = None,
+        proxy: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+    ):
+        """
+        Initialize async scraper.
+
+        Args:
+            scraper: Configured scraper whose rules, caches, title index and
+                health store are used (default: a plain ContentScraper)
+            proxy: Optional proxy URL, used when no scraper is given
+            user_agent: Custom User-Agent header, used when no scraper is given
+            max_connections: Total connection pool size
+            max_per_host: Maximum simultaneous connections per host
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncContentScraper. "
+                "Install: pip install 'franken-stream[async]'"
+            )
+
+        self.scraper = scraper or ContentScraper(proxy=proxy, user_agent=user_agent)
+        self.proxy = self.scraper.proxy
+        self.user_agent = self.scraper.user_agent
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Background refreshes of cached providers, cancelled by close()
+        self._refreshes: Set["asyncio.Future"] = set()
+
+    async def __aenter__(self) -> "AsyncContentScraper":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Shared client session, created lazily on the running loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Cancel background refreshes and close the shared connection pool."""
+        for task in list(self._refreshes):
+            task.cancel()
+        self._refreshes.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get(self, url: str, timeout: float) -> Tuple[Union[str, bytes], bool]:
+        """
+        Fetch a URL through the scraper's HTTP response cache.
+
+        Fresh cache entries are served without a request and stale ones with
+        validators are revalidated, as CachingAdapter does for requests.
+
+        Returns:
+            Tuple of (body ready for scanning, whether it came from the cache)
+
+        Raises:
+            aiohttp.ClientError: On network or HTTP errors
+            asyncio.TimeoutError: If the request exceeds its timeout
+        """
+        cache = self.scraper.cache
+        entry = cache.get(url) if cache is not None else None
+        if entry is not None and entry.is_fresh:
+            return body_markup(entry.body, entry.content_type), True
+
+        headers = entry.validators if entry is not None and entry.can_revalidate else None
+        async with self.session.get(
+            url,
+            headers=headers,
+            proxy=self.proxy,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status == 304 and entry is not None:
+                cache.refresh(url, dict(response.headers))
+                return body_markup(entry.body, entry.content_type), True
+
+            response.raise_for_status()
+            body = await response.read()
+            if cache is not None and response.status == 200:
+                cache.store_response(url, dict(response.headers), body)
+            return body_markup(body, response.headers.get("Content-Type", "")), False
+
+    @staticmethod
+    async def _offload(function: Callable, *args):
+        """Run blocking work (parsing, ranking, index loading) off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(function, *args))
+
+    async def search(
+        self,
+        query: str,
+        base_urls: List[str],
+        verbose: bool = False,
+        provider_timeout: float = DEFAULT_PROVIDER_TIMEOUT,
+        overall_timeout: Optional[float] = None,
+        on_results: Optional[Callable[[ProviderResults], None]] = None,
+        refresh_cached: bool = True,
+        rank: bool = True,
+    ) -> List[Tuple[str, str]]:
+        """
+        Search for content across multiple providers concurrently.
+
+        Args:
+            query: Search query (e.g., "Inception")
+            base_urls: List of base URLs to search
+            verbose: Print detailed debug info
+            provider_timeout: Deadline in seconds for a single provider
+            overall_timeout: Deadline in seconds for the whole search (optional)
+            on_results: Callback invoked with each ProviderResults batch
+            refresh_cached: Re-query providers served from the search result
+                cache in the background
+            rank: Rank and deduplicate results across providers (see ranking.py)
+
+        Returns:
+            List of (title, url) tuples, as ContentScraper.search returns them
+        """
+        collected: Dict[str, List[Tuple[str, str]]] = {}
+        async for batch in self.iter_search(
+            query,
+            base_urls,
+            verbose=verbose,
+            provider_timeout=provider_timeout,
+            overall_timeout=overall_timeout,
+            refresh_cached=refresh_cached,
+        ):
+            collected[batch.provider] = batch.results
+            if on_results:
+                on_results(batch)
+        return await self._offload(
+            self.scraper._merge_results, query, base_urls, collected, rank
+        )
+
+    async def iter_search(
+        self,
+        query: str,
+        base_urls: List[str],
+        verbose: bool = False,
+        provider_timeout: float = DEFAULT_PROVIDER_TIMEOUT,
+        overall_timeout: Optional[float] = None,
+        refresh_cached: bool = True,
+    ) -> AsyncIterator[ProviderResults]:
+        """
+        Search providers and yield each provider's results as it finishes.
+
+        Follows ContentScraper.iter_search: cached and circuit-open batches
+        come first, then the title index batch (looked up while the live
+        queries are in flight), then live batches in completion order, with
+        mirror groups hedged. Live batches feed the health store, result
+        cache and title index.
+
+        Args:
+            query: Search query (e.g., "Inception")
+            base_urls: List of base URLs to search
+            verbose: Print detailed debug info
+            provider_timeout: Deadline in seconds for a single provider
+            overall_timeout: Deadline in seconds for the whole search (optional)
+            refresh_cached: Re-query cached providers in the background
+
+        Yields:
+            ProviderResults batches
+        """
+        scraper = self.scraper
+        encoded_query = quote(query.replace(" ", "+"))
+        deadline = time.monotonic() + overall_timeout if overall_timeout else None
+
+        early, cached_bases, units = scraper._plan_search(query, base_urls, verbose)
+        for batch in early:
+            yield batch
+        if cached_bases and refresh_cached:
+            self._refresh_in_background(query, cached_bases, provider_timeout)
+
+        timeout = provider_timeout
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+        pending = {
+            asyncio.ensure_future(self._search_unit(unit, encoded_query, timeout, verbose))
+            for unit in units
+        }
+
+        try:
+            if scraper.title_index is not None:
+                batch = await self._offload(scraper._search_index, query, base_urls, verbose)
+                if batch is not None:
+                    yield batch
+
+            while pending:
+                wait_for = None
+                if deadline is not None:
+                    wait_for = deadline - time.monotonic()
+                    if wait_for <= 0:
+                        if verbose:
+                            console.log(
+                                f"[yellow]⚠ Search deadline reached, "
+                                f"abandoning {len(pending)} provider(s)"
+                            )
+                        break
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    for batch in task.result():
+                        scraper._record_batch(query, batch, verbose)
+                        yield batch
+        finally:
+            for task in pending:
+                task.cancel()
+            if scraper.title_index is not None:
+                scraper.title_index.save_later()
+
+    def _refresh_in_background(
+        self, query: str, base_urls: List[str], provider_timeout: float
+    ) -> None:
+        """
+        Re-query providers whose results were served from the search cache.
+
+        Runs quietly as tasks on the running loop and only updates the
+        cache, so the caller keeps rendering cached results.
+        """
+        scraper = self.scraper
+        encoded_query = quote(query.replace(" ", "+"))
+
+        async def refresh(base_url: str) -> None:
+            try:
+                items, _ = await self._search_provider(
+                    base_url, encoded_query, provider_timeout, quiet=True
+                )
+            except Exception:
+                return
+            scraper.result_cache.store(base_url, query, items)
+            if scraper.title_index is not None:
+                scraper.title_index.add(base_url, items)
+                scraper.title_index.save_later()
+
+        for base_url in base_urls:
+            task = asyncio.ensure_future(refresh(base_url))
+            self._refreshes.add(task)
+            task.add_done_callback(self._refreshes.discard)
+
+    async def _search_unit(
+        self, unit: List[str], encoded_query: str, timeout: float, verbose: bool
+    ) -> List[ProviderResults]:
+        """Search a single provider, or a mirror group with hedging."""
+        if timeout <= 0:
+            return [
+                ProviderResults(base_url, [], 0.0, "search deadline exceeded") for base_url in unit
+            ]
+        if len(unit) > 1:
+            return await self._search_hedged(unit, encoded_query, timeout, verbose)
+
+        base_url = unit[0]
+        start = time.monotonic()
+        try:
+            items, from_cache = await asyncio.wait_for(
+                self._search_provider(base_url, encoded_query, timeout, verbose), timeout
+            )
+        except Exception as e:
+            self._log_search_error(base_url, e, verbose)
+            return [
+                ProviderResults(base_url, [], time.monotonic() - start, self._describe_error(e))
+            ]
+        return [ProviderResults(base_url, items, time.monotonic() - start, cached=from_cache)]
+
+    async def _search_hedged(
+        self, mirrors: List[str], encoded_query: str, timeout: float, verbose: bool
+    ) -> List[ProviderResults]:
+        """
+        Query a mirror group, starting the next mirror only when needed.
+
+        Same policy as ContentScraper._search_hedged: the next mirror starts
+        when the running ones have been silent for the hedge delay, or at
+        once when one fails, and the first successful answer wins.
+
+        Returns:
+            Error batches for mirrors that failed, then the winning batch
+            (if any mirror answered within the timeout)
+        """
+        batches: List[ProviderResults] = []
+        started: Dict["asyncio.Future", Tuple[str, float]] = {}
+        waiting = list(mirrors)
+        pending: Set["asyncio.Future"] = set()
+        deadline = time.monotonic() + timeout
+        next_hedge = 0.0
+
+        try:
+            while waiting or pending:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+
+                if waiting and (not pending or now >= next_hedge):
+                    base_url = waiting.pop(0)
+                    if verbose and pending:
+                        console.log(f"[cyan]  Hedging with mirror {base_url}")
+                    task = asyncio.ensure_future(
+                        self._search_provider(base_url, encoded_query, deadline - now, verbose)
+                    )
+                    started[task] = (base_url, now)
+                    pending.add(task)
+                    next_hedge = now + self.scraper._hedge_delay(base_url)
+                    continue
+
+                wait_until = min(deadline, next_hedge) if waiting else deadline
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, wait_until - now),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                winner = None
+                for task in done:
+                    base_url, start = started[task]
+                    elapsed = time.monotonic() - start
+                    try:
+                        items, from_cache = task.result()
+                    except Exception as e:
+                        self._log_search_error(base_url, e, verbose)
+                        batches.append(
+                            ProviderResults(base_url, [], elapsed, self._describe_error(e))
+                        )
+                        next_hedge = 0.0  # replace a failed mirror right away
+                    else:
+                        if winner is None:
+                            winner = ProviderResults(
+                                base_url, items, elapsed, cached=from_cache
+                            )
+                if winner is not None:
+                    batches.append(winner)
+                    return batches
+
+            for task in pending:
+                base_url, start = started[task]
+                if verbose:
+                    console.log(f"[yellow]⚠ Timeout searching {base_url}")
+                batches.append(
+                    ProviderResults(
+                        base_url, [], time.monotonic() - start, "provider deadline exceeded"
+                    )
+                )
+            return batches
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _search_provider(
+        self,
+        base_url: str,
+        encoded_query: str,
+        timeout: float,
+        verbose: bool = False,
+        quiet: bool = False,
+    ) -> Tuple[List[Tuple[str, str]], bool]:
+        """
+        Query a single provider and extract its results.
+
+        Returns:
+            Tuple of ((title, url) list, whether the page came from the HTTP cache)
+
+        Raises:
+            aiohttp.ClientError: On network or HTTP errors
+            asyncio.TimeoutError: If the request exceeds its timeout
+        """
+        full_url = f"{base_url}{encoded_query}"
+        if verbose:
+            console.log(f"[cyan]→ Searching: {full_url}")
+        elif not quiet:
+            console.log(f"Searching: {full_url[:60]}...")
+
+        markup, from_cache = await self._get(full_url, timeout)
+        items = await self._offload(
+            self.scraper._extract_provider_results, base_url, markup, verbose
+        )
+        return items, from_cache
+
+    @staticmethod
+    def _describe_error(error: Exception) -> str:
+        """Error message for a failed provider batch."""
+        if isinstance(error, asyncio.TimeoutError):
+            return "provider deadline exceeded"
+        return str(error) or type(error).__name__
+
+    @staticmethod
+    def _log_search_error(base_url: str, error: Exception, verbose: bool = False) -> None:
+        """Report a failed provider search without aborting the whole search."""
+        if not verbose:
+            # Silently skip failing providers
+            return
+
+        if isinstance(error, asyncio.TimeoutError):
+            console.log(f"[yellow]⚠ Timeout searching {base_url}")
+        elif isinstance(error, aiohttp.ClientResponseError):
+            console.log(f"[yellow]⚠ HTTP error {error.status} for {base_url}")
+        elif isinstance(error, aiohttp.ClientConnectionError):
+            console.log(f"[yellow]⚠ Connection failed for {base_url}: {error}")
+        elif isinstance(error, aiohttp.ClientError):
+            console.log(f"[yellow]⚠[/yellow] Error searching {base_url}: {error}")
+        else:
+            console.log(f"[red]✗[/red] Parsing error: {error}")
+
+    async def fetch_embed_from_page(
+        self, page_url: str, base_url: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Fetch a page and extract embedded video URL with multiple strategies.
+
+        Known embeds (resolution cache, provider URL templates) are returned
+        without a request, and extracted ones are cached, as in
+        ContentScraper.fetch_embed_from_page.
+
+        Args:
+            page_url: URL of the movie/show page
+            base_url: Base URL for constructing full URLs from relative paths
+
+        Returns:
+            Embed URL if found, None otherwise
+        """
+        try:
+            page_url = ContentScraper._resolve_page_url(page_url, base_url)
+            if page_url is None:
+                return None
+
+            known = self.scraper.known_embed(page_url)
+            if known:
+                return known
+
+            console.log(f"[cyan]→ Fetching embed from: {page_url[:60]}...")
+            markup, _ = await self._get(page_url, timeout=PAGE_TIMEOUT)
+            return await self._offload(self.scraper.embed_from_content, page_url, markup)
+
+        except asyncio.TimeoutError:
+            console.log(f"[yellow]⚠ Timeout fetching {page_url}")
+            return None
+        except aiohttp.ClientResponseError as e:
+            if e.status in [403, 404]:
+                console.log(f"[yellow]⚠ Access denied/not found: {e.status}")
+            else:
+                console.log(f"[yellow]⚠ HTTP error: {e.status}")
+            return None
+        except Exception as e:
+            console.log(f"[yellow]⚠ Could not fetch embed: {e}")
+            return None
+
+    async def search_duckduckgo(self, query: str) -> List[Tuple[str, str]]:
+        """
+        Fallback search using DuckDuckGo for free streaming links.
+
+        Args:
+            query: Search query
+
+        Returns:
+            List of (title, url) tuples from DDG results
+        """
+        try:
+            console.log(f"Searching DuckDuckGo for '{query}'...")
+            params = urlencode(ContentScraper._duckduckgo_params(query))
+            markup, _ = await self._get(f"{DUCKDUCKGO_URL}?{params}", timeout=PAGE_TIMEOUT)
+            soup = await self._offload(make_soup, markup)
+            return ContentScraper._extract_duckduckgo(soup)
+
+        except Exception as e:
+            console.log(f"[yellow]⚠[/yellow] DuckDuckGo search failed: {e}")
+            return []
@@ -0,0 +1,630 @@
+"""Persistent on-disk caches backed by SQLite."""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlparse
+
+from rich.console import Console
+
+console = Console()
+
+# Shared cache database under the config directory
+DEFAULT_CACHE_PATH = Path.home() / ".franken-stream" / "cache.db"
+
+# HTTP cache defaults: 1 hour TTL, 50 MB byte budget
+DEFAULT_HTTP_TTL = 3600
+DEFAULT_HTTP_MAX_BYTES = 50 * 1024 * 1024
+
+# Headers describing the transfer encoding, which no longer apply to a stored body
+FRAMING_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+
+# Search result cache defaults: 6 hour TTL, 5000 (provider, query) entries
+DEFAULT_SEARCH_TTL = 6 * 3600
+DEFAULT_SEARCH_MAX_ENTRIES = 5000
+
+# Resolution cache defaults when a URL carries no expiry hint
+DEFAULT_EMBED_TTL = 24 * 3600
+DEFAULT_STREAM_TTL = 1800
+# Treat signed URLs as expired this many seconds before their deadline
+EXPIRY_MARGIN = 60
+
+# Query parameters that carry a unix expiry timestamp in signed stream URLs
+EXPIRY_PARAMS = ("expire", "expires", "expiry", "exp", "e", "validto", "valid_to", "deadline")
+
+# Per-URL TTLs: first rule whose substring appears in the URL wins.
+# Search pages change often; detail pages are stable for much longer.
+DEFAULT_TTL_RULES: List[Tuple[str, int]] = [
+    ("/search", 1800),
+    ("?q=", 1800),
+    ("keyword=", 1800),
+    ("duckduckgo.com", 1800),
+    ("/watch/", 21600),
+    ("/movie/", 21600),
+    ("/title/", 21600),
+    ("/tv/", 21600),
+]
+
+
+class _SQLiteStore:
+    """
+    Thread-safe wrapper around a single SQLite connection.
+
+    Subclasses define SCHEMA. Database errors never propagate to callers: a
+    broken or read-only cache behaves like an empty one.
+    """
+
+    SCHEMA = ""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Database file (default: ~/.franken-stream/cache.db)
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self.SCHEMA)
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            console.log(f"[yellow]⚠[/yellow] Cache disabled ({self.path}): {e}")
+            self._conn = None
+
+    def _execute(self, sql: str, params: Union[tuple, Dict[str, Any]] = ()) -> List[tuple]:
+        """Run a statement and return all rows, or [] if the cache is unusable."""
+        if self._conn is None:
+            return []
+        with self._lock:
+            try:
+                rows = self._conn.execute(sql, params).fetchall()
+                self._conn.commit()
+                return rows
+            except sqlite3.Error as e:
+                console.log(f"[yellow]⚠[/yellow] Cache error: {e}")
+                return []
+
+    def _update(self, sql: str, params: Union[tuple, Dict[str, Any]] = ()) -> int:
+        """Run a data-changing statement and return how many rows it changed."""
+        if self._conn is None:
+            return 0
+        with self._lock:
+            try:
+                changed = self._conn.execute(sql, params).rowcount
+                self._conn.commit()
+                return changed
+            except sqlite3.Error as e:
+                console.log(f"[yellow]⚠[/yellow] Cache error: {e}")
+                return 0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CachedResponse(NamedTuple):
+    """A stored HTTP response."""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @property
+    def content_type(self) -> str:
+        return _lower_keys(self.headers).get("content-type", "")
+
+
+class ResponseCache(_SQLiteStore):
+    """
+    On-disk HTTP response cache with per-URL TTLs and LRU eviction.
+
+    Fresh entries are served without touching the network. Stale entries
+    carrying an ETag or Last-Modified header are revalidated with a
+    conditional request, so an unchanged page costs a 304 round trip instead
+    of a full download. The total body size is kept under a byte budget by
+    evicting the least recently used entries.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS http_cache (
+        url TEXT PRIMARY KEY,
+        status INTEGER NOT NULL,
+        headers TEXT NOT NULL,
+        body BLOB NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        stored_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        last_access REAL NOT NULL,
+        size INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS http_cache_last_access ON http_cache (last_access);
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        default_ttl: int = DEFAULT_HTTP_TTL,
+        max_bytes: int = DEFAULT_HTTP_MAX_BYTES,
+        ttl_rules: Optional[List[Tuple[str, int]]] = None,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: Database file (default: ~/.franken-stream/cache.db)
+            default_ttl: TTL in seconds for URLs not matched by a rule
+            max_bytes: Byte budget for stored bodies
+            ttl_rules: (url substring, ttl seconds) pairs, first match wins
+        """
+        super().__init__(path)
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.ttl_rules = DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules
+
+    def ttl_for(self, url: str) -> int:
+        """Return the TTL in seconds for a URL."""
+        for fragment, ttl in self.ttl_rules:
+            if fragment in url:
+                return ttl
+        return self.default_ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Look up a URL, marking it as recently used. Stale entries are returned too."""
+        rows = self._execute(
+            "SELECT status, headers, body, etag, last_modified, expires_at "
+            "FROM http_cache WHERE url = ?",
+            (url,),
+        )
+        if not rows:
+            return None
+
+        self._execute("UPDATE http_cache SET last_access = ? WHERE url = ?", (time.time(), url))
+        status, headers, body, etag, last_modified, expires_at = rows[0]
+        return CachedResponse(
+            url, status, json.loads(headers), bytes(body), etag, last_modified, expires_at
+        )
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        """Store a response body and its validators, then enforce the byte budget."""
+        if len(body) > self.max_bytes:
+            return
+
+        now = time.time()
+        validators = _lower_keys(headers)
+        self._execute(
+            "INSERT OR REPLACE INTO http_cache "
+            "(url, status, headers, body, etag, last_modified, stored_at, expires_at, "
+            "last_access, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                url,
+                status,
+                json.dumps(headers),
+                sqlite3.Binary(body),
+                validators.get("etag"),
+                validators.get("last-modified"),
+                now,
+                now + self.ttl_for(url),
+                now,
+                len(body),
+            ),
+        )
+        self.evict()
+
+    def store_response(self, url: str, headers: Dict[str, str], body: bytes) -> bool:
+        """
+        Store a complete 200 response unless the server asked us not to.
+
+        The body is stored already decoded, so transfer framing headers are
+        dropped.
+
+        Returns:
+            True if the response was stored
+        """
+        if "no-store" in _lower_keys(headers).get("cache-control", "").lower():
+            return False
+        kept = {
+            name: value for name, value in headers.items() if name.lower() not in FRAMING_HEADERS
+        }
+        self.store(url, 200, kept, body)
+        return True
+
+    def refresh(self, url: str, headers: Optional[Dict[str, str]] = None) -> None:
+        """Extend an entry's lifetime after a successful 304 revalidation."""
+        now = time.time()
+        validators = _lower_keys(headers or {})
+        self._execute(
+            "UPDATE http_cache SET expires_at = ?, last_access = ?, "
+            "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+            "WHERE url = ?",
+            (
+                now + self.ttl_for(url),
+                now,
+                validators.get("etag"),
+                validators.get("last-modified"),
+                url,
+            ),
+        )
+
+    def evict(self) -> int:
+        """
+        Drop least recently used entries until the byte budget is met.
+
+        Returns:
+            Number of entries removed
+        """
+        rows = self._execute("SELECT COALESCE(SUM(size), 0) FROM http_cache")
+        total = rows[0][0] if rows else 0
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for url, size in self._execute("SELECT url, size FROM http_cache ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            self._execute("DELETE FROM http_cache WHERE url = ?", (url,))
+            total -= size
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count and stored bytes."""
+        rows = self._execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache")
+        count, size = rows[0] if rows else (0, 0)
+        return {"entries": count, "bytes": size, "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self._execute("DELETE FROM http_cache")
+
+
+def _lower_keys(headers: Dict[str, str]) -> Dict[str, str]:
+    """Header mapping with lowercased names, for case-insensitive lookups."""
+    return {name.lower(): value for name, value in headers.items()}
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query for use as a cache key.
+
+    Case, accents, punctuation and repeated whitespace are ignored, so
+    "Inception", " inception " and "INCEPTION!" share one entry.
+    """
+    text = unicodedata.normalize("NFKD", query)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return " ".join(text.split())
+
+
+class SearchCache(_SQLiteStore):
+    """
+    Cache of extracted (title, url) results per provider and normalized query.
+
+    Lookups hit a composite primary key, so a repeated search renders from
+    disk in milliseconds. Entries expire after a TTL and the table is capped
+    at a maximum number of entries, evicting the least recently used first.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS search_cache (
+        provider TEXT NOT NULL,
+        query TEXT NOT NULL,
+        results TEXT NOT NULL,
+        stored_at REAL NOT NULL,
+        last_access REAL NOT NULL,
+        PRIMARY KEY (provider, query)
+    );
+    CREATE INDEX IF NOT EXISTS search_cache_last_access ON search_cache (last_access);
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: int = DEFAULT_SEARCH_TTL,
+        max_entries: int = DEFAULT_SEARCH_MAX_ENTRIES,
+    ):
+        """
+        Initialize the search result cache.
+
+        Args:
+            path: Database file (default: ~/.franken-stream/cache.db)
+            ttl: Seconds before a stored result list expires
+            max_entries: Maximum number of (provider, query) entries kept
+        """
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get(self, provider: str, query: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Return cached results for a provider and query, if still fresh.
+
+        Args:
+            provider: Provider search base URL
+            query: Raw search query (normalized internally)
+
+        Returns:
+            List of (title, url) tuples, or None on a miss
+        """
+        key = normalize_query(query)
+        rows = self._execute(
+            "SELECT results FROM search_cache WHERE provider = ? AND query = ? AND stored_at > ? "
+            "AND results != '[]'",
+            (provider, key, time.time() - self.ttl),
+        )
+        if not rows:
+            return None
+
+        self._execute(
+            "UPDATE search_cache SET last_access = ? WHERE provider = ? AND query = ?",
+            (time.time(), provider, key),
+        )
+        return [tuple(item) for item in json.loads(rows[0][0])]
+
+    def store(self, provider: str, query: str, results: List[Tuple[str, str]]) -> None:
+        """
+        Store a provider's results for a query, then enforce the size cap.
+
+        Empty result lists are not stored: they usually mean a blocked or
+        temporarily broken page, and caching them would hide the provider
+        for the whole TTL.
+        """
+        if not results:
+            return
+
+        now = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO search_cache "
+            "(provider, query, results, stored_at, last_access) VALUES (?, ?, ?, ?, ?)",
+            (provider, normalize_query(query), json.dumps(results), now, now),
+        )
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired entries, then least recently used ones above the cap.
+
+        Returns:
+            Number of entries removed
+        """
+        before = self._count()
+        self._execute("DELETE FROM search_cache WHERE stored_at <= ?", (time.time() - self.ttl,))
+        self._execute(
+            "DELETE FROM search_cache WHERE rowid IN ("
+            "SELECT rowid FROM search_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        return before - self._count()
+
+    def _count(self) -> int:
+        rows = self._execute("SELECT COUNT(*) FROM search_cache")
+        return rows[0][0] if rows else 0
+
+    def clear(self) -> None:
+        """Remove every cached result list."""
+        self._execute("DELETE FROM search_cache")
+
+
+def url_expiry(url: str) -> Optional[float]:
+    """
+    Extract the expiry time hinted at by a signed URL.
+
+    Understands unix timestamps in common query parameters (``expire``,
+    ``expires``, ``exp``...), ``/expire/<ts>/`` path segments, and AWS
+    ``X-Amz-Date`` + ``X-Amz-Expires`` pairs.
+
+    Args:
+        url: Stream or embed URL
+
+    Returns:
+        Expiry as a unix timestamp, or None if the URL carries no hint
+    """
+    parsed = urlparse(url)
+    params = {key.lower(): value for key, value in parse_qsl(parsed.query)}
+
+    amz_date = params.get("x-amz-date")
+    amz_expires = params.get("x-amz-expires")
+    if amz_date and amz_expires and amz_expires.isdigit():
+        try:
+            signed_at = datetime.strptime(amz_date, "%Y%m%dT%H%M%SZ")
+            return signed_at.replace(tzinfo=timezone.utc).timestamp() + int(amz_expires)
+        except ValueError:
+            pass
+
+    candidates = [params[name] for name in EXPIRY_PARAMS if name in params]
+    path_match = re.search(r"/expires?/(\d{9,13})(?:/|$)", parsed.path)
+    if path_match:
+        candidates.append(path_match.group(1))
+
+    for value in candidates:
+        if not value.isdigit():
+            continue
+        timestamp = int(value)
+        if timestamp > 10 ** 12:
+            timestamp //= 1000  # milliseconds
+        # Ignore values that are clearly not timestamps (e.g. "e=1")
+        if timestamp > 10 ** 9:
+            return float(timestamp)
+    return None
+
+
+class ResolutionCache(_SQLiteStore):
+    """
+    Cache of detail page → embed URL → direct stream URL resolutions.
+
+    Signed URLs expire at the deadline they carry (minus a safety margin);
+    URLs without an expiry hint fall back to a configurable TTL per kind.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS resolution_cache (
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        stored_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (kind, key)
+    );
+    CREATE INDEX IF NOT EXISTS resolution_cache_expires_at ON resolution_cache (expires_at);
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        embed_ttl: int = DEFAULT_EMBED_TTL,
+        stream_ttl: int = DEFAULT_STREAM_TTL,
+    ):
+        """
+        Initialize the resolution cache.
+
+        Args:
+            path: Database file (default: ~/.franken-stream/cache.db)
+            embed_ttl: Seconds to keep page → embed mappings without an expiry hint
+            stream_ttl: Seconds to keep embed → stream mappings without an expiry hint
+        """
+        super().__init__(path)
+        self.embed_ttl = embed_ttl
+        self.stream_ttl = stream_ttl
+
+    def get_embed(self, page_url: str) -> Optional[str]:
+        """Return the cached embed URL for a detail page."""
+        return self._get("embed", page_url)
+
+    def set_embed(self, page_url: str, embed_url: str) -> None:
+        """Remember the embed URL extracted from a detail page."""
+        self._set("embed", page_url, embed_url, self.embed_ttl)
+
+    def get_stream(self, embed_url: str) -> Optional[str]:
+        """Return the cached direct stream URL for an embed."""
+        return self._get("stream", embed_url)
+
+    def set_stream(self, embed_url: str, stream_url: str) -> None:
+        """Remember the direct stream URL resolved from an embed."""
+        self._set("stream", embed_url, stream_url, self.stream_ttl)
+
+    def _get(self, kind: str, key: str) -> Optional[str]:
+        rows = self._execute(
+            "SELECT value FROM resolution_cache WHERE kind = ? AND key = ? AND expires_at > ?",
+            (kind, key, time.time()),
+        )
+        return rows[0][0] if rows else None
+
+    def _set(self, kind: str, key: str, value: str, ttl: int) -> None:
+        now = time.time()
+        expires_at = now + ttl
+        hinted = url_expiry(value)
+        if hinted is not None:
+            expires_at = hinted - EXPIRY_MARGIN
+        if expires_at <= now:
+            return
+
+        self._execute(
+            "INSERT OR REPLACE INTO resolution_cache "
+            "(kind, key, value, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+            (kind, key, value, now, expires_at),
+        )
+        self._execute("DELETE FROM resolution_cache WHERE expires_at <= ?", (now,))
+
+    def clear(self) -> None:
+        """Remove every cached resolution."""
+        self._execute("DELETE FROM resolution_cache")
+
+
+class SelectorProfile(_SQLiteStore):
+    """
+    Per-host record of which result selector produced accepted results.
+
+    The scraper tries a host's most recently successful selector first and
+    skips the rest of the fallback list; hit counts are kept per selector.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS selector_profile (
+        host TEXT NOT NULL,
+        selector TEXT NOT NULL,
+        hits INTEGER NOT NULL,
+        last_used REAL NOT NULL,
+        PRIMARY KEY (host, selector)
+    );
+    """
+
+    def preferred(self, host: str) -> Optional[str]:
+        """Return the selector that most recently produced results for a host."""
+        rows = self._execute(
+            "SELECT selector FROM selector_profile WHERE host = ? "
+            "ORDER BY last_used DESC LIMIT 1",
+            (host,),
+        )
+        return rows[0][0] if rows else None
+
+    def record(self, host: str, selector: str) -> None:
+        """Count a successful extraction with a selector for a host."""
+        self._execute(
+            "INSERT INTO selector_profile (host, selector, hits, last_used) VALUES (?, ?, 1, ?) "
+            "ON CONFLICT (host, selector) DO UPDATE SET "
+            "hits = hits + 1, last_used = excluded.last_used",
+            (host, selector, time.time()),
+        )
+
+    def forget(self, host: str, selector: str) -> None:
+        """Drop a selector that stopped matching a host's pages."""
+        self._execute(
+            "DELETE FROM selector_profile WHERE host = ? AND selector = ?", (host, selector)
+        )
+
+    def hits(self, host: str) -> Dict[str, int]:
+        """
+        Return the recorded hit count per selector for a host.
+
+        Args:
+            host: Provider host (e.g. myflixerz.to)
+
+        Returns:
+            Mapping of selector to successful extractions, most used first
+        """
+        rows = self._execute(
+            "SELECT selector, hits FROM selector_profile WHERE host = ? ORDER BY hits DESC",
+            (host,),
+        )
+        return {selector: count for selector, count in rows}
+
+    def clear(self) -> None:
+        """Forget every learned selector."""
+        self._execute("DELETE FROM selector_profile")
@@ -0,0 +1,14 @@
+"""Search defaults shared by the CLI options and the scrapers.
+
+Kept free of imports so the CLI can declare its options without loading
+the scraper stack.
+"""
+
+# Concurrent search defaults
+DEFAULT_MAX_WORKERS = 6
+DEFAULT_PROVIDER_TIMEOUT = 10
+
+# Connection pool sizing: hosts kept in the pool, and keep-alive
+# connections per host (concurrent search, prefetch and playback share them)
+DEFAULT_POOL_HOSTS = 32
+DEFAULT_POOL_PER_HOST = 8
@@ -0,0 +1,225 @@
+"""Persistent provider health scoreboard with circuit breaking."""
+
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from franken_stream.cache import _SQLiteStore
+
+# Weight of the newest sample in the moving averages
+DEFAULT_ALPHA = 0.3
+
+# Consecutive failures that open a provider's circuit
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Seconds an open circuit waits before a half-open retry; doubles after
+# every failed retry up to DEFAULT_MAX_COOLDOWN
+DEFAULT_COOLDOWN = 300
+DEFAULT_MAX_COOLDOWN = 6 * 3600
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class HealthRecord(NamedTuple):
+    """Health of one search base."""
+
+    provider: str
+    success_rate: float  # EWMA of 1.0 (success) / 0.0 (failure)
+    latency: Optional[float]  # EWMA of successful response times, in seconds
+    samples: int
+    failures: int  # consecutive failures
+    trips: int  # times the circuit opened without a successful retry since
+    opened_at: Optional[float]
+    state: str
+
+
+class ProviderHealth(_SQLiteStore):
+    """
+    Success-rate and latency moving averages per search base, fed by real
+    search traffic.
+
+    A provider that fails DEFAULT_FAILURE_THRESHOLD times in a row has its
+    circuit opened and is skipped. Once the cooldown passes, one search may
+    retry it (half-open): success closes the circuit, failure reopens it
+    with a doubled cooldown.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS provider_health (
+        provider TEXT PRIMARY KEY,
+        success_rate REAL NOT NULL,
+        latency REAL,
+        samples INTEGER NOT NULL,
+        failures INTEGER NOT NULL,
+        trips INTEGER NOT NULL,
+        opened_at REAL,
+        updated_at REAL NOT NULL
+    );
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        alpha: float = DEFAULT_ALPHA,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        max_cooldown: float = DEFAULT_MAX_COOLDOWN,
+    ):
+        """
+        Initialize the health store.
+
+        Args:
+            path: Database file (default: ~/.franken-stream/cache.db)
+            alpha: Weight of the newest sample in the moving averages
+            failure_threshold: Consecutive failures before the circuit opens
+            cooldown: Seconds before the first half-open retry
+            max_cooldown: Upper bound for the doubling cooldown
+        """
+        super().__init__(path)
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+    def get(self, provider: str) -> Optional[HealthRecord]:
+        """Return a provider's health, or None if it has never been seen."""
+        rows = self._execute(
+            "SELECT provider, success_rate, latency, samples, failures, trips, opened_at "
+            "FROM provider_health WHERE provider = ?",
+            (provider,),
+        )
+        return self._to_record(rows[0]) if rows else None
+
+    def records(self) -> List[HealthRecord]:
+        """Return every known provider, healthiest first."""
+        rows = self._execute(
+            "SELECT provider, success_rate, latency, samples, failures, trips, opened_at "
+            "FROM provider_health"
+        )
+        return sorted((self._to_record(row) for row in rows), key=self._rank_key)
+
+    def _to_record(self, row: tuple) -> HealthRecord:
+        provider, success_rate, latency, samples, failures, trips, opened_at = row
+        return HealthRecord(
+            provider,
+            success_rate,
+            latency,
+            samples,
+            failures,
+            trips,
+            opened_at,
+            self._state(opened_at, trips),
+        )
+
+    def _cooldown_for(self, trips: int) -> float:
+        return min(self.cooldown * 2 ** max(trips - 1, 0), self.max_cooldown)
+
+    def _state(self, opened_at: Optional[float], trips: int) -> str:
+        if opened_at is None:
+            return CLOSED
+        if time.time() - opened_at < self._cooldown_for(trips):
+            return OPEN
+        return HALF_OPEN
+
+    def allow(self, provider: str) -> bool:
+        """
+        Decide whether a search may query a provider.
+
+        Granting a half-open retry restarts the cooldown, so only one search
+        probes a recovering provider at a time, even across processes.
+
+        Returns:
+            False while the provider's circuit is open
+        """
+        record = self.get(provider)
+        if record is None or record.state == CLOSED:
+            return True
+        if record.state == OPEN:
+            return False
+
+        # Only the caller whose update still sees the old opening time wins
+        granted = self._update(
+            "UPDATE provider_health SET opened_at = ? WHERE provider = ? AND opened_at = ?",
+            (time.time(), provider, record.opened_at),
+        )
+        return granted == 1
+
+    # Updates are single upserts computed from the stored row, so concurrent
+    # searches (threads or processes sharing the database) never lose samples.
+
+    def record_success(self, provider: str, latency: float) -> None:
+        """Fold a successful search into the averages and close the circuit."""
+        self._execute(
+            "INSERT INTO provider_health "
+            "(provider, success_rate, latency, samples, failures, trips, opened_at, updated_at) "
+            "VALUES (:provider, 1.0, :latency, 1, 0, 0, NULL, :now) "
+            "ON CONFLICT (provider) DO UPDATE SET "
+            "success_rate = :alpha + (1 - :alpha) * success_rate, "
+            "latency = CASE WHEN latency IS NULL THEN :latency "
+            "ELSE :alpha * :latency + (1 - :alpha) * latency END, "
+            "samples = samples + 1, failures = 0, trips = 0, opened_at = NULL, "
+            "updated_at = :now",
+            {"provider": provider, "latency": latency, "alpha": self.alpha, "now": time.time()},
+        )
+
+    def record_failure(self, provider: str) -> None:
+        """Fold a failed search into the averages, opening the circuit if needed."""
+        # Reaching the threshold trips the circuit (or re-trips it after a
+        # failed half-open retry)
+        self._execute(
+            "INSERT INTO provider_health "
+            "(provider, success_rate, latency, samples, failures, trips, opened_at, updated_at) "
+            "VALUES (:provider, 0.0, NULL, 1, 1, "
+            "CASE WHEN 1 >= :threshold THEN 1 ELSE 0 END, "
+            "CASE WHEN 1 >= :threshold THEN :now END, :now) "
+            "ON CONFLICT (provider) DO UPDATE SET "
+            "success_rate = (1 - :alpha) * success_rate, "
+            "samples = samples + 1, "
+            "failures = failures + 1, "
+            "trips = CASE WHEN failures + 1 >= :threshold THEN trips + 1 ELSE trips END, "
+            "opened_at = CASE WHEN failures + 1 >= :threshold THEN :now ELSE opened_at END, "
+            "updated_at = :now",
+            {
+                "provider": provider,
+                "alpha": self.alpha,
+                "threshold": self.failure_threshold,
+                "now": time.time(),
+            },
+        )
+
+    @staticmethod
+    def _rank_key(record: HealthRecord) -> tuple:
+        # Most reliable first, then fastest
+        latency = record.latency if record.latency is not None else float("inf")
+        return (-round(record.success_rate, 2), latency)
+
+    def rank(self, providers: List[str]) -> List[str]:
+        """
+        Order providers healthiest first.
+
+        Providers without history keep their configured position relative to
+        each other and go ahead of known ones, so they get measured.
+
+        Args:
+            providers: Search base URLs in configured order
+
+        Returns:
+            The same providers, reordered
+        """
+        known: Dict[str, HealthRecord] = {record.provider: record for record in self.records()}
+        unknown = [provider for provider in providers if provider not in known]
+        measured = sorted(
+            (provider for provider in providers if provider in known),
+            key=lambda provider: self._rank_key(known[provider]),
+        )
+        return unknown + measured
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        """Forget the history of one provider, or of all of them."""
+        if provider is None:
+            self._execute("DELETE FROM provider_health")
+        else:
+            self._execute("DELETE FROM provider_health WHERE provider = ?", (provider,))
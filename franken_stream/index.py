@@ -0,0 +1,411 @@
+"""Local inverted index of every title seen in search results."""
+
+import atexit
+import gzip
+import heapq
+import json
+import math
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin
+
+from rich.console import Console
+
+from franken_stream.ranking import normalize, rank_results
+
+console = Console()
+
+# Provider name of the batch of index hits yielded before live results
+INDEX_PROVIDER = "local-index"
+
+# Index file under the config directory
+DEFAULT_INDEX_PATH = Path.home() / ".franken-stream" / "title-index.gz"
+
+# Titles kept in the index; the least recently seen are evicted beyond this
+DEFAULT_INDEX_MAX_TITLES = 50000
+
+# Share of the query's trigrams a title must contain to match
+MIN_TERM_SHARE = 0.6
+
+# Candidates ranked per wanted result
+CANDIDATE_FACTOR = 3
+
+# Posting entries a query counts through to pre-filter candidates: at
+# least POSTING_BUDGET, or COUNT_FACTOR times the entries it must read anyway
+POSTING_BUDGET = 4000
+COUNT_FACTOR = 4
+
+# Seconds save_later() waits, so a burst of searches is written once
+SAVE_DELAY = 2.0
+
+# Last-seen stamps only matter for eviction; seeing a title again marks the
+# index for saving once its stored stamp is older than this
+SEEN_AT_RESOLUTION = 86400
+
+# File layout: magic, header length, JSON header, then little-endian uint32
+# postings for every word and then every trigram, in header order
+INDEX_MAGIC = b"FSIX1\n"
+_POSTING_TYPE = "I" if array("I").itemsize == 4 else "L"
+
+
+class TitleIndex:
+    """
+    In-memory inverted index from title words and trigrams to
+    (provider, title, url), persisted as one compact gzip file.
+
+    Fed incrementally with every provider's live results, it answers
+    searches offline. Word postings find exact tokens; trigram postings
+    find prefixes (type-ahead), typos and spacing variants. A query only
+    reads the postings of its rarest trigrams: a title sharing
+    MIN_TERM_SHARE of the query's trigrams must contain one of them.
+    """
+
+    def __init__(
+        self, path: Optional[Path] = None, max_titles: int = DEFAULT_INDEX_MAX_TITLES
+    ):
+        """
+        Initialize the index (the file is read on first use).
+
+        Args:
+            path: Index file (default: ~/.franken-stream/title-index.gz)
+            max_titles: Maximum number of indexed titles
+        """
+        self.path = Path(path) if path else DEFAULT_INDEX_PATH
+        self.max_titles = max_titles
+        self._lock = threading.RLock()
+        # Held from serializing to replacing the file, so saves never interleave
+        self._write_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._exit_hooked = False
+        self._loaded = False
+        self._dirty = False
+        self._providers: List[str] = []
+        self._provider_ids: Dict[str, int] = {}
+        # Title id -> (provider id, title, url, last seen, normalized key),
+        # None once evicted
+        self._titles: List[Optional[Tuple[int, str, str, float, str]]] = []
+        self._ids: Dict[Tuple[int, str], int] = {}
+        self._words: Dict[str, array] = {}
+        self._grams: Dict[str, array] = {}
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with gzip.open(self.path, "rb") as f:
+                data = f.read()
+            if not data.startswith(INDEX_MAGIC):
+                raise ValueError("not a title index")
+            offset = len(INDEX_MAGIC)
+            (header_size,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            header = json.loads(data[offset:offset + header_size])
+            postings = array(_POSTING_TYPE)
+            postings.frombytes(data[offset + header_size:])
+            if sys.byteorder == "big":
+                postings.byteswap()
+
+            providers = header["providers"]
+            titles = [tuple(entry) for entry in header["titles"]]
+            ids = {(entry[0], entry[2]): i for i, entry in enumerate(titles)}
+            words: Dict[str, array] = {}
+            grams: Dict[str, array] = {}
+            position = 0
+            for table, terms in ((words, header["words"]), (grams, header["grams"])):
+                for term, count in terms:
+                    table[term] = postings[position:position + count]
+                    position += count
+            if position != len(postings):
+                raise ValueError("postings don't match the header")
+        except (
+            OSError, EOFError, ValueError, KeyError, TypeError, IndexError,
+            struct.error, zlib.error,
+        ) as e:
+            # Starting empty is safe: the next save() replaces the file
+            console.log(f"[yellow]⚠[/yellow] Title index unreadable ({self.path}): {e}")
+            return
+
+        self._providers = providers
+        self._provider_ids = {provider: i for i, provider in enumerate(providers)}
+        self._titles = titles
+        self._ids = ids
+        self._words = words
+        self._grams = grams
+
+    def add(self, provider: str, results: List[Tuple[str, str]]) -> int:
+        """
+        Index a provider's search results (call save() to persist them).
+
+        Relative result URLs are resolved against the provider's search base
+        so indexed entries stay usable on their own.
+
+        Args:
+            provider: Provider search base URL
+            results: (title, url) pairs as extracted from a search page
+
+        Returns:
+            Number of titles added or renamed
+        """
+        now = time.time()
+        changed = 0
+        with self._lock:
+            self._load()
+            provider_id = self._provider_ids.get(provider)
+            if provider_id is None:
+                provider_id = self._provider_ids[provider] = len(self._providers)
+                self._providers.append(provider)
+
+            for title, url in results:
+                url = urljoin(provider, url)
+                title_id = self._ids.get((provider_id, url))
+                entry = self._titles[title_id] if title_id is not None else None
+                if entry is not None and entry[1] == title:
+                    if now - entry[3] > SEEN_AT_RESOLUTION:
+                        self._titles[title_id] = (provider_id, title, url, now, entry[4])
+                        self._dirty = True
+                    continue
+                if title_id is not None:
+                    # Renamed: the old entry's postings go stale until save()
+                    self._titles[title_id] = None
+                self._insert(provider_id, title, url, now)
+                changed += 1
+
+            if changed:
+                self._dirty = True
+                self._evict()
+        return changed
+
+    def _insert(self, provider_id: int, title: str, url: str, seen_at: float) -> None:
+        title_id = len(self._titles)
+        normalized = normalize(title)
+        self._titles.append((provider_id, title, url, seen_at, normalized.key))
+        self._ids[(provider_id, url)] = title_id
+        for table, terms in ((self._words, normalized.words), (self._grams, normalized.trigrams)):
+            for term in terms:
+                posting = table.get(term)
+                if posting is None:
+                    posting = table[term] = array(_POSTING_TYPE)
+                posting.append(title_id)
+
+    def _evict(self) -> None:
+        # _ids holds exactly the live entries
+        overflow = len(self._ids) - self.max_titles
+        if overflow <= 0:
+            return
+        live = sorted((self._titles[i][3], i) for i in self._ids.values())
+        # Evict a tenth more than needed so this doesn't run on every add
+        for _, title_id in live[: overflow + self.max_titles // 10]:
+            entry = self._titles[title_id]
+            del self._ids[(entry[0], entry[2])]
+            self._titles[title_id] = None
+
+    def search(
+        self, query: str, providers: Optional[List[str]] = None, limit: int = 20
+    ) -> List[Tuple[str, str]]:
+        """
+        Look up indexed titles matching a query.
+
+        Args:
+            query: Search query
+            providers: Only return entries from these search bases
+            limit: Maximum number of results
+
+        Returns:
+            List of (title, url) tuples, best match first, with
+            near-duplicates merged as for live results
+        """
+        wanted = normalize(query)
+        if not wanted.trigrams:
+            return []
+        need = max(1, math.ceil(len(wanted.trigrams) * MIN_TERM_SHARE))
+
+        batches: Dict[str, List[Tuple[str, str]]] = {}
+        with self._lock:
+            self._load()
+            allowed: Optional[Set[int]] = None
+            if providers is not None:
+                allowed = {self._provider_ids[p] for p in providers if p in self._provider_ids}
+
+            # Titles containing every query word, in any order
+            word_hits: Set[int] = set()
+            word_postings = sorted((self._words.get(word, ()) for word in wanted.words), key=len)
+            if word_postings and word_postings[0]:
+                word_hits.update(word_postings[0])
+                for posting in word_postings[1:]:
+                    word_hits.intersection_update(posting)
+
+            # A title sharing `need` trigrams shares at least `extra + 1` of
+            # the `len - need + extra + 1` rarest ones; counting through
+            # as many rare postings as the budget allows leaves few
+            # candidates to score exactly
+            rarest = sorted((self._grams.get(gram, ()) for gram in wanted.trigrams), key=len)
+            spare = len(rarest) - need
+            extra, total = 0, sum(len(posting) for posting in rarest[: spare + 1])
+            # Counting an entry is far cheaper than scoring a candidate
+            budget = max(POSTING_BUDGET, COUNT_FACTOR * total)
+            while spare + extra + 1 < len(rarest):
+                total += len(rarest[spare + extra + 1])
+                if total > budget:
+                    break
+                extra += 1
+            counts: Counter = Counter()
+            for posting in rarest[: spare + extra + 1]:
+                counts.update(posting)
+            candidates = set(word_hits)
+            if extra:
+                candidates.update(i for i, count in counts.items() if count > extra)
+            else:
+                candidates.update(counts)
+
+            grams = tuple(wanted.trigrams)
+            scored = []
+            for title_id in candidates:
+                entry = self._titles[title_id]
+                if entry is None or (allowed is not None and entry[0] not in allowed):
+                    continue
+                overlap = sum(map(f"  {entry[4]} ".__contains__, grams))
+                if title_id in word_hits:
+                    overlap += len(grams)
+                elif overlap < need:
+                    continue
+                scored.append((overlap, -title_id))
+
+            # Only the closest matches are worth the full ranking
+            for _, title_id in heapq.nlargest(limit * CANDIDATE_FACTOR, scored):
+                entry = self._titles[-title_id]
+                batches.setdefault(self._providers[entry[0]], []).append((entry[1], entry[2]))
+
+        ranked = rank_results(query, batches.items())
+        return [(result.title, result.url) for result in ranked[:limit]]
+
+    def save(self) -> bool:
+        """
+        Write the index to disk if it changed, dropping evicted entries.
+
+        Each save writes its own temporary file and atomically replaces the
+        index with it, so neither a crash nor a concurrent save (from
+        another thread or process) leaves the file torn.
+
+        Returns:
+            True if the index is on disk and up to date
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                self._compact()
+                header, postings = self._serialize()
+                self._dirty = False
+
+            tmp = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    dir=self.path.parent, prefix=self.path.name + ".", suffix=".tmp", delete=False
+                ) as raw:
+                    tmp = raw.name
+                    with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as f:
+                        f.write(INDEX_MAGIC)
+                        f.write(struct.pack("<I", len(header)))
+                        f.write(header)
+                        f.write(postings)
+                os.replace(tmp, self.path)
+                return True
+            except OSError as e:
+                console.log(f"[yellow]⚠[/yellow] Could not save title index: {e}")
+                with self._lock:
+                    self._dirty = True
+                if tmp is not None:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+                return False
+
+    def save_later(self, delay: float = SAVE_DELAY) -> None:
+        """
+        Save on a background thread after a delay, off the search path.
+
+        Calls made while a save is pending share it; whatever is still
+        unsaved at interpreter exit is written then.
+
+        Args:
+            delay: Seconds to wait before saving
+        """
+        with self._lock:
+            if not self._dirty or self._save_timer is not None:
+                return
+            if not self._exit_hooked:
+                atexit.register(self.save)
+                self._exit_hooked = True
+            self._save_timer = threading.Timer(delay, self._save_pending)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save_pending(self) -> None:
+        with self._lock:
+            self._save_timer = None
+        self.save()
+
+    def _compact(self) -> None:
+        """Renumber live titles and drop postings of removed ones."""
+        if all(entry is not None for entry in self._titles):
+            return
+        remap: Dict[int, int] = {}
+        titles = []
+        for old_id, entry in enumerate(self._titles):
+            if entry is not None:
+                remap[old_id] = len(titles)
+                titles.append(entry)
+        self._titles = titles
+        self._ids = {(entry[0], entry[2]): i for i, entry in enumerate(titles)}
+        for table in (self._words, self._grams):
+            for term in list(table):
+                posting = array(_POSTING_TYPE, (remap[i] for i in table[term] if i in remap))
+                if posting:
+                    table[term] = posting
+                else:
+                    del table[term]
+
+    def _serialize(self) -> Tuple[bytes, bytes]:
+        postings = array(_POSTING_TYPE)
+        terms = {}
+        for name, table in (("words", self._words), ("grams", self._grams)):
+            terms[name] = [[term, len(posting)] for term, posting in table.items()]
+            for posting in table.values():
+                postings.extend(posting)
+        if sys.byteorder == "big":
+            postings.byteswap()
+        header = {"providers": self._providers, "titles": self._titles, **terms}
+        return json.dumps(header, separators=(",", ":")).encode(), postings.tobytes()
+
+    def count(self) -> int:
+        """Return the number of indexed titles."""
+        with self._lock:
+            self._load()
+            return len(self._ids)
+
+    def clear(self) -> None:
+        """Drop every indexed title and delete the index file."""
+        with self._lock:
+            self._loaded = True
+            self._dirty = False
+            self._providers, self._provider_ids = [], {}
+            self._titles, self._ids = [], {}
+            self._words, self._grams = {}, {}
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
@@ -1,16 +1,32 @@
-"""Main CLI application for franken-stream."""
+"""Main CLI application for franken-stream.
 
-from typing import Optional
+Only what every command needs is imported at module load. The scraper
+stack (requests, BeautifulSoup, the caches), Rich tables and prompts, and
+the Textual TUI are imported inside the commands that use them, so
+`--help`, `config` and friends start fast.
+"""
+
+import json
+import sys
+import time
+from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TextIO, Tuple
+from urllib.parse import urljoin, urlparse
 
 import typer
 from rich.console import Console
-from rich.prompt import Prompt
-from rich.table import Table
 
+from franken_stream.defaults import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_POOL_PER_HOST,
+    DEFAULT_PROVIDER_TIMEOUT,
+)
 from franken_stream.providers import ProviderManager
-from franken_stream.scraper import ContentScraper
-from franken_stream.tui import run_tui
+
+if TYPE_CHECKING:
+    from franken_stream.providers import ProviderRules
+    from franken_stream.scraper import ContentScraper, ProviderResults, ProviderStats
 
 # Initialize CLI app and console
 app = typer.Typer(
@@ -19,6 +35,20 @@ app = typer.Typer(
 )
 console = Console()
 
+# Queries a batch run searches at once
+DEFAULT_BATCH_CONCURRENCY = 4
+
+# Results written per batch query
+DEFAULT_BATCH_LIMIT = 10
+
+
+class OutputFormat(str, Enum):
+    """How watch and tv print their results."""
+
+    table = "table"  # Rich tables and an interactive prompt
+    json = "json"  # one JSON document once the search is done
+    ndjson = "ndjson"  # one JSON line per provider as it answers, then the ranking
+
 
 @app.command()
 def watch(
@@ -41,6 +71,30 @@ def watch(
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Show detailed debug info"
     ),
+    parallel: bool = typer.Option(
+        True, "--parallel/--sequential", help="Query providers concurrently"
+    ),
+    workers: int = typer.Option(
+        DEFAULT_MAX_WORKERS, "--workers", "-w", help="Max providers queried at once"
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_PROVIDER_TIMEOUT, "--timeout", "-t", help="Per-provider deadline in seconds"
+    ),
+    deadline: Optional[float] = typer.Option(
+        None, "--deadline", help="Overall search deadline in seconds"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk HTTP and search result caches"
+    ),
+    prefetch: int = typer.Option(
+        0, "--prefetch", min=0, help="Resolve the top N results while you choose (0: off)"
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.table,
+        "--format",
+        "-f",
+        help="table (interactive), json, or ndjson (streamed per provider)",
+    ),
 ) -> None:
     """
     Search and stream a movie or TV show.
@@ -50,8 +104,15 @@ def watch(
         franken-stream watch "Breaking Bad" --proxy http://proxy:8080
         franken-stream watch "Matrix" --download -o ~/videos
         franken-stream watch "Movie" --legal-only
+        franken-stream watch "Movie" --deadline 15 --workers 4
+        franken-stream watch "Movie" --prefetch 3
+        franken-stream watch "Movie" --format ndjson | jq .
     """
     try:
+        machine_readable = output_format != OutputFormat.table
+        if machine_readable:
+            _logs_to_stderr()
+
         # Load providers
         pm = ProviderManager()
         bases = pm.get_legal_sources() if legal_only else pm.get_search_bases()
@@ -64,11 +125,40 @@ def watch(
             raise typer.Exit(1)
 
         # Initialize scraper
-        scraper = ContentScraper(proxy=proxy)
+        scraper = _make_scraper(
+            proxy, no_cache, pm.get_provider_rules(), pm.get_mirror_groups()
+        )
+
+        if machine_readable:
+            found = _print_machine_readable(
+                scraper,
+                query,
+                bases,
+                output_format,
+                verbose=verbose,
+                concurrent=parallel,
+                max_workers=workers,
+                provider_timeout=timeout,
+                overall_timeout=deadline,
+            )
+            if not found:
+                raise typer.Exit(1)
+            return
 
         # Search for content
         console.print(f"\n[cyan]Searching for:[/cyan] {query}\n")
-        results = scraper.search(query, bases, verbose=verbose)
+        # Absolute URLs, so prefetching and pre-warming can use them
+        results, _ = _search_absolute(
+            scraper,
+            query,
+            bases,
+            on_results=_print_batch,
+            verbose=verbose,
+            concurrent=parallel,
+            max_workers=workers,
+            provider_timeout=timeout,
+            overall_timeout=deadline,
+        )
 
         if not results:
             console.print("[yellow]⚠[/yellow] No results found locally.")
@@ -94,7 +184,7 @@ def watch(
 
         # Let user pick
         if interactive:
-            _handle_selection(results, scraper, download, output)
+            _handle_selection(results, scraper, download, output, prefetch=prefetch)
         else:
             console.print(
                 "[cyan]→[/cyan] Use --interactive to select a result"
@@ -103,6 +193,8 @@ def watch(
     except KeyboardInterrupt:
         console.print("\n[yellow]Cancelled.[/yellow]")
         raise typer.Exit(0)
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {e}")
         raise typer.Exit(1)
@@ -120,6 +212,30 @@ def tv(
     proxy: Optional[str] = typer.Option(
         None, "--proxy", "-p", help="HTTP proxy URL (optional)"
     ),
+    parallel: bool = typer.Option(
+        True, "--parallel/--sequential", help="Query providers concurrently"
+    ),
+    workers: int = typer.Option(
+        DEFAULT_MAX_WORKERS, "--workers", "-w", help="Max providers queried at once"
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_PROVIDER_TIMEOUT, "--timeout", "-t", help="Per-provider deadline in seconds"
+    ),
+    deadline: Optional[float] = typer.Option(
+        None, "--deadline", help="Overall search deadline in seconds"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk HTTP and search result caches"
+    ),
+    prefetch: int = typer.Option(
+        0, "--prefetch", min=0, help="Resolve the top N results while you choose (0: off)"
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.table,
+        "--format",
+        "-f",
+        help="table (interactive), json, or ndjson (streamed per provider)",
+    ),
 ) -> None:
     """
     Search for and stream TV shows with season/episode support.
@@ -128,10 +244,17 @@ def tv(
         franken-stream tv "Breaking Bad"
         franken-stream tv "Breaking Bad" --season 5
         franken-stream tv "Breaking Bad" -s 5 -e 14
+        franken-stream tv "Breaking Bad" -s 5 --format json
     """
     try:
+        machine_readable = output_format != OutputFormat.table
+        if machine_readable:
+            _logs_to_stderr()
+
         pm = ProviderManager()
-        scraper = ContentScraper(proxy=proxy)
+        scraper = _make_scraper(
+            proxy, no_cache, pm.get_provider_rules(), pm.get_mirror_groups()
+        )
 
         # Build search query
         search_query = query
@@ -147,7 +270,31 @@ def tv(
             console.print(f"[cyan]Searching:[/cyan] {query}\n")
 
         bases = pm.get_search_bases()
-        results = scraper.search(search_query, bases)
+        if machine_readable:
+            found = _print_machine_readable(
+                scraper,
+                search_query,
+                bases,
+                output_format,
+                concurrent=parallel,
+                max_workers=workers,
+                provider_timeout=timeout,
+                overall_timeout=deadline,
+            )
+            if not found:
+                raise typer.Exit(1)
+            return
+
+        results, _ = _search_absolute(
+            scraper,
+            search_query,
+            bases,
+            on_results=_print_batch,
+            concurrent=parallel,
+            max_workers=workers,
+            provider_timeout=timeout,
+            overall_timeout=deadline,
+        )
 
         if not results:
             console.print("[yellow]⚠[/yellow] No episodes found.")
@@ -156,11 +303,13 @@ def tv(
             raise typer.Exit(1)
 
         _display_results(results)
-        _handle_selection(results, scraper)
+        _handle_selection(results, scraper, prefetch=prefetch)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Cancelled.[/yellow]")
         raise typer.Exit(0)
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {e}")
         raise typer.Exit(1)
@@ -171,9 +320,25 @@ def test_providers(
     fast: bool = typer.Option(
         False, "--fast", help="Quick test (2 second timeout)"
     ),
+    samples: int = typer.Option(
+        3, "--samples", "-n", min=1, help="Requests per provider"
+    ),
+    workers: int = typer.Option(
+        DEFAULT_MAX_WORKERS, "--workers", "-w", min=1, help="Providers probed at once"
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Print machine-readable results"
+    ),
 ) -> None:
     """Test provider URLs for health and response time."""
+    from rich.table import Table
+
+    from franken_stream.scraper import ContentScraper
+
     try:
+        if json_output:
+            _logs_to_stderr()
+
         pm = ProviderManager()
         scraper = ContentScraper()
 
@@ -182,44 +347,79 @@ def test_providers(
             console.print("[red]✗[/red] No providers configured")
             raise typer.Exit(1)
 
-        console.print("[cyan]Testing providers...\n[/cyan]")
-
-        table = Table(title="Provider Health Check")
-        table.add_column("URL", style="cyan", width=50)
-        table.add_column("Status", style="green")
-        table.add_column("Time", style="magenta")
-
         timeout = 2 if fast else 10
-        healthy_count = 0
-        slow_count = 0
-        dead_count = 0
+        if not json_output:
+            console.print(
+                f"[cyan]Testing {len(bases)} providers "
+                f"({samples} samples each)...\n[/cyan]"
+            )
 
-        for url in bases:
-            is_healthy, elapsed = scraper.test_provider_url(url, timeout)
+        stats = scraper.probe_providers(
+            bases, samples=samples, timeout=timeout, max_workers=workers
+        )
 
-            if is_healthy:
-                if elapsed > 5:
-                    status = "⚠ Slow"
-                    slow_count += 1
-                else:
-                    status = "✓ OK"
-                    healthy_count += 1
-                time_str = f"{elapsed:.2f}s"
-            else:
-                status = "✗ Dead"
-                dead_count += 1
-                time_str = "Timeout"
+        if json_output:
+            report = {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "samples": samples,
+                "timeout": timeout,
+                "providers": [
+                    {
+                        "url": stat.url,
+                        "status": _provider_status(stat),
+                        "successes": stat.successes,
+                        "samples": stat.samples,
+                        "p50_ms": _ms(stat.p50),
+                        "p95_ms": _ms(stat.p95),
+                        "ttfb_p50_ms": _ms(stat.ttfb_p50),
+                        "transfer_p50_ms": _ms(stat.transfer_p50),
+                        "method": stat.method,
+                        "http_status": stat.status,
+                        "error": stat.error,
+                    }
+                    for stat in stats
+                ],
+            }
+            typer.echo(json.dumps(report, indent=2))
+            return
 
-            table.add_row(url[:50], status, time_str)
+        table = Table(title="Provider Health Check")
+        table.add_column("URL", style="cyan", max_width=24, no_wrap=True, overflow="ellipsis")
+        table.add_column("Status", style="green", no_wrap=True)
+        table.add_column("OK", justify="right", no_wrap=True)
+        table.add_column("p50", style="magenta", justify="right", no_wrap=True)
+        table.add_column("p95", style="magenta", justify="right", no_wrap=True)
+        table.add_column("TTFB", justify="right", no_wrap=True)
+        table.add_column("Transfer", justify="right", no_wrap=True)
+
+        counts = {"OK": 0, "Slow": 0, "Dead": 0}
+        for stat in stats:
+            status = _provider_status(stat)
+            counts[status] += 1
+            table.add_row(
+                stat.url,
+                {"OK": "✓ OK", "Slow": "⚠ Slow", "Dead": "✗ Dead"}[status],
+                f"{stat.successes}/{stat.samples}",
+                _seconds(stat.p50),
+                _seconds(stat.p95),
+                _seconds(stat.ttfb_p50),
+                _seconds(stat.transfer_p50),
+            )
 
         console.print(table)
 
+        for stat in stats:
+            if not stat.healthy:
+                console.print(f"[red]✗[/red] {stat.url}: {stat.error}")
+            elif stat.method == "GET":
+                console.print(f"[dim]{stat.url}: HEAD unsupported, probed with ranged GET[/dim]")
+
         # Summary
-        console.print(f"\n[green]Healthy:[/green] {healthy_count}")
-        console.print(f"[yellow]Slow:[/yellow] {slow_count}")
-        console.print(f"[red]Dead:[/red] {dead_count}")
+        console.print(f"\n[green]Healthy:[/green] {counts['OK']}")
+        console.print(f"[yellow]Slow:[/yellow] {counts['Slow']}")
+        console.print(f"[red]Dead:[/red] {counts['Dead']}")
 
-        if dead_count > 0:
+        if counts["Dead"] > 0:
             console.print(
                 "\n[yellow]→[/yellow] Consider removing dead providers from config"
             )
@@ -229,6 +429,130 @@ def test_providers(
         raise typer.Exit(1)
 
 
+@app.command()
+def batch(
+    source: Optional[Path] = typer.Argument(
+        None, help="File with one query per line (default or '-': stdin)"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_BATCH_CONCURRENCY, "--concurrency", "-j", min=1, help="Queries searched at once"
+    ),
+    limit: int = typer.Option(
+        DEFAULT_BATCH_LIMIT, "--limit", "-n", min=1, help="Results written per query"
+    ),
+    proxy: Optional[str] = typer.Option(
+        None, "--proxy", "-p", help="HTTP proxy URL (optional)"
+    ),
+    legal_only: bool = typer.Option(
+        False, "--legal-only", help="Search legal sources only"
+    ),
+    workers: int = typer.Option(
+        DEFAULT_MAX_WORKERS,
+        "--workers",
+        "-w",
+        min=1,
+        help="Max providers queried at once per query",
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_PROVIDER_TIMEOUT, "--timeout", "-t", help="Per-provider deadline in seconds"
+    ),
+    deadline: Optional[float] = typer.Option(
+        None, "--deadline", help="Overall deadline per query in seconds"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the on-disk HTTP and search result caches"
+    ),
+) -> None:
+    """
+    Search many titles at once, writing one JSON line per query.
+
+    Queries run concurrently through one scraper, so they share its
+    connection pool, caches and provider health. Each line holds the
+    query, its ranked results (absolute URLs) and per-provider timings,
+    and is written as soon as that query finishes. Blank lines and lines
+    starting with # are skipped.
+
+    Example:
+        franken-stream batch watchlist.txt > results.jsonl
+        cat watchlist.txt | franken-stream batch -j 8 --deadline 20
+    """
+    from concurrent.futures import as_completed
+
+    from franken_stream.pool import DaemonThreadPool
+
+    _logs_to_stderr()
+    try:
+        if source is None or str(source) == "-":
+            queries = _read_queries(sys.stdin)
+        else:
+            with open(source, encoding="utf-8") as f:
+                queries = _read_queries(f)
+    except OSError as e:
+        console.print(f"[red]✗[/red] Could not read queries: {e}")
+        raise typer.Exit(1)
+
+    pm = ProviderManager()
+    bases = pm.get_legal_sources() if legal_only else pm.get_search_bases()
+    if not bases:
+        console.print(
+            "[red]✗[/red] No search providers configured. "
+            "Run: franken-stream update"
+        )
+        raise typer.Exit(1)
+    if not queries:
+        console.print("[yellow]⚠[/yellow] No queries to search")
+        return
+
+    # Every running query may hold a connection to the same provider
+    scraper = _make_scraper(
+        proxy,
+        no_cache,
+        pm.get_provider_rules(),
+        pm.get_mirror_groups(),
+        pool_per_host=max(DEFAULT_POOL_PER_HOST, concurrency),
+    )
+    console.print(
+        f"[cyan]Searching {len(queries)} queries, {concurrency} at a time...[/cyan]"
+    )
+
+    start = time.perf_counter()
+    found = 0
+    executor = DaemonThreadPool(concurrency, thread_name_prefix="franken-batch")
+    futures = [
+        executor.submit(
+            _search_batch_query,
+            scraper,
+            line,
+            query,
+            bases,
+            limit=limit,
+            max_workers=workers,
+            provider_timeout=timeout,
+            overall_timeout=deadline,
+        )
+        for line, query in queries
+    ]
+    try:
+        for future in as_completed(futures):
+            record = future.result()
+            if record["results"]:
+                found += 1
+            typer.echo(json.dumps(record, ensure_ascii=False))
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Cancelled.[/yellow]")
+        raise typer.Exit(130)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    console.print(
+        f"[green]✓[/green] {len(queries)} queries in {time.perf_counter() - start:.1f}s "
+        f"({found} with results)"
+    )
+
+
 @app.command()
 def update() -> None:
     """Update streaming providers from GitHub."""
@@ -262,6 +586,10 @@ def validate() -> None:
 @app.command()
 def config() -> None:
     """Show configuration information."""
+    from rich.table import Table
+
+    from franken_stream.cache import ResponseCache
+
     pm = ProviderManager()
     pm._ensure_config_dir()
 
@@ -273,6 +601,14 @@ def config() -> None:
     table.add_row("Config File", str(pm.config_file))
     table.add_row("GitHub Source", pm.github_url)
 
+    cache_stats = ResponseCache().stats()
+    table.add_row(
+        "HTTP Cache",
+        f"{cache_stats['entries']} entries, "
+        f"{cache_stats['bytes'] / 1024 / 1024:.1f} / "
+        f"{cache_stats['max_bytes'] / 1024 / 1024:.0f} MB",
+    )
+
     console.print(table)
 
     if pm.config_file.exists():
@@ -298,8 +634,293 @@ def config() -> None:
         )
 
 
+def _make_scraper(
+    proxy: Optional[str] = None,
+    no_cache: bool = False,
+    provider_rules: Optional[Dict[str, "ProviderRules"]] = None,
+    mirror_groups: Optional[Dict[str, List[str]]] = None,
+    pool_per_host: int = DEFAULT_POOL_PER_HOST,
+) -> "ContentScraper":
+    """
+    Build a scraper backed by the on-disk caches unless disabled.
+
+    The learned per-host selector profile and the provider health store
+    are used either way: they describe the providers, not their content.
+    """
+    from franken_stream.cache import (
+        ResolutionCache,
+        ResponseCache,
+        SearchCache,
+        SelectorProfile,
+    )
+    from franken_stream.health import ProviderHealth
+    from franken_stream.index import TitleIndex
+    from franken_stream.scraper import ContentScraper
+
+    if no_cache:
+        return ContentScraper(
+            proxy=proxy,
+            provider_rules=provider_rules,
+            mirror_groups=mirror_groups,
+            pool_per_host=pool_per_host,
+            selector_profile=SelectorProfile(),
+            health=ProviderHealth(),
+        )
+    return ContentScraper(
+        proxy=proxy,
+        provider_rules=provider_rules,
+        mirror_groups=mirror_groups,
+        pool_per_host=pool_per_host,
+        health=ProviderHealth(),
+        cache=ResponseCache(),
+        result_cache=SearchCache(),
+        title_index=TitleIndex(),
+        resolution_cache=ResolutionCache(),
+        selector_profile=SelectorProfile(),
+    )
+
+
+def _logs_to_stderr() -> None:
+    """Send library progress logs to stderr so stdout stays machine-readable."""
+    from franken_stream import cache as cache_module
+    from franken_stream import index as index_module
+    from franken_stream import providers as providers_module
+    from franken_stream import scraper as scraper_module
+
+    for module in (cache_module, index_module, providers_module, scraper_module):
+        module.console.stderr = True
+    console.stderr = True
+
+
+def _read_queries(stream: TextIO) -> List[Tuple[int, str]]:
+    """Read (line number, query) pairs, skipping blank and # comment lines."""
+    queries = []
+    for line, text in enumerate(stream, 1):
+        query = text.strip()
+        if query and not query.startswith("#"):
+            queries.append((line, query))
+    return queries
+
+
+def _absolute_results(batch: "ProviderResults") -> List[Tuple[str, str]]:
+    """Resolve a batch's result URLs against its provider's search base."""
+    return [(title, urljoin(batch.provider, url)) for title, url in batch.results]
+
+
+def _search_absolute(
+    scraper: "ContentScraper",
+    query: str,
+    bases: List[str],
+    on_results: Optional[Callable[["ProviderResults"], None]] = None,
+    **search_options: Any,
+) -> Tuple[List[Tuple[str, str]], List["ProviderResults"]]:
+    """
+    Search like ContentScraper.search, but with absolute result URLs.
+
+    Relative URLs from different providers would be indistinguishable once
+    merged, so each batch is resolved against its search base before ranking.
+
+    Args:
+        scraper: Scraper to search with
+        query: Search query
+        bases: Provider search bases, in configured order
+        on_results: Callback invoked with each (absolute) batch as it arrives
+        **search_options: Passed to ContentScraper.iter_search
+
+    Returns:
+        Tuple of (ranked (title, url) list, batches in arrival order)
+    """
+    from franken_stream.index import INDEX_PROVIDER
+
+    collected: Dict[str, List[Tuple[str, str]]] = {}
+    batches = []
+    for batch in scraper.iter_search(query, bases, **search_options):
+        batch = batch._replace(results=_absolute_results(batch))
+        collected[batch.provider] = batch.results
+        batches.append(batch)
+        if on_results:
+            on_results(batch)
+
+    ordered = [(base, collected.get(base, [])) for base in bases]
+    ordered.append((INDEX_PROVIDER, collected.get(INDEX_PROVIDER, [])))
+    return scraper.rank(query, ordered), batches
+
+
+def _provider_record(batch: "ProviderResults") -> Dict[str, Any]:
+    """Summarize one provider's answer for JSON output."""
+    return {
+        "provider": batch.provider,
+        "count": len(batch.results),
+        "latency_ms": _ms(batch.elapsed),
+        "cached": batch.cached,
+        "error": batch.error,
+    }
+
+
+def _result_records(
+    results: List[Tuple[str, str]],
+    batches: List["ProviderResults"],
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build JSON records for ranked results.
+
+    Each result is credited to the provider that returned its URL,
+    preferring live providers over the local title index.
+    """
+    from franken_stream.index import INDEX_PROVIDER
+
+    found_by: Dict[str, "ProviderResults"] = {}
+    for batch in sorted(batches, key=lambda batch: batch.provider == INDEX_PROVIDER):
+        for _, url in batch.results:
+            found_by.setdefault(url, batch)
+
+    records = []
+    for rank, (title, url) in enumerate(results[:limit], 1):
+        batch = found_by.get(url)
+        records.append(
+            {
+                "rank": rank,
+                "title": title,
+                "url": url,
+                "provider": batch.provider if batch else None,
+                "latency_ms": _ms(batch.elapsed) if batch else None,
+            }
+        )
+    return records
+
+
+def _search_batch_query(
+    scraper: "ContentScraper",
+    line: int,
+    query: str,
+    bases: List[str],
+    limit: int = DEFAULT_BATCH_LIMIT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    provider_timeout: float = DEFAULT_PROVIDER_TIMEOUT,
+    overall_timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Search one batch query and build its JSON record.
+
+    Errors are reported in the record instead of raised, so one bad query
+    never ends a batch run.
+    """
+    start = time.perf_counter()
+    results: List[Tuple[str, str]] = []
+    batches: List["ProviderResults"] = []
+    error = None
+    try:
+        # Cached results are current enough for a batch; a background
+        # refresh would only compete with the queries still running
+        results, batches = _search_absolute(
+            scraper,
+            query,
+            bases,
+            concurrent=True,
+            max_workers=max_workers,
+            provider_timeout=provider_timeout,
+            overall_timeout=overall_timeout,
+            refresh_cached=False,
+        )
+    except Exception as e:
+        error = str(e)
+
+    return {
+        "line": line,
+        "query": query,
+        "results": _result_records(results, batches, limit),
+        "elapsed_ms": _ms(time.perf_counter() - start),
+        "providers": [_provider_record(batch) for batch in batches],
+        "error": error,
+    }
+
+
+def _print_machine_readable(
+    scraper: "ContentScraper",
+    query: str,
+    bases: List[str],
+    output_format: "OutputFormat",
+    **search_options: Any,
+) -> bool:
+    """
+    Search and print results as JSON instead of tables and prompts.
+
+    ndjson writes one line per provider as soon as it answers, then a final
+    line with the ranked results; json writes that final document only.
+
+    Returns:
+        True if anything was found
+    """
+    start = time.perf_counter()
+
+    def emit(record: Dict[str, Any]) -> None:
+        typer.echo(json.dumps(record, ensure_ascii=False))
+        sys.stdout.flush()
+
+    def on_results(batch: "ProviderResults") -> None:
+        record = {"type": "provider", "query": query, **_provider_record(batch)}
+        # Positions follow the provider's own order, before cross-provider ranking
+        record["results"] = [
+            {"position": position, "title": title, "url": url}
+            for position, (title, url) in enumerate(batch.results, 1)
+        ]
+        emit(record)
+
+    streaming = output_format == OutputFormat.ndjson
+    results, batches = _search_absolute(
+        scraper, query, bases, on_results=on_results if streaming else None, **search_options
+    )
+    summary: Dict[str, Any] = {"type": "results"} if streaming else {}
+    summary.update(
+        {
+            "query": query,
+            "results": _result_records(results, batches),
+            "elapsed_ms": _ms(time.perf_counter() - start),
+        }
+    )
+    if not streaming:
+        summary["providers"] = [_provider_record(batch) for batch in batches]
+    emit(summary)
+    return bool(results)
+
+
+def _provider_status(stat: "ProviderStats") -> str:
+    """Classify probe statistics as OK, Slow or Dead."""
+    if not stat.healthy:
+        return "Dead"
+    if stat.p50 > 5:
+        return "Slow"
+    return "OK"
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def _seconds(seconds: Optional[float]) -> str:
+    return f"{seconds:.2f}s" if seconds is not None else "-"
+
+
+def _print_batch(batch: "ProviderResults") -> None:
+    """Print the first hits from a provider as soon as it responds."""
+    if not batch.results:
+        return
+
+    host = urlparse(batch.provider).netloc or batch.provider
+    timing = "cached" if batch.cached else f"{batch.elapsed:.1f}s"
+    console.print(
+        f"[green]✓[/green] [bold]{host}[/bold] "
+        f"[dim]({len(batch.results)} results, {timing})[/dim]"
+    )
+    for title, _ in batch.results[:3]:
+        console.print(f"    [cyan]•[/cyan] {title[:60]}")
+
+
 def _display_results(results: list) -> None:
     """Display search results in a formatted table."""
+    from rich.table import Table
+
     table = Table(title="Search Results")
     table.add_column("#", style="magenta", width=3)
     table.add_column("Title", style="cyan")
@@ -313,18 +934,42 @@ def _display_results(results: list) -> None:
 
 def _handle_selection(
     results: list,
-    scraper: ContentScraper,
+    scraper: "ContentScraper",
     download: bool = False,
     output: Optional[str] = None,
+    prefetch: int = 0,
 ) -> None:
-    """Handle user selection from search results."""
+    """
+    Handle user selection from search results.
+
+    With prefetch > 0, the embeds (and, unless downloading, the stream URLs)
+    of the first detail-page results are resolved while the prompt is open.
+    """
+    from rich.prompt import Prompt
+
+    from franken_stream.prefetch import Prefetcher
+
+    prefetcher = None
     try:
+        # Connect to the result hosts while the user is still choosing
+        scraper.prewarm([url for _, url in results])
+
+        if prefetch:
+            candidates = [
+                url for _, url in results
+                if _is_detail_page(url) and url.startswith(("http://", "https://"))
+            ]
+            prefetcher = Prefetcher(
+                scraper, candidates, count=prefetch, resolve_streams=not download
+            ).start()
+
         choice = Prompt.ask(
             "\n[cyan]Select result[/cyan]",
             choices=[str(i) for i in range(1, len(results) + 1)],
         )
         idx = int(choice) - 1
         title, url = results[idx]
+        prefetched = prefetcher.claim(url) if prefetcher else None
 
         console.print(
             f"\n[cyan]Selected:[/cyan] {title}\n"
@@ -333,9 +978,15 @@ def _handle_selection(
 
         # Determine if this is a detail page and extract embed
         is_embed = False
-        is_detail_page = "/watch/" in url or "/movie/" in url or "/title/" in url
-        
-        if is_detail_page:
+        is_detail_page = _is_detail_page(url)
+        stream_url = None
+
+        if prefetched and prefetched.embed_url:
+            console.print("[green]✓[/green] Using prefetched embed")
+            is_embed = True
+            url = prefetched.embed_url
+            stream_url = prefetched.stream_url
+        elif is_detail_page:
             console.print("[cyan]→[/cyan] Fetching player embed...")
             
             # Try to get the full base URL for relative URL construction
@@ -361,6 +1012,8 @@ def _handle_selection(
                         "opening in browser..."
                     )
                     console.print(f"[green]{url}[/green]")
+                elif stream_url:
+                    scraper.play_url(stream_url)
                 else:
                     scraper.play_url(url, is_embed=is_embed)
             else:
@@ -372,6 +1025,14 @@ def _handle_selection(
 
     except (ValueError, IndexError):
         console.print("[red]✗[/red] Invalid selection")
+    finally:
+        if prefetcher is not None:
+            prefetcher.cancel()
+
+
+def _is_detail_page(url: str) -> bool:
+    """Return True if a result URL looks like a provider's detail page."""
+    return "/watch/" in url or "/movie/" in url or "/title/" in url
 
 
 @app.callback(invoke_without_command=True)
@@ -388,6 +1049,8 @@ def default_command(ctx: typer.Context) -> None:
         if "--cli" not in ctx.args and "-c" not in ctx.args:
             # Launch TUI
             try:
+                from franken_stream.tui import run_tui
+
                 run_tui()
             except ImportError:
                 console.print(
@@ -0,0 +1,507 @@
+"""HTML parser backend selection and lightweight targeted scanning."""
+
+import importlib.util
+import os
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# BeautifulSoup tree builders, fastest first. html.parser ships with Python
+# and is always available; lxml is a C parser installed via the "fast" extra.
+PARSER_BACKENDS = ("lxml", "html.parser")
+
+# Environment variable to force a specific backend (e.g. for benchmarking)
+PARSER_ENV = "FRANKEN_STREAM_PARSER"
+
+
+def available_backends() -> List[str]:
+    """Return the installed parser backends, fastest first."""
+    return [backend for backend in PARSER_BACKENDS if _is_installed(backend)]
+
+
+def _is_installed(backend: str) -> bool:
+    if backend == "html.parser":
+        return True
+    return importlib.util.find_spec(backend) is not None
+
+
+@lru_cache(maxsize=None)
+def default_backend() -> str:
+    """
+    Pick the parser backend used by the scrapers.
+
+    Honours FRANKEN_STREAM_PARSER when it names an installed backend,
+    otherwise uses the fastest installed one.
+    """
+    backends = available_backends()
+    requested = os.environ.get(PARSER_ENV)
+    if requested in backends:
+        return requested
+    return backends[0]
+
+
+def make_soup(markup: Union[str, bytes], backend: Optional[str] = None) -> "BeautifulSoup":
+    """
+    Parse HTML with the selected backend.
+
+    Args:
+        markup: Raw HTML (bytes are decoded with decode_markup())
+        backend: Parser backend name (default: default_backend())
+
+    Returns:
+        BeautifulSoup object
+    """
+    # Imported on first use: the streaming scanner below doesn't need it
+    from bs4 import BeautifulSoup
+
+    # Decoded here rather than by BeautifulSoup: handed bytes, the lxml
+    # builder falls back to UTF-8 on charset names libxml2 doesn't know,
+    # such as "latin-1"
+    return BeautifulSoup(decode_markup(markup), backend or default_backend())
+
+
+def decode_markup(markup: Union[str, bytes], encoding: Optional[str] = None) -> str:
+    """
+    Decode a page the way BeautifulSoup picks its encoding.
+
+    Tries, in order: the given encoding (e.g. an HTTP charset), a byte-order
+    mark, the charset declared in a <meta> tag or XML declaration, UTF-8,
+    then windows-1252. Unlike BeautifulSoup there is no statistical sniffing,
+    which costs more than scanning the page.
+
+    Args:
+        markup: Raw HTML
+        encoding: Charset known to apply to the bytes, if any
+
+    Returns:
+        Decoded markup
+    """
+    if isinstance(markup, str):
+        return markup
+
+    from bs4.dammit import EncodingDetector
+
+    body, sniffed = EncodingDetector.strip_byte_order_mark(markup)
+    declared = EncodingDetector.find_declared_encoding(body, is_html=True)
+    for candidate in (encoding, sniffed, declared, "utf-8"):
+        if not candidate:
+            continue
+        try:
+            return body.decode(candidate)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return body.decode("windows-1252", "replace")
+
+
+# charset parameter of a Content-Type header
+_CHARSET_PARAM = re.compile(r"""charset\s*=\s*["']?([^"';\s]+)""", re.IGNORECASE)
+
+
+def response_markup(response) -> Union[str, bytes]:
+    """
+    Return a requests response body ready for scanning.
+
+    See body_markup().
+    """
+    return body_markup(response.content, response.headers.get("Content-Type", ""))
+
+
+def body_markup(body: bytes, content_type: str) -> Union[str, bytes]:
+    """
+    Return a response body ready for scanning.
+
+    The body is decoded when the Content-Type header names a charset (which
+    takes precedence over <meta>); otherwise the raw bytes are returned and
+    decode_markup() detects the encoding from the page itself.
+
+    Args:
+        body: Raw response body
+        content_type: Content-Type header value ("" if missing)
+
+    Returns:
+        Decoded text, or the raw bytes
+    """
+    match = _CHARSET_PARAM.search(content_type)
+    if match:
+        try:
+            return body.decode(match.group(1), "replace")
+        except LookupError:
+            pass
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Restricted streaming scan
+#
+# Extractors only care about a handful of tags (anchors for search results,
+# iframe/video/source for embeds). scan_elements() tokenizes the page once,
+# keeps just those elements together with their ancestor chain, and can stop
+# as soon as the caller has enough candidates. No tree is built.
+# ---------------------------------------------------------------------------
+
+# Elements that never have children or an end tag
+VOID_ELEMENTS = frozenset(
+    {
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "param", "source", "track", "wbr",
+    }
+)
+
+# Markup is fed to the tokenizer in chunks so early stops skip the rest
+SCAN_CHUNK_SIZE = 32 * 1024
+
+
+class Node:
+    """An open element on the ancestor stack."""
+
+    __slots__ = ("tag", "attrs", "classes")
+
+    def __init__(self, tag: str, attrs: Dict[str, str]):
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = attrs.get("class", "").split()
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Return an attribute value, like bs4's Tag.get."""
+        return self.attrs.get(name, default)
+
+
+class Element(Node):
+    """A scanned element with its ancestor chain and text content."""
+
+    __slots__ = ("ancestors", "_text", "_open_text")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], ancestors: Tuple[Node, ...]):
+        super().__init__(tag, attrs)
+        self.ancestors = ancestors
+        self._text: List[str] = []
+        self._open_text = False
+
+    def get_text(self, strip: bool = False) -> str:
+        """Return the element's text, like bs4's Tag.get_text."""
+        if strip:
+            return "".join(piece.strip() for piece in self._text)
+        return "".join(self._text)
+
+
+class _Collector:
+    """Builds Elements from tokenizer events for the requested tags."""
+
+    def __init__(self, tags: Set[str], on_element: Optional[Callable[[Element], bool]]):
+        self.tags = tags
+        self.on_element = on_element
+        self.elements: List[Element] = []
+        self.stopped = False
+        self._stack: List[Node] = []
+        self._collecting: List[Element] = []
+
+    def start(self, tag: str, attrs: Dict[str, str]) -> None:
+        if self.stopped:
+            return
+        for element in self._collecting:
+            element._open_text = False
+
+        node: Node = Node(tag, attrs)
+        if tag in self.tags:
+            node = Element(tag, attrs, tuple(self._stack))
+            self.elements.append(node)
+            if tag in VOID_ELEMENTS:
+                self._complete(node)
+                return
+            self._collecting.append(node)
+
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def end(self, tag: str) -> None:
+        if self.stopped or tag in VOID_ELEMENTS:
+            return
+        for element in self._collecting:
+            element._open_text = False
+
+        # Pop back to the matching open tag, closing anything left unclosed
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].tag == tag:
+                closed = self._stack[index:]
+                del self._stack[index:]
+                for node in reversed(closed):
+                    if isinstance(node, Element):
+                        self._collecting.remove(node)
+                        self._complete(node)
+                return
+
+    def data(self, text: str) -> None:
+        if self.stopped:
+            return
+        for element in self._collecting:
+            # Tokenizers may split one text node; keep it as one piece
+            if element._open_text:
+                element._text[-1] += text
+            else:
+                element._text.append(text)
+                element._open_text = True
+
+    def close(self) -> None:
+        for element in self._collecting:
+            self._complete(element)
+        self._collecting = []
+
+    def _complete(self, element: Element) -> None:
+        if self.stopped or self.on_element is None:
+            return
+        if self.on_element(element):
+            self.stopped = True
+
+
+class _HTMLParserTokenizer(HTMLParser):
+    """Stdlib tokenizer forwarding events to a _Collector."""
+
+    def __init__(self, collector: _Collector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, {name: value or "" for name, value in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+
+class _LxmlTarget:
+    """lxml parser target forwarding events to a _Collector."""
+
+    def __init__(self, collector: _Collector):
+        self.collector = collector
+
+    def start(self, tag, attrib):
+        self.collector.start(tag, dict(attrib))
+
+    def end(self, tag):
+        self.collector.end(tag)
+
+    def data(self, data):
+        self.collector.data(data)
+
+    def close(self):
+        return None
+
+
+def scan_elements(
+    markup: Union[str, bytes],
+    tags: Iterable[str],
+    on_element: Optional[Callable[[Element], bool]] = None,
+    backend: Optional[str] = None,
+    encoding: Optional[str] = None,
+) -> List[Element]:
+    """
+    Tokenize markup once, keeping only the requested tags.
+
+    Args:
+        markup: Raw HTML (bytes are decoded with decode_markup())
+        tags: Tag names to collect (lowercase)
+        on_element: Called with each element once its text is complete;
+            returning True stops the scan early
+        backend: Tokenizer backend (default: default_backend())
+        encoding: Charset of byte markup when known (e.g. from HTTP headers)
+
+    Returns:
+        Collected elements in document order
+    """
+    collector = _Collector(set(tags), on_element)
+    # Both tokenizers get text, so they agree with each other and with
+    # BeautifulSoup on non-UTF-8 pages
+    markup = decode_markup(markup, encoding)
+
+    if (backend or default_backend()) == "lxml":
+        from lxml import etree
+
+        parser = etree.HTMLParser(target=_LxmlTarget(collector))
+        feed = parser.feed
+    else:
+        parser = _HTMLParserTokenizer(collector)
+        feed = parser.feed
+
+    for offset in range(0, len(markup), SCAN_CHUNK_SIZE):
+        feed(markup[offset:offset + SCAN_CHUNK_SIZE])
+        if collector.stopped:
+            break
+
+    try:
+        parser.close()
+    except Exception:
+        # lxml raises on documents it gave up on; whatever was collected stands
+        pass
+    collector.close()
+    return collector.elements
+
+
+# ---------------------------------------------------------------------------
+# Minimal CSS selectors for scanned elements
+# ---------------------------------------------------------------------------
+
+_TAG_RE = re.compile(r"[a-zA-Z][\w-]*|\*")
+_SIMPLE_RE = re.compile(
+    r"""
+    \.(?P<cls>[\w-]+)
+    | \#(?P<id>[\w-]+)
+    | \[\s*(?P<attr>[\w:-]+)\s*
+        (?:(?P<op>[*^$~|]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]*)))?
+      \s*\]
+    """,
+    re.VERBOSE,
+)
+
+
+class _Compound:
+    """One compound selector such as ``div.card`` or ``a[href*='/watch/']``."""
+
+    __slots__ = ("tag", "id", "classes", "attrs")
+
+    def __init__(self, source: str):
+        self.tag: Optional[str] = None
+        self.id: Optional[str] = None
+        self.classes: List[str] = []
+        self.attrs: List[Tuple[str, Optional[str], str]] = []
+
+        position = 0
+        tag_match = _TAG_RE.match(source)
+        if tag_match:
+            if tag_match.group() != "*":
+                self.tag = tag_match.group().lower()
+            position = tag_match.end()
+
+        while position < len(source):
+            match = _SIMPLE_RE.match(source, position)
+            if not match:
+                raise ValueError(f"Unsupported selector syntax: {source!r}")
+            if match.group("cls"):
+                self.classes.append(match.group("cls"))
+            elif match.group("id"):
+                self.id = match.group("id")
+            else:
+                value = next(
+                    (v for v in match.group("dq", "sq", "bare") if v is not None), ""
+                )
+                self.attrs.append((match.group("attr").lower(), match.group("op"), value))
+            position = match.end()
+
+        if position == 0:
+            raise ValueError(f"Empty selector: {source!r}")
+
+    def matches(self, node: Node) -> bool:
+        if self.tag is not None and node.tag != self.tag:
+            return False
+        if self.id is not None and node.attrs.get("id") != self.id:
+            return False
+        for cls in self.classes:
+            if cls not in node.classes:
+                return False
+        for name, op, value in self.attrs:
+            actual = node.attrs.get(name)
+            if actual is None:
+                return False
+            if op is None:
+                continue
+            if op == "=" and actual != value:
+                return False
+            if op == "*=" and (not value or value not in actual):
+                return False
+            if op == "^=" and (not value or not actual.startswith(value)):
+                return False
+            if op == "$=" and (not value or not actual.endswith(value)):
+                return False
+            if op == "~=" and value not in actual.split():
+                return False
+            if op == "|=" and not (actual == value or actual.startswith(value + "-")):
+                return False
+        return True
+
+
+class Selector:
+    """
+    Compiled CSS selector for scanned elements.
+
+    Supports type, class, id and attribute selectors (``=``, ``*=``, ``^=``,
+    ``$=``, ``~=``, ``|=``) joined by descendant (space) or child (``>``)
+    combinators, which covers the selectors the extractors use.
+    """
+
+    def __init__(self, selector: str):
+        """
+        Compile a selector.
+
+        Raises:
+            ValueError: If the selector uses unsupported syntax
+        """
+        self.source = selector
+        parts = re.split(r"\s*(>)\s*|\s+", selector.strip())
+        self._compounds: List[_Compound] = []
+        self._child: List[bool] = []  # combinator before compound i (i >= 1)
+
+        expect_compound = True
+        child = False
+        for part in parts:
+            if part is None or part == "":
+                continue
+            if part == ">":
+                if expect_compound:
+                    raise ValueError(f"Unsupported selector syntax: {selector!r}")
+                child = True
+                expect_compound = True
+                continue
+            if self._compounds:
+                self._child.append(child)
+            self._compounds.append(_Compound(part))
+            child = False
+            expect_compound = False
+
+        if not self._compounds or expect_compound:
+            raise ValueError(f"Unsupported selector syntax: {selector!r}")
+
+    def __repr__(self) -> str:
+        return f"Selector({self.source!r})"
+
+    @property
+    def tag(self) -> Optional[str]:
+        """Tag name the selector's subject must have (None for any tag)."""
+        return self._compounds[-1].tag
+
+    def match(self, element: Element) -> bool:
+        """Return True if the element matches the selector."""
+        if not self._compounds[-1].matches(element):
+            return False
+        ancestors = element.ancestors
+        return self._match_ancestors(len(self._compounds) - 2, ancestors, len(ancestors))
+
+    def _match_ancestors(self, index: int, ancestors: Tuple[Node, ...], end: int) -> bool:
+        if index < 0:
+            return True
+        compound = self._compounds[index]
+        if self._child[index]:
+            # Child combinator: must be the immediate parent
+            return end > 0 and compound.matches(ancestors[end - 1]) and self._match_ancestors(
+                index - 1, ancestors, end - 1
+            )
+        for position in range(end - 1, -1, -1):
+            if compound.matches(ancestors[position]) and self._match_ancestors(
+                index - 1, ancestors, position
+            ):
+                return True
+        return False
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> Selector:
+    """Compile (and memoize) a selector for use with scanned elements."""
+    return Selector(selector)
@@ -0,0 +1,89 @@
+"""Worker pool whose abandoned tasks never keep the process alive."""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class DaemonThreadPool:
+    """
+    Minimal executor running tasks on daemon threads.
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so a request
+    abandoned at a deadline still holds the process open until the socket
+    gives up. Daemon workers let a command exit as soon as it has printed
+    its results. Futures are standard concurrent.futures ones, so
+    wait()/as_completed() work as usual.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "franken-pool"):
+        """
+        Initialize the pool (threads start with the first submissions).
+
+        Args:
+            max_workers: Maximum number of worker threads
+            thread_name_prefix: Name prefix for the worker threads
+        """
+        self.max_workers = max(1, max_workers)
+        self.thread_name_prefix = thread_name_prefix
+        self._queue: "queue.SimpleQueue[Optional[Tuple[Future, Callable, tuple, dict]]]" = (
+            queue.SimpleQueue()
+        )
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Schedule fn(*args, **kwargs) and return its Future."""
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            self._queue.put((future, fn, args, kwargs))
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.thread_name_prefix}-{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop the workers once the queued tasks are done.
+
+        Args:
+            wait: Block until every worker has finished
+        """
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def __enter__(self) -> "DaemonThreadPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown(wait=True)
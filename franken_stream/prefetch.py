@@ -0,0 +1,190 @@
+"""Speculative embed and stream resolution while the user picks a result."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, NamedTuple, Optional
+
+import requests
+
+from franken_stream.pool import DaemonThreadPool
+from franken_stream.scraper import ContentScraper
+
+# Results resolved speculatively
+DEFAULT_PREFETCH_COUNT = 3
+
+# Bandwidth cap for detail page downloads, in bytes per second
+DEFAULT_PREFETCH_RATE = 512 * 1024
+
+# Total bytes of detail pages a prefetch may download
+DEFAULT_PREFETCH_BUDGET = 8 * 1024 * 1024
+
+# Read size for throttled page downloads
+PREFETCH_CHUNK_SIZE = 16 * 1024
+
+# How long claim() waits for an in-flight resolution of the chosen result
+DEFAULT_CLAIM_TIMEOUT = 30
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting bytes per second."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Sustained bytes per second
+            burst: Bucket size in bytes (default: one second of traffic)
+        """
+        self.rate = rate
+        self.capacity = burst if burst is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int, cancel: Optional[threading.Event] = None) -> bool:
+        """
+        Wait until `amount` bytes may be transferred.
+
+        Returns:
+            False if cancelled while waiting
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount or self._tokens >= self.capacity:
+                    self._tokens -= amount
+                    return True
+                delay = (min(amount, self.capacity) - self._tokens) / self.rate
+
+            if cancel is not None:
+                if cancel.wait(delay):
+                    return False
+            else:
+                time.sleep(delay)
+
+
+class Prefetched(NamedTuple):
+    """Outcome of resolving one result ahead of time."""
+
+    page_url: str
+    embed_url: Optional[str]
+    stream_url: Optional[str]
+
+
+class Prefetcher:
+    """
+    Resolves the top results' embeds and stream URLs in the background.
+
+    Detail pages are downloaded through a shared token bucket and byte
+    budget so speculation never saturates the connection. Claiming a result
+    cancels work on the others and waits for the chosen one.
+    """
+
+    def __init__(
+        self,
+        scraper: ContentScraper,
+        page_urls: List[str],
+        count: int = DEFAULT_PREFETCH_COUNT,
+        rate: float = DEFAULT_PREFETCH_RATE,
+        max_bytes: int = DEFAULT_PREFETCH_BUDGET,
+        resolve_streams: bool = True,
+    ):
+        """
+        Initialize the prefetcher (call start() to begin).
+
+        Args:
+            scraper: Scraper whose session and caches are used
+            page_urls: Absolute detail page URLs, most likely picks first
+            count: Number of pages to resolve
+            rate: Bandwidth cap for page downloads in bytes per second
+            max_bytes: Total download budget in bytes
+            resolve_streams: Also resolve stream URLs with yt-dlp
+        """
+        self.scraper = scraper
+        self.page_urls = list(dict.fromkeys(page_urls))[:count]
+        self.bucket = TokenBucket(rate)
+        self.max_bytes = max_bytes
+        self.resolve_streams = resolve_streams
+        self._downloaded = 0
+        self._budget_lock = threading.Lock()
+        self._cancel: Dict[str, threading.Event] = {
+            url: threading.Event() for url in self.page_urls
+        }
+        self._futures: Dict[str, Future] = {}
+        self._executor: Optional[DaemonThreadPool] = None
+
+    def start(self) -> "Prefetcher":
+        """Start resolving in the background."""
+        if self.page_urls:
+            self._executor = DaemonThreadPool(
+                len(self.page_urls), thread_name_prefix="franken-prefetch"
+            )
+            for url in self.page_urls:
+                self._futures[url] = self._executor.submit(self._prefetch, url)
+        return self
+
+    def cancel(self, keep: Optional[str] = None) -> None:
+        """Cancel every resolution except the one for `keep`."""
+        for url, event in self._cancel.items():
+            if url != keep:
+                event.set()
+                future = self._futures.get(url)
+                if future is not None:
+                    future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def claim(self, page_url: str, timeout: float = DEFAULT_CLAIM_TIMEOUT) -> Optional[Prefetched]:
+        """
+        Take the result for a chosen page, cancelling the other resolutions.
+
+        Args:
+            page_url: The detail page the user picked
+            timeout: Seconds to wait if its resolution is still running
+
+        Returns:
+            Prefetched result, or None if the page wasn't prefetched or didn't finish
+        """
+        self.cancel(keep=page_url)
+        future = self._futures.get(page_url)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            self._cancel[page_url].set()
+            return None
+
+    def _prefetch(self, page_url: str) -> Prefetched:
+        cancel = self._cancel[page_url]
+        embed_url = self.scraper.known_embed(page_url, quiet=True)
+        if embed_url is None and not cancel.is_set():
+            content = self._download(page_url, cancel)
+            if content is not None:
+                embed_url = self.scraper.embed_from_content(page_url, content, quiet=True)
+
+        stream_url = None
+        if embed_url and self.resolve_streams and not cancel.is_set():
+            stream_url = self.scraper.resolve_stream_url(embed_url, quiet=True, cancel=cancel)
+        return Prefetched(page_url, embed_url, stream_url)
+
+    def _download(self, page_url: str, cancel: threading.Event) -> Optional[bytes]:
+        """Fetch a page within the bandwidth cap and byte budget."""
+        try:
+            with self.scraper.session.get(page_url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                chunks = []
+                for chunk in response.iter_content(chunk_size=PREFETCH_CHUNK_SIZE):
+                    with self._budget_lock:
+                        self._downloaded += len(chunk)
+                        over_budget = self._downloaded > self.max_bytes
+                    if over_budget or not self.bucket.consume(len(chunk), cancel):
+                        return None
+                    chunks.append(chunk)
+                return b"".join(chunks)
+        except requests.RequestException:
+            return None
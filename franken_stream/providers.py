@@ -2,18 +2,188 @@
 
 import json
 import os
+import re
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
-import requests
 from rich.console import Console
 
+from franken_stream.parsing import Element, compile_selector, scan_elements
+
 console = Console()
 
 # Cache TTL: 24 hours
 CACHE_TTL = 86400
 
+# Keys accepted in a provider_rules entry
+RULE_KEYS = {
+    "result_selector",
+    "title_attr",
+    "href_attr",
+    "iframe_selector",
+    "embed_url_template",
+}
+
+
+class ProviderRules:
+    """
+    Extraction rules for one provider, compiled once from providers.json.
+
+    Example entry under "provider_rules", keyed by host:
+
+        "myflixerz.to": {
+            "result_selector": "h3.film-name a",
+            "title_attr": "title",
+            "iframe_selector": "#iframe-embed",
+            "embed_url_template": "https://vidsrc.example/embed/{id}"
+        }
+
+    embed_url_template builds the embed URL straight from the detail page
+    URL, skipping the page fetch. It may use {url}, {host}, {path}, {slug}
+    (last path segment) and {id} (trailing digits of the slug).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        result_selector: Optional[str] = None,
+        title_attr: Optional[str] = None,
+        href_attr: str = "href",
+        iframe_selector: Optional[str] = None,
+        embed_url_template: Optional[str] = None,
+    ):
+        """
+        Compile a provider's rules.
+
+        Args:
+            host: Provider host the rules apply to (e.g. myflixerz.to)
+            result_selector: CSS selector for result links on search pages
+            title_attr: Attribute holding the title (default: the element text)
+            href_attr: Attribute holding the detail page URL
+            iframe_selector: CSS selector for the player element on detail pages
+            embed_url_template: Template building the embed URL from the page URL
+
+        Raises:
+            ValueError: If a selector or the template is invalid
+        """
+        self.host = host
+        self.title_attr = title_attr
+        self.href_attr = href_attr
+        self.result_selector = self._compile(result_selector)
+        self.iframe_selector = self._compile(iframe_selector)
+        self.embed_url_template = embed_url_template
+        if embed_url_template:
+            # Fail at load time on unknown placeholders
+            self.embed_url(f"https://{host}/movie/example-1")
+
+    @classmethod
+    def from_config(cls, host: str, config: Dict[str, Any]) -> "ProviderRules":
+        """
+        Build rules from a providers.json entry.
+
+        Raises:
+            ValueError: If the entry is not an object or has unknown keys
+        """
+        if not isinstance(config, dict):
+            raise ValueError("rules must be an object")
+        unknown = set(config) - RULE_KEYS
+        if unknown:
+            raise ValueError(f"unknown keys: {', '.join(sorted(unknown))}")
+        return cls(host, **config)
+
+    @staticmethod
+    def _compile(selector: Optional[str]):
+        if not selector:
+            return None
+        compiled = compile_selector(selector)
+        if compiled.tag is None:
+            raise ValueError(f"selector must end in a tag name: {selector!r}")
+        return compiled
+
+    def extract_results(self, markup: Union[str, bytes], limit: int = 20) -> List[Tuple[str, str]]:
+        """
+        Extract (title, url) pairs with the result selector.
+
+        Args:
+            markup: Raw search page
+            limit: Maximum results; the scan stops once reached
+
+        Returns:
+            List of (title, url) tuples, empty without a result selector
+        """
+        if self.result_selector is None:
+            return []
+
+        results: List[Tuple[str, str]] = []
+        seen = set()
+
+        def on_result(element: Element) -> bool:
+            if not self.result_selector.match(element):
+                return False
+            href = element.get(self.href_attr, "")
+            if self.title_attr:
+                title = (element.get(self.title_attr) or "").strip()
+            else:
+                title = element.get_text(strip=True)
+            if title and href and not href.startswith("#") and href not in seen:
+                seen.add(href)
+                results.append((title, href))
+            return len(results) >= limit
+
+        scan_elements(markup, (self.result_selector.tag,), on_result)
+        return results
+
+    def extract_embed(self, markup: Union[str, bytes]) -> Optional[str]:
+        """
+        Return the src of the first element matching the iframe selector.
+
+        Args:
+            markup: Raw detail page
+
+        Returns:
+            The (possibly relative) embed URL, or None
+        """
+        if self.iframe_selector is None:
+            return None
+
+        found: List[str] = []
+
+        def on_player(element: Element) -> bool:
+            src = element.get("src", "")
+            if src and self.iframe_selector.match(element):
+                found.append(src)
+                return True
+            return False
+
+        scan_elements(markup, (self.iframe_selector.tag,), on_player)
+        return found[0] if found else None
+
+    def embed_url(self, page_url: str) -> Optional[str]:
+        """
+        Build the embed URL for a detail page from embed_url_template.
+
+        Raises:
+            ValueError: If the template uses an unknown placeholder
+        """
+        if not self.embed_url_template:
+            return None
+
+        parsed = urlparse(page_url)
+        slug = parsed.path.rstrip("/").rsplit("/", 1)[-1]
+        digits = re.search(r"(\d+)$", slug)
+        try:
+            return self.embed_url_template.format(
+                url=page_url,
+                host=parsed.netloc,
+                path=parsed.path,
+                slug=slug,
+                id=digits.group(1) if digits else slug,
+            )
+        except (KeyError, IndexError) as e:
+            raise ValueError(f"unknown placeholder in embed_url_template: {e}")
+
 
 class ProviderManager:
     """Handles loading, caching, and updating streaming providers."""
@@ -32,6 +202,7 @@ class ProviderManager:
             "Bino-Elgua/stream-providers/main/providers.json"
         )
         self.providers: Optional[Dict[str, Any]] = None
+        self.rules: Dict[str, ProviderRules] = {}
 
     def _ensure_config_dir(self) -> None:
         """Create config directory if it doesn't exist."""
@@ -58,6 +229,7 @@ class ProviderManager:
                     f"[green]✓[/green] Loaded providers from "
                     f"{self.config_file}"
                 )
+                self._compile_rules()
                 return self.providers
             except json.JSONDecodeError as e:
                 console.log(
@@ -65,10 +237,30 @@ class ProviderManager:
                 )
 
         # Download from GitHub or use defaults
-        return self._fetch_or_create_providers()
+        providers = self._fetch_or_create_providers()
+        self._compile_rules()
+        return providers
+
+    def _compile_rules(self) -> None:
+        """Compile the optional provider_rules section, skipping invalid entries."""
+        self.rules = {}
+        config = (self.providers or {}).get("provider_rules") or {}
+        if not isinstance(config, dict):
+            console.log("[yellow]⚠ provider_rules must be an object keyed by host")
+            return
+
+        for key, entry in config.items():
+            # Accept bare hosts as well as full provider URLs as keys
+            host = urlparse(key).netloc or key
+            try:
+                self.rules[host] = ProviderRules.from_config(host, entry)
+            except (TypeError, ValueError) as e:
+                console.log(f"[yellow]⚠ Skipping provider rules for {key}: {e}")
 
     def _fetch_or_create_providers(self) -> Dict[str, Any]:
         """Fetch providers from GitHub or create default ones."""
+        import requests
+
         try:
             console.log("Fetching providers from GitHub...")
             response = requests.get(self.github_url, timeout=10)
@@ -117,12 +309,16 @@ class ProviderManager:
         Returns:
             True if successful, False otherwise.
         """
+        # Only needed here; imported lazily to keep CLI startup fast
+        import requests
+
         try:
             console.log("Updating providers from GitHub...")
             response = requests.get(self.github_url, timeout=10)
             response.raise_for_status()
             self.providers = response.json()
             self._save_providers()
+            self._compile_rules()
             console.log("[green]✓[/green] Providers updated successfully")
             return True
         except requests.RequestException as e:
@@ -141,6 +337,51 @@ class ProviderManager:
         providers = self.load_providers()
         return providers.get("embed_fallbacks", [])
 
+    def get_provider_rules(self) -> Dict[str, ProviderRules]:
+        """Get compiled extraction rules keyed by provider host."""
+        self.load_providers()
+        return self.rules
+
+    def get_mirror_groups(self) -> Dict[str, List[str]]:
+        """
+        Get the optional mirror_groups section: search bases that serve the
+        same catalogue, keyed by group name.
+
+        Example:
+
+            "mirror_groups": {
+                "myflixer": [
+                    "https://myflixerz.to/search/",
+                    "https://myflixerz.me/search/",
+                    "https://myflixer.cx/search/"
+                ]
+            }
+
+        Invalid groups, and bases already listed in an earlier group, are
+        skipped with a warning.
+        """
+        config = self.load_providers().get("mirror_groups") or {}
+        if not isinstance(config, dict):
+            console.log("[yellow]⚠ mirror_groups must be an object keyed by group name")
+            return {}
+
+        groups: Dict[str, List[str]] = {}
+        grouped = set()
+        for name, bases in config.items():
+            if not isinstance(bases, list) or not all(isinstance(b, str) for b in bases):
+                console.log(f"[yellow]⚠ Skipping mirror group {name}: must be a list of URLs")
+                continue
+            mirrors = []
+            for base in bases:
+                if base in grouped:
+                    console.log(f"[yellow]⚠ {base} is in more than one mirror group")
+                    continue
+                grouped.add(base)
+                mirrors.append(base)
+            if len(mirrors) > 1:
+                groups[name] = mirrors
+        return groups
+
     def get_legal_sources(self) -> List[str]:
         """Get list of legal streaming sources."""
         providers = self.load_providers()
@@ -0,0 +1,228 @@
+"""Stream URL resolution and downloads through yt-dlp."""
+
+import importlib
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from rich.console import Console
+
+console = Console()
+
+# Seconds before an extraction is abandoned
+DEFAULT_RESOLVE_TIMEOUT = 30
+
+
+@lru_cache(maxsize=None)
+def _load_yt_dlp():
+    """Import yt_dlp on first use (it is slow to import), or None if missing."""
+    try:
+        return importlib.import_module("yt_dlp")
+    except ImportError:
+        return None
+
+
+class _SilentLogger:
+    """yt-dlp logger that drops everything; failures surface as a None result."""
+
+    def debug(self, msg: str) -> None:
+        pass
+
+    def info(self, msg: str) -> None:
+        pass
+
+    def warning(self, msg: str) -> None:
+        pass
+
+    def error(self, msg: str) -> None:
+        pass
+
+
+class YtDlpResolver:
+    """
+    Resolves page and embed URLs to direct media URLs with yt-dlp.
+
+    Uses yt-dlp's Python API in-process: the module is imported once and
+    YoutubeDL instances (with their loaded extractors) are pooled and reused
+    across calls, instead of paying interpreter startup and extractor
+    loading for every `yt-dlp` process. Falls back to the `yt-dlp`
+    executable when the module is not importable.
+    """
+
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        timeout: float = DEFAULT_RESOLVE_TIMEOUT,
+        in_process: bool = True,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            proxy: Optional proxy URL passed to yt-dlp
+            user_agent: User-Agent header for extraction requests
+            timeout: Seconds before an extraction is abandoned
+            in_process: Use the Python API when available (False forces subprocesses)
+        """
+        self.proxy = proxy
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.in_process = in_process
+        # Idle YoutubeDL instances; each one is used by one thread at a time
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+
+    @property
+    def module(self):
+        """The yt_dlp module, or None when running out of process."""
+        return _load_yt_dlp() if self.in_process else None
+
+    def available(self) -> bool:
+        """Return True if yt-dlp can be used in-process or as an executable."""
+        return self.module is not None or shutil.which("yt-dlp") is not None
+
+    def _options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {
+            "format": "best",
+            "noplaylist": True,
+            "quiet": True,
+            "no_warnings": True,
+            "skip_download": True,
+            "socket_timeout": self.timeout,
+            # quiet still prints ERROR lines to stderr, over the selection prompt
+            "logger": _SilentLogger(),
+        }
+        if self.proxy:
+            options["proxy"] = self.proxy
+        if self.user_agent:
+            options["http_headers"] = {"User-Agent": self.user_agent}
+        return options
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self.module.YoutubeDL(self._options())
+
+    def get_url(self, target: str, cancel: Optional[threading.Event] = None) -> Optional[str]:
+        """
+        Resolve a URL (or a yt-dlp search like "ytsearch:...") to a media URL.
+
+        In-process extraction runs on a daemon thread. It cannot be
+        interrupted, so once the timeout expires or the cancel event is set
+        it is abandoned: the call returns None at once and the YoutubeDL
+        instance rejoins the pool when the extraction finally ends.
+
+        Args:
+            target: Page/embed URL or yt-dlp search query
+            cancel: Event that aborts the resolution when set
+
+        Returns:
+            Direct media URL, or None if extraction failed or was cancelled
+        """
+        if cancel is not None and cancel.is_set():
+            return None
+        if self.module is None:
+            return self._get_url_subprocess(target, cancel)
+
+        ydl = self._acquire()
+        done = threading.Event()
+        extracted: Dict[str, Any] = {}
+
+        def extract() -> None:
+            try:
+                extracted["info"] = ydl.extract_info(target, download=False)
+            except Exception:
+                # Extractor errors; the instance itself stays usable
+                pass
+            finally:
+                self._idle.put(ydl)
+                done.set()
+
+        threading.Thread(target=extract, name="franken-resolve", daemon=True).start()
+        deadline = time.monotonic() + self.timeout
+        while not done.wait(0.25):
+            if time.monotonic() > deadline or (cancel is not None and cancel.is_set()):
+                return None
+
+        if cancel is not None and cancel.is_set():
+            return None
+        return self._media_url(extracted.get("info"))
+
+    @staticmethod
+    def _media_url(info: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Pick the URL yt-dlp --get-url would print from extracted info."""
+        if not info:
+            return None
+        if info.get("entries") is not None:
+            # Search results and playlists: first entry
+            entries = [entry for entry in info["entries"] if entry]
+            return YtDlpResolver._media_url(entries[0]) if entries else None
+        if info.get("url"):
+            return info["url"]
+        formats = info.get("requested_formats") or []
+        return formats[0].get("url") if formats else None
+
+    def _get_url_subprocess(
+        self, target: str, cancel: Optional[threading.Event] = None
+    ) -> Optional[str]:
+        """Resolve with the yt-dlp executable; killable through the cancel event."""
+        try:
+            process = subprocess.Popen(
+                ["yt-dlp", "-f", "best", "--no-playlist", "--get-url", target],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except FileNotFoundError:
+            return None
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                stdout, _ = process.communicate(timeout=0.25)
+                break
+            except subprocess.TimeoutExpired:
+                if time.monotonic() > deadline or (cancel is not None and cancel.is_set()):
+                    process.kill()
+                    process.communicate()
+                    return None
+
+        if process.returncode != 0 or not stdout.strip():
+            return None
+        return stdout.strip().split("\n")[0]
+
+    def download(self, url: str, output_path: str) -> bool:
+        """
+        Download a video into a directory, showing yt-dlp's progress.
+
+        Args:
+            url: Video URL
+            output_path: Output directory
+
+        Returns:
+            True if the download completed
+
+        Raises:
+            FileNotFoundError: If yt-dlp is neither importable nor installed
+        """
+        template = f"{output_path}/%(title)s.%(ext)s"
+        if self.module is None:
+            result = subprocess.run(["yt-dlp", "-o", template, url], timeout=3600)
+            return result.returncode == 0
+
+        options = {"outtmpl": template, "socket_timeout": self.timeout}
+        if self.proxy:
+            options["proxy"] = self.proxy
+        if self.user_agent:
+            options["http_headers"] = {"User-Agent": self.user_agent}
+        try:
+            with self.module.YoutubeDL(options) as ydl:
+                return ydl.download([url]) == 0
+        except Exception as e:
+            console.log(f"[red]✗[/red] yt-dlp error: {e}")
+            return False
@@ -2,13 +2,53 @@
 
 import re
 import subprocess
-from typing import List, Optional, Tuple
-from urllib.parse import quote
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
+from franken_stream.adapter import CachingAdapter
+from franken_stream.cache import ResolutionCache, ResponseCache, SearchCache, SelectorProfile
+from franken_stream.defaults import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_POOL_HOSTS,
+    DEFAULT_POOL_PER_HOST,
+    DEFAULT_PROVIDER_TIMEOUT,
+)
+from franken_stream.health import OPEN, ProviderHealth
+from franken_stream.index import INDEX_PROVIDER, TitleIndex
+from franken_stream.parsing import (
+    Element,
+    compile_selector,
+    make_soup,
+    response_markup,
+    scan_elements,
+)
+from franken_stream.pool import DaemonThreadPool
+from franken_stream.providers import ProviderRules
+from franken_stream.ranking import rank_results
+from franken_stream.resolver import YtDlpResolver
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 console = Console()
 
 # Default User-Agent to avoid blocking
@@ -27,144 +67,1050 @@ EMBED_PATTERNS = [
     (r'data-url=["\']([^"\']+)["\']', "data-url attribute"),
 ]
 
+# Search result selectors in priority order: (CSS selector, description)
+RESULT_SELECTORS = [
+    ("a.film-name", "film-name"),  # myflixerz, cineby
+    ("a.title", "title"),
+    ("a[href*='/watch/']", "watch link"),
+    ("a[href*='/movie/']", "movie link"),
+    ("a[href*='/embed/']", "embed link"),
+    ("h3 a", "heading link"),
+    ("div.card a", "card link"),
+    ("div.film-poster a", "poster link"),
+    (".mli-info a", "mli-info link"),
+]
+
+# Player iframe selectors on detail pages, in priority order
+EMBED_IFRAME_SELECTORS = [
+    ".player-container iframe",
+    "#player iframe",
+    "#watch-iframe iframe",
+    "iframe[src*='embed']",
+    "iframe[src*='player']",
+    "iframe[src*='watch']",
+]
+
+# Substrings that mark an iframe src as a likely player
+IFRAME_KEYWORDS = ["embed", "player", "watch", "vid", "m3u8", "mp4"]
+
+# Substrings that mark a <source> inside a <video> as a stream
+SOURCE_KEYWORDS = [".mp4", ".m3u8", "stream"]
+
+# Substrings that mark an anchor href as a link straight to a player or stream
+EMBED_LINK_KEYWORDS = ["/embed/", ".m3u8", ".mp4"]
+
+# Maximum results kept per provider
+MAX_RESULTS = 20
+
+# Anchor texts that indicate navigation rather than content
+NAV_WORDS = ["home", "search", "menu", "nav", "login", "sign"]
+
+# Direct media URLs, preferred over the generic embed patterns
+DIRECT_URL_PATTERN = r'(https?://[^\s\'"]+\.(?:m3u8|mp4))'
+DIRECT_URL_INDEX = len(EMBED_PATTERNS)
+
+# All regex fallbacks combined into one pattern so a page is scanned once.
+# Each alternative sits inside a lookahead, so overlapping matches (e.g. an
+# HLS src inside an iframe tag) are still found, and has exactly one group:
+# group i + 1 belongs to EMBED_PATTERNS[i], the last one to DIRECT_URL_PATTERN.
+_EMBED_SCAN_SOURCE = "(?=" + "|".join(
+    [pattern for pattern, _ in EMBED_PATTERNS] + [DIRECT_URL_PATTERN]
+) + ")"
+_EMBED_SCAN = re.compile(_EMBED_SCAN_SOURCE)
+_EMBED_SCAN_BYTES = re.compile(_EMBED_SCAN_SOURCE.encode())
+
+DUCKDUCKGO_URL = "https://duckduckgo.com/html/"
+
+# Connection pre-warming: hosts warmed at once, and the HEAD timeout
+DEFAULT_PREWARM_HOSTS = 6
+PREWARM_TIMEOUT = 5
+
+# Provider probing: statuses meaning "HEAD not supported", and the size of
+# the ranged GET used instead
+HEAD_UNSUPPORTED_STATUSES = (405, 501)
+PROBE_RANGE_BYTES = 1024
+
+# Mirror hedging: a mirror group's next mirror is started once the running
+# ones have been silent this long. With health history the delay is the
+# mirror's average latency times HEDGE_LATENCY_FACTOR, within these bounds.
+DEFAULT_HEDGE_DELAY = 2.0
+MIN_HEDGE_DELAY = 0.3
+HEDGE_LATENCY_FACTOR = 2
+
+
+class ProviderResults(NamedTuple):
+    """Results from a single provider, emitted as soon as it finishes."""
+
+    provider: str
+    results: List[Tuple[str, str]]
+    elapsed: float
+    error: Optional[str] = None
+    cached: bool = False  # served without a live request (result or HTTP cache)
+
+
+class ProbeResult(NamedTuple):
+    """One timed request against a provider URL."""
+
+    ok: bool
+    status: Optional[int]
+    method: str  # HEAD, or GET when the ranged fallback was used
+    ttfb: float  # seconds until the response headers arrived
+    total: float  # seconds including the (partial) body transfer
+    error: Optional[str] = None
+
+
+class ProviderStats(NamedTuple):
+    """Latency summary of several probes against one provider URL."""
+
+    url: str
+    samples: int
+    successes: int
+    p50: Optional[float]
+    p95: Optional[float]
+    ttfb_p50: Optional[float]
+    transfer_p50: Optional[float]
+    method: Optional[str]
+    status: Optional[int]
+    error: Optional[str]
+
+    @property
+    def healthy(self) -> bool:
+        return self.successes > 0
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile, or None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))  # ceil
+    return ordered[int(rank) - 1]
+
+
+class EmbedRule(NamedTuple):
+    """Scores one kind of embed candidate; lower scores win."""
+
+    score: int
+    tag: str
+    attr: str
+    label: str
+    matches: Callable[[Element, str], bool]
+
+
+def _build_embed_rules() -> List[EmbedRule]:
+    """
+    Build the embed candidate scoring table.
+
+    Each element is scored by the first rule (in table order) for its tag that
+    matches it; the lowest score wins and ties go to the earliest element, so
+    adding a strategy means adding a row, not another pass over the page.
+    """
+    rules = [
+        EmbedRule(
+            score, "iframe", "src", "iframe embed",
+            lambda element, _, selector=selector: selector.match(element),
+        )
+        for score, selector in enumerate(map(compile_selector, EMBED_IFRAME_SELECTORS))
+    ]
+    score = len(rules)
+    rules += [
+        EmbedRule(
+            score, "iframe", "src", "iframe embed",
+            lambda _, url: any(keyword in url for keyword in IFRAME_KEYWORDS),
+        ),
+        # Video tags and the stream sources inside them share a score, so the
+        # first one in the document wins
+        EmbedRule(score + 1, "video", "src", "video tag", lambda _, url: True),
+        EmbedRule(
+            score + 1, "source", "src", "video source",
+            lambda element, url: any(keyword in url for keyword in SOURCE_KEYWORDS)
+            and any(ancestor.tag == "video" for ancestor in element.ancestors),
+        ),
+        EmbedRule(
+            score + 2, "a", "href", "embed link",
+            lambda _, url: any(keyword in url for keyword in EMBED_LINK_KEYWORDS),
+        ),
+    ]
+    return rules
+
+
+EMBED_RULES = _build_embed_rules()
+
+
+def _is_valid_result(text: str, href: str) -> bool:
+    """Filter out navigation links and empty anchors."""
+    return bool(
+        text
+        and len(text) > 2
+        and len(text) < 100  # Avoid nav menu text
+        and href
+        and not href.startswith("#")
+        and not any(bad in text.lower() for bad in NAV_WORDS)
+    )
+
+
+def _scan_embed_patterns(
+    markup: Union[str, bytes], first_only: bool = False, stop_on_direct: bool = False
+) -> Dict[int, List[str]]:
+    """
+    Run every regex fallback over the markup in a single pass.
+
+    Args:
+        markup: Raw page text or bytes (bytes are scanned without decoding)
+        first_only: Keep only the first match of each pattern
+        stop_on_direct: Stop scanning at the first direct media URL
+
+    Returns:
+        Mapping of pattern index (EMBED_PATTERNS order, then DIRECT_URL_INDEX)
+        to matches in document order
+    """
+    regex = _EMBED_SCAN_BYTES if isinstance(markup, bytes) else _EMBED_SCAN
+    found: Dict[int, List[str]] = {}
+
+    for match in regex.finditer(markup):
+        index = match.lastindex - 1
+        if first_only and index in found:
+            continue
+
+        value = match.group(match.lastindex)
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", "replace")
+        found.setdefault(index, []).append(value)
+
+        if stop_on_direct and index == DIRECT_URL_INDEX:
+            break
+
+    return found
+
 
 class ContentScraper:
     """Scrapes streaming content from various providers."""
 
-    def __init__(self, proxy: Optional[str] = None, user_agent: Optional[str] = None):
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        result_cache: Optional[SearchCache] = None,
+        resolution_cache: Optional[ResolutionCache] = None,
+        selector_profile: Optional[SelectorProfile] = None,
+        provider_rules: Optional[Dict[str, ProviderRules]] = None,
+        health: Optional[ProviderHealth] = None,
+        mirror_groups: Optional[Dict[str, List[str]]] = None,
+        title_index: Optional[TitleIndex] = None,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+        pool_per_host: int = DEFAULT_POOL_PER_HOST,
+    ):
         """
         Initialize scraper with optional proxy and custom User-Agent.
 
         Args:
             proxy: Optional proxy URL (e.g., http://proxy.example.com:8080)
             user_agent: Custom User-Agent header
+            cache: Optional on-disk response cache placed in front of the session
+            result_cache: Optional cache of extracted results per provider and query
+            resolution_cache: Optional cache of page → embed → stream URL resolutions
+            selector_profile: Optional per-host record of the result selector that works
+            provider_rules: Compiled per-provider extraction rules keyed by host
+            health: Optional provider health store used to order and skip providers
+            mirror_groups: Search bases serving the same catalogue, keyed by group
+                name; each group is queried once, with hedged requests
+            title_index: Optional local index of every title seen, searched first
+            pool_hosts: Number of hosts whose keep-alive connections are pooled
+            pool_per_host: Keep-alive connections pooled per host
         """
         self.proxy = proxy
         self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.cache = cache
+        self.result_cache = result_cache
+        self.resolution_cache = resolution_cache
+        self.selector_profile = selector_profile
+        self.provider_rules = provider_rules or {}
+        self.health = health
+        self.title_index = title_index
+        self.mirror_group: Dict[str, str] = {
+            base_url: name
+            for name, mirrors in (mirror_groups or {}).items()
+            for base_url in mirrors
+        }
+        self.resolver = YtDlpResolver(proxy=proxy)
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": self.user_agent})
 
+        # One pool per host, large enough that warmed connections survive
+        # until the real requests use them
+        pool = {"pool_connections": pool_hosts, "pool_maxsize": pool_per_host}
+        adapter = CachingAdapter(cache, **pool) if cache is not None else HTTPAdapter(**pool)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         if proxy:
             self.session.proxies = {"http": proxy, "https": proxy}
 
     def search(
-        self, query: str, base_urls: List[str], verbose: bool = False
+        self,
+        query: str,
+        base_urls: List[str],
+        verbose: bool = False,
+        concurrent: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        provider_timeout: float = DEFAULT_PROVIDER_TIMEOUT,
+        overall_timeout: Optional[float] = None,
+        on_results: Optional[Callable[[ProviderResults], None]] = None,
+        refresh_cached: bool = True,
+        rank: bool = True,
     ) -> List[Tuple[str, str]]:
         """
         Search for content across multiple providers.
 
+        In concurrent mode the providers are queried from a bounded worker
+        pool, so wall-clock time tracks the slowest live provider instead of
+        the sum of all of them. Results are merged in the configured provider
+        order, then (with rank) ordered by relevance to the query, with
+        near-duplicates from different providers collapsed into one entry.
+
         Args:
             query: Search query (e.g., "Inception")
             base_urls: List of base URLs to search
             verbose: Print detailed debug info
+            concurrent: Query providers in parallel instead of one at a time
+            max_workers: Maximum number of providers queried at once
+            provider_timeout: Deadline in seconds for a single provider
+            overall_timeout: Deadline in seconds for the whole search (optional)
+            on_results: Callback invoked with each ProviderResults batch as
+                soon as its provider finishes
+            refresh_cached: Re-query providers served from the search result
+                cache in the background
+            rank: Rank and deduplicate results across providers (see ranking.py)
 
         Returns:
             List of (title, url) tuples
         """
+        collected = {}
+        for batch in self.iter_search(
+            query,
+            base_urls,
+            verbose=verbose,
+            concurrent=concurrent,
+            max_workers=max_workers,
+            provider_timeout=provider_timeout,
+            overall_timeout=overall_timeout,
+            refresh_cached=refresh_cached,
+        ):
+            collected[batch.provider] = batch.results
+            if on_results:
+                on_results(batch)
+        return self._merge_results(query, base_urls, collected, rank)
+
+    def _merge_results(
+        self,
+        query: str,
+        base_urls: List[str],
+        collected: Dict[str, List[Tuple[str, str]]],
+        rank: bool = True,
+    ) -> List[Tuple[str, str]]:
+        """Merge per-provider results in configured order, ranked unless rank is False."""
+        if rank:
+            batches = [(base_url, collected.get(base_url, [])) for base_url in base_urls]
+            batches.append((INDEX_PROVIDER, collected.get(INDEX_PROVIDER, [])))
+            return self.rank(query, batches)
+
         results = []
+        for base_url in base_urls:
+            results.extend(collected.get(base_url, []))
+        # Without ranking, index hits would only duplicate live results
+        return results or collected.get(INDEX_PROVIDER, [])
+
+    def rank(
+        self, query: str, batches: List[Tuple[str, List[Tuple[str, str]]]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Rank and deduplicate results across providers.
+
+        Provider reputation comes from the health store when one is
+        configured.
+
+        Args:
+            query: Search query
+            batches: (provider, results) pairs in configured provider order
+
+        Returns:
+            List of (title, url) tuples, best match first
+        """
+        reputation = None
+        if self.health is not None:
+            reputation = {record.provider: record.success_rate for record in self.health.records()}
+        return [(result.title, result.url) for result in rank_results(query, batches, reputation)]
+
+    def iter_search(
+        self,
+        query: str,
+        base_urls: List[str],
+        verbose: bool = False,
+        concurrent: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        provider_timeout: float = DEFAULT_PROVIDER_TIMEOUT,
+        overall_timeout: Optional[float] = None,
+        refresh_cached: bool = True,
+    ) -> Iterator[ProviderResults]:
+        """
+        Search providers and yield each provider's results as it finishes.
+
+        Batches arrive in completion order, so callers can render the first
+        hits while slower mirrors are still loading. Failed providers yield a
+        batch with no results and the error message set. Closing the iterator
+        early abandons any providers that are still pending.
+
+        When a title index is configured, matching titles seen in earlier
+        searches are yielded as one batch from INDEX_PROVIDER ahead of the
+        live batches, and every live batch is added to the index. In
+        concurrent mode the index is read (and, on first use, loaded) while
+        the live queries are already in flight.
+
+        When a search result cache is configured, providers with a fresh
+        cached entry for the normalized query are yielded first, without any
+        network traffic, and optionally refreshed in the background.
+
+        When a health store is configured, live providers are queried
+        healthiest first and providers with an open circuit are skipped,
+        yielding an error batch instead of costing a timeout. Pages served
+        by the HTTP response cache are flagged as cached and not recorded.
+
+        Mirrors of one site (see mirror_groups) are searched as one unit:
+        the healthiest mirror first, hedged with the next one if it is slow
+        or fails. Only the first answer is kept, so a group yields at most
+        one batch of results, plus error batches for mirrors that failed.
+
+        Args:
+            query: Search query (e.g., "Inception")
+            base_urls: List of base URLs to search
+            verbose: Print detailed debug info
+            concurrent: Query providers in parallel instead of one at a time
+            max_workers: Maximum number of providers queried at once
+            provider_timeout: Deadline in seconds for a single provider
+            overall_timeout: Deadline in seconds for the whole search (optional)
+            refresh_cached: Re-query cached providers in the background
+
+        Yields:
+            ProviderResults batches
+        """
         encoded_query = quote(query.replace(" ", "+"))
 
-        for base_url in base_urls:
-            try:
-                full_url = f"{base_url}{encoded_query}"
-                if verbose:
-                    console.log(f"[cyan]→ Searching: {full_url}")
-                else:
-                    console.log(f"Searching: {full_url[:60]}...")
-                
-                response = self.session.get(full_url, timeout=10)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, "html.parser")
-                items = self._extract_results(soup, verbose=verbose)
-                results.extend(items)
-                
+        early, cached_bases, units = self._plan_search(query, base_urls, verbose)
+        yield from early
+        if cached_bases and refresh_cached:
+            self._refresh_in_background(query, cached_bases, max_workers, provider_timeout)
+
+        local_search = None
+        if self.title_index is not None:
+            local_search = partial(self._search_index, query, base_urls, verbose)
+
+        if concurrent and units:
+            batches = self._iter_concurrent(
+                encoded_query,
+                units,
+                verbose,
+                max_workers,
+                provider_timeout,
+                overall_timeout,
+                local_search,
+            )
+        else:
+            batches = self._iter_sequential(
+                encoded_query, units, verbose, provider_timeout, overall_timeout, local_search
+            )
+
+        try:
+            for batch in batches:
+                if batch.provider != INDEX_PROVIDER:
+                    self._record_batch(query, batch, verbose)
+                yield batch
+        finally:
+            if self.title_index is not None:
+                self.title_index.save_later()
+
+    def _plan_search(
+        self, query: str, base_urls: List[str], verbose: bool = False
+    ) -> Tuple[List[ProviderResults], List[str], List[List[str]]]:
+        """
+        Decide which providers a search has to query live.
+
+        Providers (or mirror groups) with fresh cached results are answered
+        from the search result cache, and providers with an open circuit
+        get an error batch. The rest are ranked healthiest first and
+        grouped into search units (see _mirror_units).
+
+        Returns:
+            Tuple of (batches answered without the network, bases served
+            from the result cache, live search units)
+        """
+        early: List[ProviderResults] = []
+        live_bases = base_urls
+        cached_bases: List[str] = []
+        if self.result_cache is not None:
+            live_bases = []
+            served_groups: Set[str] = set()
+            for base_url in base_urls:
+                group = self.mirror_group.get(base_url)
+                if group in served_groups:
+                    continue
+                hit = self.result_cache.get(base_url, query)
+                if hit is None:
+                    live_bases.append(base_url)
+                    continue
+                if group is not None:
+                    served_groups.add(group)
+                cached_bases.append(base_url)
                 if verbose:
-                    console.log(f"[green]✓ Found {len(items)} results from {base_url}")
-                else:
-                    console.log(f"[green]✓[/green] Found {len(items)} results")
+                    console.log(f"[green]✓ {len(hit)} cached results from {base_url}")
+                early.append(ProviderResults(base_url, hit, 0.0, cached=True))
+
+            live_bases = [
+                base_url
+                for base_url in live_bases
+                if self.mirror_group.get(base_url) not in served_groups
+            ]
 
-            except requests.exceptions.ConnectionError as e:
+        if self.health is not None:
+            allowed = []
+            for base_url in live_bases:
+                if self.health.allow(base_url):
+                    allowed.append(base_url)
+                    continue
                 if verbose:
-                    console.log(f"[yellow]⚠ Connection failed for {base_url}: {e}")
-                # Silently skip connection errors
-            except requests.exceptions.Timeout:
+                    console.log(f"[yellow]⚠ Skipping {base_url}: circuit open")
+                early.append(ProviderResults(base_url, [], 0.0, "circuit open"))
+            live_bases = self.health.rank(allowed)
+
+        return early, cached_bases, self._mirror_units(live_bases)
+
+    def _record_batch(self, query: str, batch: ProviderResults, verbose: bool = False) -> None:
+        """Feed a live provider batch to the health store, result cache and title index."""
+        # Pages replayed by the HTTP cache say nothing about the provider
+        if self.health is not None and not batch.cached:
+            if batch.error is None:
+                self.health.record_success(batch.provider, batch.elapsed)
+            else:
+                self.health.record_failure(batch.provider)
+
+        if batch.error is None:
+            if self.result_cache is not None:
+                self.result_cache.store(batch.provider, query, batch.results)
+            if self.title_index is not None:
+                self.title_index.add(batch.provider, batch.results)
+            if verbose:
+                console.log(f"[green]✓ Found {len(batch.results)} results from {batch.provider}")
+            else:
+                console.log(f"[green]✓[/green] Found {len(batch.results)} results")
+
+    def prewarm(
+        self,
+        urls: List[str],
+        limit: int = DEFAULT_PREWARM_HOSTS,
+        timeout: float = PREWARM_TIMEOUT,
+    ) -> Optional[threading.Thread]:
+        """
+        Open pooled keep-alive connections to the hosts of some URLs.
+
+        DNS lookup, TCP and TLS handshakes happen on a daemon thread (one
+        HEAD per host origin), so a later search or page fetch to the same
+        host reuses a ready connection. Search bases are ranked by provider
+        health first and hosts with an open circuit are skipped.
+
+        Args:
+            urls: Search bases or page URLs, most important first
+            limit: Maximum number of hosts to warm
+            timeout: Per-request timeout in seconds
+
+        Returns:
+            The warming thread, or None if there was nothing to warm
+        """
+        if self.health is not None:
+            records = {record.provider: record for record in self.health.records()}
+            urls = [
+                url
+                for url in self.health.rank(urls)
+                if url not in records or records[url].state != OPEN
+            ]
+
+        origins: List[str] = []
+        for url in urls:
+            parsed = urlparse(url)
+            if parsed.scheme not in ("http", "https") or not parsed.netloc:
+                continue
+            origin = f"{parsed.scheme}://{parsed.netloc}/"
+            if origin not in origins:
+                origins.append(origin)
+            if len(origins) >= limit:
+                break
+
+        if not origins:
+            return None
+
+        def warm(origin: str) -> None:
+            try:
+                self.session.head(origin, timeout=timeout, allow_redirects=False)
+            except requests.RequestException:
+                pass
+
+        def run() -> None:
+            with DaemonThreadPool(len(origins), thread_name_prefix="franken-prewarm") as pool:
+                for origin in origins:
+                    pool.submit(warm, origin)
+
+        thread = threading.Thread(target=run, name="franken-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def _refresh_in_background(
+        self, query: str, base_urls: List[str], max_workers: int, provider_timeout: float
+    ) -> threading.Thread:
+        """
+        Re-query providers whose results were served from the search cache.
+
+        Runs quietly on a daemon thread and only updates the cache, so the
+        caller keeps rendering cached results without waiting on the network.
+        """
+        encoded_query = quote(query.replace(" ", "+"))
+
+        def refresh(base_url: str) -> None:
+            try:
+                items, _ = self._search_provider(
+                    base_url, encoded_query, provider_timeout, quiet=True
+                )
+            except Exception:
+                return
+            self.result_cache.store(base_url, query, items)
+            if self.title_index is not None:
+                self.title_index.add(base_url, items)
+
+        def run() -> None:
+            with DaemonThreadPool(
+                min(max_workers, len(base_urls)), thread_name_prefix="franken-refresh"
+            ) as pool:
+                for base_url in base_urls:
+                    pool.submit(refresh, base_url)
+            if self.title_index is not None:
+                self.title_index.save_later()
+
+        thread = threading.Thread(target=run, name="franken-refresh", daemon=True)
+        thread.start()
+        return thread
+
+    def _mirror_units(self, base_urls: List[str]) -> List[List[str]]:
+        """
+        Group search bases into search units.
+
+        Each mirror group becomes one unit at the position of its first
+        member, keeping the members' relative order (healthiest first once
+        ranked); other bases are units of their own.
+        """
+        units: List[List[str]] = []
+        group_units: Dict[str, List[str]] = {}
+        for base_url in base_urls:
+            group = self.mirror_group.get(base_url)
+            if group is None:
+                units.append([base_url])
+            elif group in group_units:
+                group_units[group].append(base_url)
+            else:
+                group_units[group] = [base_url]
+                units.append(group_units[group])
+        return units
+
+    def _search_unit(
+        self, unit: List[str], encoded_query: str, timeout: float, verbose: bool
+    ) -> List[ProviderResults]:
+        """Search a single provider, or a mirror group with hedging."""
+        if len(unit) > 1:
+            return self._search_hedged(unit, encoded_query, timeout, verbose)
+
+        base_url = unit[0]
+        start = time.monotonic()
+        try:
+            items, from_cache = self._search_provider(base_url, encoded_query, timeout, verbose)
+        except Exception as e:
+            self._log_search_error(base_url, e, verbose)
+            return [ProviderResults(base_url, [], time.monotonic() - start, str(e))]
+        return [ProviderResults(base_url, items, time.monotonic() - start, cached=from_cache)]
+
+    def _hedge_delay(self, base_url: str) -> float:
+        """Seconds to wait on a mirror before hedging with the next one."""
+        record = self.health.get(base_url) if self.health is not None else None
+        if record is None or record.latency is None:
+            return DEFAULT_HEDGE_DELAY
+        delay = record.latency * HEDGE_LATENCY_FACTOR
+        return min(max(delay, MIN_HEDGE_DELAY), DEFAULT_HEDGE_DELAY)
+
+    def _search_hedged(
+        self, mirrors: List[str], encoded_query: str, timeout: float, verbose: bool
+    ) -> List[ProviderResults]:
+        """
+        Query a mirror group, starting the next mirror only when needed.
+
+        The first mirror is queried alone. The next one starts when the
+        running mirrors have been silent for the hedge delay, or at once
+        when one fails. The first successful answer wins and the others are
+        abandoned without being counted.
+
+        Returns:
+            Error batches for mirrors that failed, then the winning batch
+            (if any mirror answered within the timeout)
+        """
+        batches: List[ProviderResults] = []
+        started: Dict[Future, Tuple[str, float]] = {}
+        waiting = list(mirrors)
+        pending: Set[Future] = set()
+        deadline = time.monotonic() + timeout
+        next_hedge = 0.0
+
+        executor = DaemonThreadPool(len(mirrors), thread_name_prefix="franken-hedge")
+        try:
+            while waiting or pending:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+
+                if waiting and (not pending or now >= next_hedge):
+                    base_url = waiting.pop(0)
+                    if verbose and pending:
+                        console.log(f"[cyan]  Hedging with mirror {base_url}")
+                    future = executor.submit(
+                        self._search_provider, base_url, encoded_query, deadline - now, verbose
+                    )
+                    started[future] = (base_url, now)
+                    pending.add(future)
+                    next_hedge = now + self._hedge_delay(base_url)
+                    continue
+
+                wait_until = min(deadline, next_hedge) if waiting else deadline
+                done, pending = wait(
+                    pending, timeout=max(0.0, wait_until - now), return_when=FIRST_COMPLETED
+                )
+                winner = None
+                for future in done:
+                    base_url, start = started[future]
+                    elapsed = time.monotonic() - start
+                    try:
+                        items, from_cache = future.result()
+                    except Exception as e:
+                        self._log_search_error(base_url, e, verbose)
+                        batches.append(ProviderResults(base_url, [], elapsed, str(e)))
+                        next_hedge = 0.0  # replace a failed mirror right away
+                    else:
+                        if winner is None:
+                            winner = ProviderResults(
+                                base_url, items, elapsed, cached=from_cache
+                            )
+                if winner is not None:
+                    batches.append(winner)
+                    return batches
+
+            for future in pending:
+                base_url, start = started[future]
                 if verbose:
                     console.log(f"[yellow]⚠ Timeout searching {base_url}")
-                # Silently skip timeouts
-            except requests.exceptions.HTTPError as e:
-                if verbose:
-                    console.log(f"[yellow]⚠ HTTP error {e.response.status_code} for {base_url}")
-                # Silently skip HTTP errors
-            except requests.RequestException as e:
-                if verbose:
-                    console.log(f"[yellow]⚠[/yellow] Error searching {base_url}: {e}")
-            except Exception as e:
+                batches.append(
+                    ProviderResults(
+                        base_url, [], time.monotonic() - start, "provider deadline exceeded"
+                    )
+                )
+            return batches
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _search_index(
+        self, query: str, base_urls: List[str], verbose: bool
+    ) -> Optional[ProviderResults]:
+        """Look the query up in the title index, or None without hits."""
+        start = time.monotonic()
+        hits = self.title_index.search(query, providers=base_urls)
+        if not hits:
+            return None
+        if verbose:
+            console.log(f"[green]✓ {len(hits)} results from the local title index")
+        return ProviderResults(INDEX_PROVIDER, hits, time.monotonic() - start, cached=True)
+
+    def _iter_sequential(
+        self,
+        encoded_query: str,
+        units: List[List[str]],
+        verbose: bool,
+        provider_timeout: float,
+        overall_timeout: Optional[float],
+        local_search: Optional[Callable[[], Optional[ProviderResults]]] = None,
+    ) -> Iterator[ProviderResults]:
+        """
+        Query providers one after another, honouring the overall deadline.
+
+        The local_search batch, if any, is yielded before the first query.
+        """
+        if local_search is not None:
+            batch = local_search()
+            if batch is not None:
+                yield batch
+
+        deadline = time.monotonic() + overall_timeout if overall_timeout else None
+
+        for unit in units:
+            timeout = provider_timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if verbose:
+                        console.log(
+                            "[yellow]⚠ Search deadline reached, skipping remaining providers"
+                        )
+                    break
+                timeout = min(timeout, remaining)
+
+            yield from self._search_unit(unit, encoded_query, timeout, verbose)
+
+    def _iter_concurrent(
+        self,
+        encoded_query: str,
+        units: List[List[str]],
+        verbose: bool,
+        max_workers: int,
+        provider_timeout: float,
+        overall_timeout: Optional[float],
+        local_search: Optional[Callable[[], Optional[ProviderResults]]] = None,
+    ) -> Iterator[ProviderResults]:
+        """
+        Fan out provider queries over a bounded worker pool.
+
+        Providers that overrun their own deadline, or are still pending when
+        the overall deadline expires, are abandoned and contribute no results.
+        A mirror group occupies one worker and shares one deadline. Requests
+        never outlive the overall deadline's socket timeout, and run on
+        daemon threads, so abandoned ones don't delay interpreter exit.
+
+        local_search runs once every query has been submitted, so slow local
+        work (loading the title index) overlaps the network; its batch, if
+        any, is yielded first.
+        """
+        started: Dict[str, float] = {}
+        deadline = time.monotonic() + overall_timeout if overall_timeout else None
+
+        def run(unit: List[str]) -> List[ProviderResults]:
+            start = started[unit[0]] = time.monotonic()
+            timeout = provider_timeout
+            if deadline is not None:
+                timeout = min(timeout, deadline - start)
+                if timeout <= 0:
+                    return [
+                        ProviderResults(base_url, [], 0.0, "search deadline exceeded")
+                        for base_url in unit
+                    ]
+            return self._search_unit(unit, encoded_query, timeout, verbose)
+
+        executor = DaemonThreadPool(
+            min(max_workers, len(units)), thread_name_prefix="franken-search"
+        )
+        futures = {executor.submit(run, unit): unit[0] for unit in units}
+        pending = set(futures)
+
+        try:
+            if local_search is not None:
+                batch = local_search()
+                if batch is not None:
+                    yield batch
+
+            while pending:
+                now = time.monotonic()
+
+                # Abandon providers that have exceeded their own deadline
+                for future in list(pending):
+                    base_url = futures[future]
+                    if base_url in started and now - started[base_url] >= provider_timeout:
+                        pending.discard(future)
+                        if verbose:
+                            console.log(f"[yellow]⚠ Timeout searching {base_url}")
+                        yield ProviderResults(
+                            base_url, [], now - started[base_url], "provider deadline exceeded"
+                        )
+
+                if deadline is not None and now >= deadline:
+                    if verbose:
+                        console.log(
+                            f"[yellow]⚠ Search deadline reached, "
+                            f"abandoning {len(pending)} provider(s)"
+                        )
+                    break
+                if not pending:
+                    break
+
+                wait_for = [
+                    started[futures[f]] + provider_timeout - now
+                    for f in pending
+                    if futures[f] in started
+                ]
+                if deadline is not None:
+                    wait_for.append(deadline - now)
+                timeout = max(0.0, min(wait_for)) if wait_for else None
+
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _search_provider(
+        self,
+        base_url: str,
+        encoded_query: str,
+        timeout: float,
+        verbose: bool = False,
+        quiet: bool = False,
+    ) -> Tuple[List[Tuple[str, str]], bool]:
+        """
+        Query a single provider and extract its results.
+
+        Returns:
+            Tuple of ((title, url) list, whether the page came from the HTTP cache)
+
+        Raises:
+            requests.RequestException: On network or HTTP errors
+        """
+        full_url = f"{base_url}{encoded_query}"
+        if verbose:
+            console.log(f"[cyan]→ Searching: {full_url}")
+        elif not quiet:
+            console.log(f"Searching: {full_url[:60]}...")
+
+        response = self.session.get(full_url, timeout=timeout)
+        response.raise_for_status()
+        items = self._extract_provider_results(base_url, response_markup(response), verbose)
+        return items, getattr(response, "from_cache", False)
+
+    def _extract_provider_results(
+        self, base_url: str, markup: Union[str, bytes], verbose: bool = False
+    ) -> List[Tuple[str, str]]:
+        """
+        Extract a provider's search results from its page.
+
+        Provider rules come first, then the learned selector for the host,
+        then the generic RESULT_SELECTORS; the selector that worked is
+        recorded in the selector profile.
+
+        Args:
+            base_url: Provider search base the page came from
+            markup: Page text, or raw bytes (see parsing.response_markup)
+            verbose: Print debug info
+
+        Returns:
+            List of (title, url) tuples
+        """
+        host = urlparse(base_url).netloc
+        rules = self.provider_rules.get(host)
+        if rules is not None and rules.result_selector is not None:
+            items = rules.extract_results(markup, limit=MAX_RESULTS)
+            if items:
                 if verbose:
-                    console.log(f"[red]✗[/red] Parsing error: {e}")
+                    console.log(f"[cyan]  Provider rules matched {len(items)} for {host}")
+                return items
+            if verbose:
+                console.log(f"[yellow]⚠ Provider rules matched nothing for {host}")
 
-        return results
+        if self.selector_profile is None:
+            return self._extract_results(markup, verbose=verbose)
+
+        preferred = self.selector_profile.preferred(host)
+        if verbose and preferred:
+            console.log(f"[cyan]  Trying learned selector for {host}: {preferred}")
+
+        items, selector = self._match_results(markup, verbose, preferred)
+        if selector is not None:
+            self.selector_profile.record(host, selector)
+            if preferred and selector != preferred:
+                self.selector_profile.forget(host, preferred)
+            if verbose:
+                counts = ", ".join(
+                    f"{name} ×{count}"
+                    for name, count in self.selector_profile.hits(host).items()
+                )
+                console.log(f"[cyan]  Selector hits for {host}: {counts}")
+        return items
 
     @staticmethod
+    def _log_search_error(base_url: str, error: Exception, verbose: bool = False) -> None:
+        """Report a failed provider search without aborting the whole search."""
+        if not verbose:
+            # Silently skip failing providers
+            return
+
+        if isinstance(error, requests.exceptions.ConnectionError):
+            console.log(f"[yellow]⚠ Connection failed for {base_url}: {error}")
+        elif isinstance(error, requests.exceptions.Timeout):
+            console.log(f"[yellow]⚠ Timeout searching {base_url}")
+        elif isinstance(error, requests.exceptions.HTTPError):
+            console.log(f"[yellow]⚠ HTTP error {error.response.status_code} for {base_url}")
+        elif isinstance(error, requests.RequestException):
+            console.log(f"[yellow]⚠[/yellow] Error searching {base_url}: {error}")
+        else:
+            console.log(f"[red]✗[/red] Parsing error: {error}")
+
+    @classmethod
     def _extract_results(
-        soup: BeautifulSoup, verbose: bool = False
+        cls, page: Union["BeautifulSoup", str, bytes], verbose: bool = False
     ) -> List[Tuple[str, str]]:
         """
-        Extract movie/show titles and links from parsed HTML with fallbacks.
+        Extract movie/show titles and links from a search page with fallbacks.
 
         Args:
-            soup: BeautifulSoup object
+            page: Raw page markup, or a BeautifulSoup object
             verbose: Print debug info
 
         Returns:
             List of (title, url) tuples
         """
-        results = []
+        return cls._match_results(page, verbose)[0]
+
+    @classmethod
+    def _match_results(
+        cls,
+        page: Union["BeautifulSoup", str, bytes],
+        verbose: bool = False,
+        preferred: Optional[str] = None,
+    ) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        Extract search results and report which selector produced them.
+
+        With a preferred selector only that one is matched; the full
+        RESULT_SELECTORS list is tried only if it finds nothing.
+
+        Args:
+            page: Raw page markup, or a BeautifulSoup object
+            verbose: Print debug info
+            preferred: Selector known to work for this provider (optional)
+
+        Returns:
+            Tuple of ((title, url) list, selector used or None for the regex fallback)
+        """
+        markup = page if isinstance(page, (str, bytes)) else str(page)
+        results: List[Tuple[str, str]] = []
+        used: Optional[str] = None
         try:
-            # Primary: Try common streaming site selectors
-            selectors = [
-                ("a.film-name", "film-name"),  # myflixerz, cineby
-                ("a.title", "title"),
-                ("a[href*='/watch/']", "watch link"),
-                ("a[href*='/movie/']", "movie link"),
-                ("a[href*='/embed/']", "embed link"),
-                ("h3 a", "heading link"),
-                ("div.card a", "card link"),
-                ("div.film-poster a", "poster link"),
-                (".mli-info a", "mli-info link"),
-            ]
+            if preferred:
+                results, used = cls._scan_results(markup, [preferred], verbose)
+                if not results and verbose:
+                    console.log(f"[yellow]⚠ Learned selector matched nothing: {preferred}")
 
-            for selector, selector_type in selectors:
-                matches = soup.select(selector)
-                if matches:
-                    if verbose:
-                        console.log(f"[cyan]  Found {len(matches)} with selector: {selector}")
-                    for link in matches:
-                        text = link.get_text(strip=True)
-                        href = link.get("href", "")
-
-                        # Filter bad results
-                        if (
-                            text
-                            and len(text) > 2
-                            and len(text) < 100  # Avoid nav menu text
-                            and href
-                            and not href.startswith("#")
-                            and not any(
-                                bad in text.lower()
-                                for bad in ["home", "search", "menu", "nav", "login", "sign"]
-                            )
-                        ):
-                            results.append((text, href))
-                    if results:
-                        break  # Use first selector that worked
+            # Primary: Try common streaming site selectors, in priority order
+            if not results:
+                results, used = cls._scan_results(
+                    markup, [selector for selector, _ in RESULT_SELECTORS], verbose
+                )
 
             # Fallback: Try regex patterns if no results
             if not results:
-                html_str = str(soup)
-                for pattern, pattern_type in EMBED_PATTERNS:
-                    matches = re.findall(pattern, html_str)
-                    for match in matches:
+                found = _scan_embed_patterns(markup)
+                for index, (_, pattern_type) in enumerate(EMBED_PATTERNS):
+                    for match in found.get(index, []):
                         if match and match.startswith(("http", "/", ".")):
                             title = match.split("/")[-1][:50]
                             results.append((f"{title} ({pattern_type})", match))
@@ -180,12 +1126,62 @@ class ContentScraper:
                     seen.add(title)
                     unique_results.append((title, url))
 
-            return unique_results[:20]  # Limit to top 20 results
+            return unique_results[:MAX_RESULTS], used  # Limit to top 20 results
 
         except Exception as e:
             if verbose:
                 console.log(f"[red]Error extracting results:[/red] {e}")
-            return []
+            return [], None
+
+    @staticmethod
+    def _scan_results(
+        markup: Union[str, bytes], selectors: List[str], verbose: bool = False
+    ) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        Match anchors against result selectors in one scan of the page.
+
+        Only anchors are tokenized (no DOM tree is built), and the scan stops
+        as soon as the highest-priority selector has a full page of results.
+
+        Args:
+            markup: Raw page markup
+            selectors: CSS selectors in priority order
+            verbose: Print per-selector hit counts
+
+        Returns:
+            Tuple of (accepted results of the first selector that had any, that selector)
+        """
+        compiled = [compile_selector(selector) for selector in selectors]
+        buckets: List[List[Tuple[str, str]]] = [[] for _ in compiled]
+        hits = [0] * len(compiled)
+        first_seen: Set[str] = set()
+        first_unique = 0
+
+        def on_anchor(link: Element) -> bool:
+            nonlocal first_unique
+            text = link.get_text(strip=True)
+            href = link.get("href", "")
+            accepted = _is_valid_result(text, href)
+            for index, selector in enumerate(compiled):
+                if selector.match(link):
+                    hits[index] += 1
+                    if accepted:
+                        buckets[index].append((text, href))
+                        if index == 0 and href not in first_seen and text not in first_seen:
+                            first_seen.update((text, href))
+                            first_unique += 1
+
+            # Nothing can outrank a full page from the first selector
+            return first_unique >= MAX_RESULTS
+
+        scan_elements(markup, ("a",), on_anchor)
+
+        for index, selector in enumerate(selectors):
+            if hits[index] and verbose:
+                console.log(f"[cyan]  Found {hits[index]} with selector: {selector}")
+            if buckets[index]:
+                return buckets[index], selector  # Use first selector that worked
+        return [], None
 
     def fetch_embed_from_page(self, page_url: str, base_url: Optional[str] = None) -> Optional[str]:
         """
@@ -199,86 +1195,18 @@ class ContentScraper:
             Embed URL if found, None otherwise
         """
         try:
-            # Handle relative URLs
-            if not page_url.startswith("http"):
-                if base_url:
-                    page_url = base_url.rstrip("/") + "/" + page_url.lstrip("/")
-                else:
-                    return None
+            page_url = self._resolve_page_url(page_url, base_url)
+            if page_url is None:
+                return None
+
+            known = self.known_embed(page_url)
+            if known:
+                return known
 
             console.log(f"[cyan]→ Fetching embed from: {page_url[:60]}...")
             response = self.session.get(page_url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-            html_str = str(soup)
-
-            # Strategy 1: Look for iframes with specific selectors
-            selectors = [
-                ".player-container iframe",
-                "#player iframe",
-                "#watch-iframe iframe",
-                "iframe[src*='embed']",
-                "iframe[src*='player']",
-                "iframe[src*='watch']",
-            ]
-            
-            for selector in selectors:
-                iframes = soup.select(selector)
-                for iframe in iframes:
-                    src = iframe.get("src", "")
-                    if src:
-                        embed_url = self._make_absolute_url(src, page_url)
-                        console.log(f"[green]✓ Found iframe embed:[/green] {embed_url[:60]}...")
-                        return embed_url
-
-            # Strategy 2: All iframes (fallback)
-            for iframe in soup.find_all("iframe"):
-                src = iframe.get("src", "")
-                if src and any(
-                    pattern in src.lower()
-                    for pattern in ["embed", "player", "watch", "vid", "m3u8", "mp4"]
-                ):
-                    embed_url = self._make_absolute_url(src, page_url)
-                    console.log(f"[green]✓ Found iframe embed:[/green] {embed_url[:60]}...")
-                    return embed_url
-
-            # Strategy 3: Look for video tags
-            for video in soup.find_all("video"):
-                src = video.get("src", "")
-                if src:
-                    embed_url = self._make_absolute_url(src, page_url)
-                    console.log(f"[green]✓ Found video tag:[/green] {embed_url[:60]}...")
-                    return embed_url
-
-                # Check source tags inside video
-                for source in video.find_all("source"):
-                    src = source.get("src", "")
-                    if src and any(
-                        ext in src.lower() for ext in [".mp4", ".m3u8", "stream"]
-                    ):
-                        embed_url = self._make_absolute_url(src, page_url)
-                        console.log(f"[green]✓ Found video source:[/green] {embed_url[:60]}...")
-                        return embed_url
-
-            # Strategy 4: Regex search for direct URLs
-            url_pattern = r'(https?://[^\s\'"]+\.(m3u8|mp4))'
-            matches = re.findall(url_pattern, html_str)
-            if matches:
-                embed_url = matches[0][0]
-                console.log(f"[green]✓ Found direct URL:[/green] {embed_url[:60]}...")
-                return embed_url
-
-            # Strategy 5: Regex fallback on all patterns
-            for pattern, pattern_type in EMBED_PATTERNS:
-                matches = re.findall(pattern, html_str)
-                if matches:
-                    embed_url = matches[0]
-                    if embed_url.startswith("http"):
-                        console.log(f"[green]✓ Found {pattern_type}:[/green] {embed_url[:60]}...")
-                        return embed_url
-
-            console.log("[yellow]⚠ No embed found on detail page")
-            return None
+            return self.embed_from_content(page_url, response_markup(response))
 
         except requests.exceptions.Timeout:
             console.log(f"[yellow]⚠ Timeout fetching {page_url}")
@@ -293,6 +1221,152 @@ class ContentScraper:
             console.log(f"[yellow]⚠ Could not fetch embed: {e}")
             return None
 
+    def known_embed(self, page_url: str, quiet: bool = False) -> Optional[str]:
+        """
+        Return a detail page's embed URL if it is known without fetching the page.
+
+        Checks the resolution cache, then the provider's embed URL template.
+
+        Args:
+            page_url: Absolute URL of the movie/show page
+            quiet: Suppress progress logging
+
+        Returns:
+            Embed URL, or None if the page has to be fetched
+        """
+        if self.resolution_cache is not None:
+            cached = self.resolution_cache.get_embed(page_url)
+            if cached:
+                if not quiet:
+                    console.log(f"[green]✓ Using cached embed:[/green] {cached[:60]}...")
+                return cached
+
+        rules = self.provider_rules.get(urlparse(page_url).netloc)
+        if rules is not None and rules.embed_url_template:
+            embed_url = rules.embed_url(page_url)
+            if not quiet:
+                console.log(f"[green]✓ Built embed from rules:[/green] {embed_url[:60]}...")
+            if self.resolution_cache is not None:
+                self.resolution_cache.set_embed(page_url, embed_url)
+            return embed_url
+
+        return None
+
+    def embed_from_content(
+        self, page_url: str, content: Union[str, bytes], quiet: bool = False
+    ) -> Optional[str]:
+        """
+        Extract the embed URL from a fetched detail page and cache it.
+
+        Provider rules are tried first, then the generic extractors.
+
+        Args:
+            page_url: Absolute URL of the movie/show page
+            content: Raw page body
+            quiet: Suppress progress logging
+
+        Returns:
+            Embed URL if found, None otherwise
+        """
+        embed_url = None
+        rules = self.provider_rules.get(urlparse(page_url).netloc)
+        if rules is not None:
+            src = rules.extract_embed(content)
+            if src:
+                embed_url = self._make_absolute_url(src, page_url)
+                if not quiet:
+                    console.log(f"[green]✓ Found embed via rules:[/green] {embed_url[:60]}...")
+        if embed_url is None:
+            embed_url = self._extract_embed(content, page_url, quiet=quiet)
+
+        if embed_url is None:
+            if not quiet:
+                console.log("[yellow]⚠ No embed found on detail page")
+        elif self.resolution_cache is not None:
+            self.resolution_cache.set_embed(page_url, embed_url)
+        return embed_url
+
+    @staticmethod
+    def _resolve_page_url(page_url: str, base_url: Optional[str] = None) -> Optional[str]:
+        """
+        Turn a possibly relative detail page URL into an absolute one.
+
+        Args:
+            page_url: URL of the movie/show page
+            base_url: Base URL for constructing full URLs from relative paths
+
+        Returns:
+            Absolute URL, or None if it cannot be determined
+        """
+        if page_url.startswith("http"):
+            return page_url
+        if base_url:
+            return base_url.rstrip("/") + "/" + page_url.lstrip("/")
+        return None
+
+    @classmethod
+    def _extract_embed(
+        cls, page: Union["BeautifulSoup", str, bytes], page_url: str, quiet: bool = False
+    ) -> Optional[str]:
+        """
+        Extract the embedded video URL from a detail page.
+
+        Every iframe/video/source/anchor is scored against EMBED_RULES in a
+        single scan that stops as soon as a top-scoring candidate is seen.
+        The regex fallbacks only run when no element qualifies.
+
+        Args:
+            page: Raw page markup, or a BeautifulSoup object
+            page_url: Absolute URL of the page, used to resolve relative links
+            quiet: Suppress progress logging
+
+        Returns:
+            Embed URL if found, None otherwise
+        """
+        markup = page if isinstance(page, (str, bytes)) else str(page)
+        rules_by_tag: Dict[str, List[EmbedRule]] = {}
+        for rule in EMBED_RULES:
+            rules_by_tag.setdefault(rule.tag, []).append(rule)
+        top_score = min(rule.score for rule in EMBED_RULES)
+        best: List[Tuple[int, str, str]] = []  # [(score, url, label)]
+
+        def on_candidate(element: Element) -> bool:
+            for rule in rules_by_tag[element.tag]:
+                if best and rule.score >= best[0][0]:
+                    break
+                url = element.get(rule.attr, "")
+                if url and rule.matches(element, url.lower()):
+                    best[:] = [(rule.score, url, rule.label)]
+                    break
+            return bool(best) and best[0][0] == top_score
+
+        scan_elements(markup, tuple(rules_by_tag), on_candidate)
+        if best:
+            _, url, label = best[0]
+            embed_url = cls._make_absolute_url(url, page_url)
+            if not quiet:
+                console.log(f"[green]✓ Found {label}:[/green] {embed_url[:60]}...")
+            return embed_url
+
+        # Strategies 4 and 5: one regex pass over the raw markup. Direct URLs
+        # win, then the first match of each pattern in EMBED_PATTERNS order.
+        found = _scan_embed_patterns(markup, first_only=True, stop_on_direct=True)
+        if DIRECT_URL_INDEX in found:
+            embed_url = found[DIRECT_URL_INDEX][0]
+            if not quiet:
+                console.log(f"[green]✓ Found direct URL:[/green] {embed_url[:60]}...")
+            return embed_url
+
+        for index, (_, pattern_type) in enumerate(EMBED_PATTERNS):
+            matches = found.get(index)
+            if matches and matches[0].startswith("http"):
+                embed_url = matches[0]
+                if not quiet:
+                    console.log(f"[green]✓ Found {pattern_type}:[/green] {embed_url[:60]}...")
+                return embed_url
+
+        return None
+
     @staticmethod
     def _make_absolute_url(url: str, page_url: str) -> str:
         """
@@ -334,29 +1408,79 @@ class ContentScraper:
         """
         try:
             console.log(f"Searching DuckDuckGo for '{query}'...")
-            ddg_query = f"{query} watch free online site:youtube.com OR site:reddit.com"
-            url = "https://duckduckgo.com/html/"
-            
-            params = {"q": ddg_query}
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(
+                DUCKDUCKGO_URL, params=self._duckduckgo_params(query), timeout=10
+            )
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            results = []
-
-            # Extract DDG results
-            for result in soup.find_all("a", class_="result__url"):
-                link_text = result.get_text(strip=True)
-                link_href = result.get("href", "")
-                if link_text and link_href:
-                    results.append((link_text[:60], link_href))
-
-            return results[:10]
+            soup = make_soup(response.content)
+            return self._extract_duckduckgo(soup)
 
         except Exception as e:
             console.log(f"[yellow]⚠[/yellow] DuckDuckGo search failed: {e}")
             return []
 
+    @staticmethod
+    def _duckduckgo_params(query: str) -> Dict[str, str]:
+        """Build DuckDuckGo HTML search parameters for a query."""
+        return {"q": f"{query} watch free online site:youtube.com OR site:reddit.com"}
+
+    @staticmethod
+    def _extract_duckduckgo(soup: "BeautifulSoup") -> List[Tuple[str, str]]:
+        """
+        Extract result links from a DuckDuckGo HTML results page.
+
+        Args:
+            soup: BeautifulSoup object
+
+        Returns:
+            List of (title, url) tuples
+        """
+        results = []
+        for result in soup.find_all("a", class_="result__url"):
+            link_text = result.get_text(strip=True)
+            link_href = result.get("href", "")
+            if link_text and link_href:
+                results.append((link_text[:60], link_href))
+
+        return results[:10]
+
+    def resolve_stream_url(
+        self, url: str, quiet: bool = False, cancel: Optional[threading.Event] = None
+    ) -> Optional[str]:
+        """
+        Resolve an embed URL to a direct stream URL via yt-dlp.
+
+        Results are served from the resolution cache while still valid, which
+        skips the yt-dlp startup and extraction entirely on re-play.
+
+        Args:
+            url: Embed or page URL understood by yt-dlp
+            quiet: Suppress progress logging
+            cancel: Event that aborts the extraction when set
+
+        Returns:
+            Direct stream URL, or None if extraction failed or was cancelled
+        """
+        if self.resolution_cache is not None:
+            cached = self.resolution_cache.get_stream(url)
+            if cached:
+                if not quiet:
+                    console.log("[green]✓ Using cached stream URL[/green]")
+                return cached
+
+        if not quiet:
+            console.log("[cyan]  Getting stream URL via yt-dlp...")
+        stream_url = self.resolver.get_url(url, cancel=cancel)
+        if stream_url is None:
+            return None
+
+        if not quiet:
+            console.log(f"[green]✓ Got stream URL[/green]")
+        if self.resolution_cache is not None:
+            self.resolution_cache.set_stream(url, stream_url)
+        return stream_url
+
     def play_url(self, url: str, is_embed: bool = False) -> bool:
         """
         Play a URL using yt-dlp + mpv for best compatibility.
@@ -373,27 +1497,12 @@ class ContentScraper:
             
             # Use yt-dlp for embeds to handle HLS, subtitles, etc.
             if is_embed:
-                console.log("[cyan]  Getting stream URL via yt-dlp...")
-                result = subprocess.run(
-                    [
-                        "yt-dlp",
-                        "-f", "best",
-                        "--no-playlist",
-                        "--get-url",
-                        url
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    stream_url = result.stdout.strip().split("\n")[0]
-                    console.log(f"[green]✓ Got stream URL[/green]")
+                stream_url = self.resolve_stream_url(url)
+                if stream_url:
                     url = stream_url
                 else:
                     console.log("[yellow]⚠ yt-dlp could not extract stream, trying direct...")
-            
+
             # Try mpv
             console.log("[cyan]→ Starting mpv...")
             subprocess.run(
@@ -426,25 +1535,16 @@ class ContentScraper:
             True if streaming started, False otherwise
         """
         try:
+            if not self.resolver.available():
+                raise FileNotFoundError("yt-dlp")
+
             console.log(f"Attempting to stream '{query}' with yt-dlp...")
             search_query = f"ytsearch:{query} full movie"
 
             # Get streaming URL using yt-dlp
-            result = subprocess.run(
-                [
-                    "yt-dlp",
-                    "-f",
-                    "best",
-                    "--get-url",
-                    search_query,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            url = self.resolver.get_url(search_query)
 
-            if result.returncode == 0 and result.stdout.strip():
-                url = result.stdout.strip().split("\n")[0]
+            if url:
                 console.log(f"[green]✓[/green] Found stream: {url[:60]}...")
 
                 # Try to play with mpv
@@ -503,17 +1603,7 @@ class ContentScraper:
                 output_path = str(Path.home() / "Downloads")
 
             console.log(f"Downloading to {output_path}...")
-            result = subprocess.run(
-                [
-                    "yt-dlp",
-                    "-o",
-                    f"{output_path}/%(title)s.%(ext)s",
-                    url,
-                ],
-                timeout=3600,
-            )
-
-            if result.returncode == 0:
+            if self.resolver.download(url, output_path):
                 console.log(f"[green]✓[/green] Download complete")
                 return True
             else:
@@ -543,19 +1633,106 @@ class ContentScraper:
         Returns:
             Tuple of (is_healthy, response_time_in_seconds)
         """
-        try:
-            import time
+        probe = self.probe_provider_url(url, timeout)
+        if not probe.ok and probe.error == "timeout":
+            return False, float(timeout)
+        return probe.ok, probe.total
 
-            start = time.time()
-            response = self.session.head(url, timeout=timeout)
-            elapsed = time.time() - start
+    def probe_provider_url(self, url: str, timeout: float = 10) -> ProbeResult:
+        """
+        Time one request against a provider URL.
 
-            is_healthy = response.status_code < 400
-            return is_healthy, elapsed
+        Uses HEAD, falling back to a small ranged GET when the server does
+        not support HEAD, so such providers aren't reported as dead.
+
+        Args:
+            url: Provider URL to test
+            timeout: Request timeout in seconds
+
+        Returns:
+            ProbeResult with time to first byte and total time
+        """
+        method = "HEAD"
+        start = time.perf_counter()
+        try:
+            response = self.session.head(url, timeout=timeout, allow_redirects=True)
+            ttfb = time.perf_counter() - start
+
+            if response.status_code in HEAD_UNSUPPORTED_STATUSES:
+                method = "GET"
+                start = time.perf_counter()
+                response = self.session.get(
+                    url,
+                    timeout=timeout,
+                    stream=True,
+                    headers={"Range": f"bytes=0-{PROBE_RANGE_BYTES - 1}"},
+                )
+                ttfb = time.perf_counter() - start
+                try:
+                    # Servers may ignore Range; never read more than we asked for
+                    received = 0
+                    for chunk in response.iter_content(chunk_size=PROBE_RANGE_BYTES):
+                        received += len(chunk)
+                        if received >= PROBE_RANGE_BYTES:
+                            break
+                finally:
+                    response.close()
+
+            total = time.perf_counter() - start
+            status = response.status_code
+            return ProbeResult(status < 400, status, method, ttfb, total)
 
         except requests.Timeout:
-            return False, float(timeout)
-        except requests.RequestException:
-            return False, 0.0
-        except Exception:
-            return False, 0.0
+            elapsed = time.perf_counter() - start
+            return ProbeResult(False, None, method, elapsed, elapsed, "timeout")
+        except requests.RequestException as e:
+            elapsed = time.perf_counter() - start
+            return ProbeResult(False, None, method, elapsed, elapsed, type(e).__name__)
+
+    def probe_providers(
+        self,
+        urls: List[str],
+        samples: int = 3,
+        timeout: float = 10,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[ProviderStats]:
+        """
+        Probe every provider concurrently, several times each.
+
+        Samples for one provider run back to back (reusing its keep-alive
+        connection) while different providers are probed in parallel.
+
+        Args:
+            urls: Provider URLs to test
+            samples: Requests per provider
+            timeout: Per-request timeout in seconds
+            max_workers: Maximum providers probed at once
+
+        Returns:
+            ProviderStats per URL, in input order
+        """
+
+        def probe(url: str) -> ProviderStats:
+            probes = [self.probe_provider_url(url, timeout) for _ in range(samples)]
+            good = [result for result in probes if result.ok]
+            last = probes[-1]
+            return ProviderStats(
+                url=url,
+                samples=len(probes),
+                successes=len(good),
+                p50=_percentile([result.total for result in good], 50),
+                p95=_percentile([result.total for result in good], 95),
+                ttfb_p50=_percentile([result.ttfb for result in good], 50),
+                transfer_p50=_percentile([result.total - result.ttfb for result in good], 50),
+                method=(good[-1] if good else last).method,
+                status=(good[-1] if good else last).status,
+                error=None if good else last.error or f"HTTP {last.status}",
+            )
+
+        if not urls:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(urls))),
+            thread_name_prefix="franken-probe",
+        ) as executor:
+            return list(executor.map(probe, urls))
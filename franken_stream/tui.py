@@ -1,23 +1,42 @@
 """Textual TUI dashboard for franken-stream."""
 
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 
 from textual.app import ComposeResult
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Header,
     Footer,
     Static,
     Input,
     Label,
+    OptionList,
 )
+from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 from textual.containers import Container, Vertical, Horizontal
 from textual.binding import Binding
+from rich.markup import escape
 from rich.panel import Panel
 from rich.text import Text
 
+from franken_stream.cache import ResolutionCache, ResponseCache, SearchCache, SelectorProfile
+from franken_stream.health import ProviderHealth
+from franken_stream.index import INDEX_PROVIDER, TitleIndex
 from franken_stream.providers import ProviderManager
-from franken_stream.scraper import ContentScraper
+from franken_stream.scraper import ContentScraper, ProviderResults
+
+# Seconds typing must pause before a type-ahead search starts
+SEARCH_DEBOUNCE = 0.35
+
+# Shorter queries match too much to be worth searching
+MIN_QUERY_LENGTH = 2
+
+# Guards creating the scraper shared by the worker threads
+_scraper_lock = threading.Lock()
 
 
 class StatusBar(Static):
@@ -42,12 +61,86 @@ class StatusBar(Static):
         self.update(message)
 
 
+def _get_scraper(app) -> ContentScraper:
+    """
+    Return the app's shared scraper, creating it on first use.
+
+    Worker threads (pre-warming, search, resolution) can get here at the
+    same time; the lock makes sure they all share one scraper, and with it
+    the connections the pre-warm opened.
+    """
+    with _scraper_lock:
+        if app.pm is None:
+            app.pm = ProviderManager()
+        if app.scraper is None:
+            app.scraper = ContentScraper(
+                provider_rules=app.pm.get_provider_rules(),
+                mirror_groups=app.pm.get_mirror_groups(),
+                health=ProviderHealth(),
+                cache=ResponseCache(),
+                result_cache=SearchCache(),
+                resolution_cache=ResolutionCache(),
+                selector_profile=SelectorProfile(),
+                title_index=TitleIndex(),
+            )
+        return app.scraper
+
+
+def _format_progress(
+    bases: List[str],
+    finished: Dict[str, ProviderResults],
+    mirror_group: Optional[Dict[str, str]] = None,
+    complete: bool = False,
+) -> str:
+    """
+    Summarize per-provider search progress for the status bar.
+
+    Mirrors of one site (mirror_group maps a base to its group name) are
+    one entry: the search stops at the first mirror that answers, so the
+    others may never report. An entry is done once a member answers, or
+    once every member failed or the search is complete.
+    """
+    units: List[List[str]] = []
+    groups: Dict[str, List[str]] = {}
+    for base in bases:
+        group = (mirror_group or {}).get(base)
+        if group is None:
+            units.append([base])
+        elif group in groups:
+            groups[group].append(base)
+        else:
+            groups[group] = [base]
+            units.append(groups[group])
+
+    done = 0
+    entries = []
+    for unit in units:
+        batches = [finished[base] for base in unit if base in finished]
+        answered = [batch for batch in batches if not batch.error]
+        batch = None
+        if answered:
+            batch = answered[0]
+        elif batches and (complete or len(batches) == len(unit)):
+            batch = batches[-1]
+
+        host = escape(urlparse(batch.provider if batch else unit[0]).netloc or unit[0])
+        if batch is None:
+            entries.append(f"[dim]… {host}[/dim]")
+            continue
+        done += 1
+        if batch.error:
+            entries.append(f"[red]✗ {host}[/red]")
+        else:
+            entries.append(f"[green]✓ {host} ({len(batch.results)})[/green]")
+    return " · ".join([f"{done}/{len(units)} providers"] + entries)
+
+
 class SearchScreen(Screen):
-    """Full-screen search interface."""
+    """Full-screen search interface with type-ahead results."""
 
     BINDINGS = [
         Binding("escape", "cancel", "Back"),
-        Binding("enter", "search", "Search"),
+        Binding("down", "focus_results", "Results", show=False),
     ]
 
     DEFAULT_CSS = """
@@ -56,8 +149,8 @@ class SearchScreen(Screen):
     }
     
     #search_container {
-        width: 60;
-        height: 10;
+        width: 80%;
+        height: 80%;
         border: solid $primary;
         background: $surface;
     }
@@ -66,30 +159,152 @@ class SearchScreen(Screen):
         width: 100%;
         margin: 1;
     }
+
+    #search_results {
+        height: 1fr;
+        margin: 0 1;
+    }
+
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._query = ""
+        self._debounce: Optional[Timer] = None
+        self._results: List[Tuple[str, str]] = []
+
     def compose(self) -> ComposeResult:
         """Render search screen."""
         with Vertical(id="search_container"):
             yield Label("Search Movies & TV Shows")
             yield Input(
                 id="search_input",
-                placeholder="Type query and press Enter..."
+                placeholder="Start typing a title..."
             )
+            yield OptionList(id="search_results")
+        yield StatusBar("Type at least two characters to search", id="search_status")
 
     def on_mount(self) -> None:
         """Focus input on mount."""
         self.query_one("#search_input", Input).focus()
+        # Warm provider connections while the user types
+        self.run_worker(self._prewarm, thread=True, group="prewarm", exit_on_error=False)
+
+    def _prewarm(self) -> None:
+        """Open keep-alive connections to the top-ranked providers."""
+        scraper = _get_scraper(self.app)
+        scraper.prewarm(self.app.pm.get_search_bases())
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Schedule a search once typing pauses."""
+        if self._debounce is not None:
+            self._debounce.stop()
+        query = event.value.strip()
+        if len(query) < MIN_QUERY_LENGTH:
+            self._debounce = None
+            self._query = ""
+            self.workers.cancel_group(self, "search")
+            self._show_results("", [], "Type at least two characters to search")
+            return
+        self._debounce = self.set_timer(SEARCH_DEBOUNCE, lambda: self._start_search(query))
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Search right away on Enter, skipping the debounce."""
+        if self._debounce is not None:
+            self._debounce.stop()
+            self._debounce = None
+        query = event.value.strip()
+        if query:
+            self._start_search(query)
+
+    def _start_search(self, query: str) -> None:
+        if query == self._query:
+            return
+        self._query = query
+        self.query_one("#search_status", StatusBar).update_status(
+            f"Searching for {escape(query)}..."
+        )
+        # exclusive: starting a search cancels the previous one
+        self.run_worker(
+            lambda: self._search(query),
+            thread=True,
+            group="search",
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _search(self, query: str) -> None:
+        """
+        Worker: stream cached and live results into the list as they arrive.
+
+        Ranking runs here, off the event loop; the UI thread only swaps in
+        the finished list and the progress line.
+        """
+        worker = get_current_worker()
+        scraper = _get_scraper(self.app)
+        bases = self.app.pm.get_search_bases()
+        collected: Dict[str, List[Tuple[str, str]]] = {}
+        finished: Dict[str, ProviderResults] = {}
+        ranked: List[Tuple[str, str]] = []
+
+        batches = scraper.iter_search(query, bases, concurrent=True)
+        try:
+            for batch in batches:
+                if worker.is_cancelled:
+                    return
+                # Absolute URLs, so a picked result can be resolved directly
+                collected[batch.provider] = [
+                    (title, urljoin(batch.provider, url)) for title, url in batch.results
+                ]
+                if batch.provider != INDEX_PROVIDER:
+                    finished[batch.provider] = batch
+                ranked = scraper.rank(query, list(collected.items()))
+                progress = _format_progress(bases, finished, scraper.mirror_group)
+                status = f"{len(ranked)} results · {progress}"
+                self.app.call_from_thread(self._show_results, query, ranked, status)
+        finally:
+            # Abandons providers still pending for a cancelled search
+            batches.close()
+
+        if not worker.is_cancelled:
+            progress = _format_progress(bases, finished, scraper.mirror_group, complete=True)
+            status = f"{len(ranked)} results · {progress}"
+            self.app.call_from_thread(self._show_results, query, ranked, status)
+
+    def _show_results(self, query: str, results: List[Tuple[str, str]], status: str) -> None:
+        if query != self._query:
+            return  # a stale search finished after a newer one started
+        self._results = results
+        option_list = self.query_one("#search_results", OptionList)
+        highlighted = option_list.highlighted
+        option_list.clear_options()
+        option_list.add_options(
+            Option(Text.assemble(title[:70], ("  " + urlparse(url).netloc, "dim")))
+            for title, url in results
+        )
+        if highlighted is not None and results:
+            option_list.highlighted = min(highlighted, len(results) - 1)
+        self.query_one("#search_status", StatusBar).update_status(status)
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Pick a result and return to the dashboard."""
+        title, url = self._results[event.option_index]
+        self.app.search_query = self._query
+        self.app.searches.append(self._query)
+        self.app.selected_result = (title, url)
+        self.app.pop_screen()
 
-    def action_search(self) -> None:
-        """Execute search."""
-        query = self.query_one("#search_input", Input).value
-        if query.strip():
-            self.app.search_query = query
-            self.app.pop_screen()
+    def action_focus_results(self) -> None:
+        """Move focus from the input to the result list."""
+        option_list = self.query_one("#search_results", OptionList)
+        if option_list.option_count:
+            if option_list.highlighted is None:
+                option_list.highlighted = 0
+            option_list.focus()
 
     def action_cancel(self) -> None:
         """Cancel and go back."""
+        self.workers.cancel_group(self, "search")
         self.app.pop_screen()
 
 
@@ -191,6 +406,46 @@ class DashboardScreen(Screen):
         
         return Panel(text, expand=True, border_style="green")
 
+    def on_screen_resume(self) -> None:
+        """Resolve the result picked on the search screen in the background."""
+        selected = getattr(self.app, "selected_result", None)
+        if not selected:
+            return
+        self.app.selected_result = None
+        self.query_one("#sidebar", Static).update(self._render_sidebar())
+        title, url = selected
+        self.query_one("#status_bar", StatusBar).update_status(
+            f"Resolving {escape(title)}..."
+        )
+        self.run_worker(
+            lambda: self._resolve(title, url),
+            thread=True,
+            group="resolve",
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _resolve(self, title: str, url: str) -> None:
+        """Worker: find the page's embed, then its direct stream URL."""
+        worker = get_current_worker()
+        status = self.query_one("#status_bar", StatusBar)
+        scraper = _get_scraper(self.app)
+
+        embed_url = scraper.fetch_embed_from_page(url) or url
+        if worker.is_cancelled:
+            return
+        self.app.call_from_thread(
+            status.update_status, f"Getting stream for {escape(title)}..."
+        )
+        stream_url = scraper.resolve_stream_url(embed_url, quiet=True)
+        if worker.is_cancelled:
+            return
+        if stream_url:
+            message = f"[green]✓[/green] {escape(title)}: {escape(stream_url)}"
+        else:
+            message = f"[yellow]⚠[/yellow] No stream found, open in browser: {escape(embed_url)}"
+        self.app.call_from_thread(status.update_status, message)
+
     def action_search(self) -> None:
         """Open search screen."""
         self.app.push_screen(SearchScreen())
@@ -206,15 +461,21 @@ class DashboardScreen(Screen):
         status.update_status("Showing history...")
 
     def action_update(self) -> None:
-        """Update providers."""
+        """Update providers in the background."""
         status = self.query_one("#status_bar", StatusBar)
         status.update_status("Updating providers...")
-        
+        self.run_worker(self._update, thread=True, group="update", exclusive=True)
+
+    def _update(self) -> None:
+        """Worker: fetch providers.json without blocking the UI."""
+        status = self.query_one("#status_bar", StatusBar)
         if hasattr(self.app, "pm") and self.app.pm:
             if self.app.pm.update_providers():
-                status.update_status("Providers updated ✓")
+                # Rebuild the scraper with the new rules and mirror groups
+                self.app.scraper = None
+                self.app.call_from_thread(status.update_status, "Providers updated ✓")
             else:
-                status.update_status("Update failed")
+                self.app.call_from_thread(status.update_status, "Update failed")
 
     def action_help(self) -> None:
         """Show help."""
@@ -255,8 +516,10 @@ class FrankenStreamApp:
             def __init__(self):
                 super().__init__()
                 self.search_query = None
+                self.selected_result = None
                 self.searches = []
                 self.pm = None
+                self.scraper = None
 
             def on_mount(self) -> None:
                 """Mount main screen."""
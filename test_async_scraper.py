@@ -0,0 +1,159 @@
+"""Tests for the asyncio scraping engine (franken_stream/async_scraper.py)."""
+
+import asyncio
+import time
+
+import pytest
+
+from conftest import results_page
+from franken_stream import async_scraper as async_module
+from franken_stream import scraper as scraper_module
+from franken_stream.async_scraper import AsyncContentScraper
+from franken_stream.cache import ResolutionCache, ResponseCache, SearchCache
+from franken_stream.health import ProviderHealth
+from franken_stream.index import INDEX_PROVIDER, TitleIndex
+from franken_stream.providers import ProviderRules
+from franken_stream.scraper import ContentScraper
+
+pytest.importorskip("aiohttp")
+
+
+def _run(scraper, call):
+    """Run call(async_scraper) on a fresh loop and close the pool afterwards."""
+
+    async def main():
+        async with AsyncContentScraper(scraper) as engine:
+            return await call(engine)
+
+    return asyncio.run(main())
+
+
+def _batches(scraper, query, bases, **options):
+    async def collect(engine):
+        return [batch async for batch in engine.iter_search(query, bases, **options)]
+
+    return _run(scraper, collect)
+
+
+def test_providers_are_queried_concurrently(server):
+    for name in "abc":
+        server.add(f"/{name}/search/", results_page(f"Dune {name}"), delay=0.5)
+    bases = [server.url(f"/{name}/search/") for name in "abc"]
+
+    start = time.perf_counter()
+    results = _run(ContentScraper(), lambda engine: engine.search("dune", bases, rank=False))
+
+    assert time.perf_counter() - start < 1.2
+    assert [title for title, _ in results] == ["Dune a", "Dune b", "Dune c"]
+
+
+def test_deadlines_abandon_slow_providers(server):
+    server.add("/fast/search/", results_page("Dune"))
+    server.add("/slow/search/", results_page("Dune Slow"), delay=3)
+    bases = [server.url("/fast/search/"), server.url("/slow/search/")]
+
+    start = time.perf_counter()
+    batches = _batches(ContentScraper(), "dune", bases, provider_timeout=0.5)
+
+    assert time.perf_counter() - start < 1.5
+    errors = {batch.provider: batch.error for batch in batches}
+    assert errors == {bases[0]: None, bases[1]: "provider deadline exceeded"}
+
+    start = time.perf_counter()
+    batches = _batches(ContentScraper(), "dune", bases, overall_timeout=0.5)
+    assert time.perf_counter() - start < 1.5
+    assert [batch.provider for batch in batches] == [bases[0]]
+
+
+def test_health_is_recorded_and_open_circuits_are_skipped(server, tmp_path):
+    server.add("/down/search/", b"down", status=500)
+    base = server.url("/down/search/")
+    health = ProviderHealth(tmp_path / "cache.db", failure_threshold=1)
+    scraper = ContentScraper(health=health)
+
+    assert _batches(scraper, "dune", [base])[0].error is not None
+    assert _batches(scraper, "dune", [base])[0].error == "circuit open"
+    assert server.hits("/down/") == 1
+
+
+def test_http_and_result_caches_are_shared(server, tmp_path):
+    server.add("/search/", results_page("Dune"), delay=0.2)
+    base = server.url("/search/")
+    health = ProviderHealth(tmp_path / "cache.db")
+    http_only = ContentScraper(cache=ResponseCache(tmp_path / "cache.db"), health=health)
+
+    first = _batches(http_only, "dune", [base])
+    again = _batches(http_only, "dune", [base])
+    assert server.hits("/search/") == 1
+    assert not first[0].cached and again[0].cached
+    assert health.get(base).samples == 1  # cache hits are not live traffic
+
+    results = ContentScraper(result_cache=SearchCache(tmp_path / "cache.db"))
+    _batches(results, "dune", [base], refresh_cached=False)
+    cached = _batches(results, "dune", [base], refresh_cached=False)
+    assert cached[0].cached and cached[0].results[0][0] == "Dune"
+    assert server.hits("/search/") == 2
+
+
+def test_rules_and_http_charset_apply(server):
+    page = '<h3 class="film-name"><a href="/movie/1" title="Amélie">x</a></h3>'
+    server.add(
+        "/search/",
+        page.encode("latin-1"),
+        headers={"Content-Type": "text/html; charset=ISO-8859-1"},
+    )
+    host = server.base.split("//")[1]
+    rules = {host: ProviderRules(host, result_selector="h3.film-name a", title_attr="title")}
+
+    results = _run(
+        ContentScraper(provider_rules=rules),
+        lambda engine: engine.search("amelie", [server.url("/search/")], rank=False),
+    )
+    assert results == [("Amélie", "/movie/1")]
+
+
+def test_slow_mirror_is_hedged_with_the_next(server, monkeypatch):
+    monkeypatch.setattr(scraper_module, "DEFAULT_HEDGE_DELAY", 0.2)
+    server.add("/m1/search/", results_page("Dune Slow"), delay=3)
+    server.add("/m2/search/", results_page("Dune"))
+    mirrors = [server.url("/m1/search/"), server.url("/m2/search/")]
+
+    start = time.perf_counter()
+    batches = _batches(ContentScraper(mirror_groups={"site": mirrors}), "dune", mirrors)
+
+    assert time.perf_counter() - start < 1.5
+    assert [(batch.provider, batch.results[0][0]) for batch in batches] == [(mirrors[1], "Dune")]
+
+
+def test_title_index_is_searched_and_fed(server, tmp_path):
+    server.add("/search/", results_page("Dune Part Two"))
+    base = server.url("/search/")
+    index = TitleIndex(tmp_path / "index.gz")
+    index.add(base, [("Dune", "/movie/dune")])
+
+    batches = _batches(ContentScraper(title_index=index), "dune", [base])
+
+    assert [batch.provider for batch in batches] == [INDEX_PROVIDER, base]
+    assert "Dune Part Two" in [title for title, _ in index.search("dune part two")]
+
+
+def test_embeds_are_extracted_and_cached(server, tmp_path):
+    server.add("/movie/1", b'<div id="player"><iframe src="/embed/1"></iframe></div>')
+    scraper = ContentScraper(resolution_cache=ResolutionCache(tmp_path / "cache.db"))
+    page = server.url("/movie/1")
+
+    async def fetch_twice(engine):
+        return [await engine.fetch_embed_from_page(page) for _ in range(2)]
+
+    assert _run(scraper, fetch_twice) == [server.url("/embed/1")] * 2
+    assert server.hits("/movie/") == 1
+
+
+def test_duckduckgo_results(server, monkeypatch):
+    server.add("/html/", b'<a class="result__url" href="https://youtube.com/x">youtube.com/x</a>')
+    monkeypatch.setattr(async_module, "DUCKDUCKGO_URL", server.url("/html/"))
+
+    results = _run(ContentScraper(), lambda engine: engine.search_duckduckgo("dune"))
+
+    assert results == [("youtube.com/x", "https://youtube.com/x")]
+    assert server.requests[0][1].startswith("/html/?q=dune")
@@ -0,0 +1,169 @@
+"""Tests for the SQLite-backed caches (franken_stream/cache.py)."""
+
+import time
+
+import requests
+
+from conftest import results_page
+from franken_stream.adapter import CachingAdapter
+from franken_stream.cache import (
+    EXPIRY_MARGIN,
+    ResolutionCache,
+    ResponseCache,
+    SearchCache,
+    SelectorProfile,
+    url_expiry,
+)
+from franken_stream.scraper import ContentScraper
+
+
+def _session(cache):
+    session = requests.Session()
+    session.mount("http://", CachingAdapter(cache))
+    return session
+
+
+def test_fresh_responses_are_served_from_disk(server, tmp_path):
+    server.add("/movie/", b"<html>detail</html>")
+    session = _session(ResponseCache(tmp_path / "cache.db"))
+
+    first = session.get(server.url("/movie/1"))
+    second = session.get(server.url("/movie/1"))
+
+    assert not getattr(first, "from_cache", False)
+    assert second.from_cache and second.content == b"<html>detail</html>"
+    assert second.headers["Content-Type"] == "text/html; charset=utf-8"
+    assert server.hits("/movie/") == 1
+
+
+def test_stale_responses_are_revalidated_with_their_etag(server, tmp_path):
+    server.add("/search/", b"<html>results</html>", headers={"ETag": '"v1"'})
+    session = _session(ResponseCache(tmp_path / "cache.db", default_ttl=0, ttl_rules=[]))
+
+    session.get(server.url("/search/dune"))
+    revalidated = session.get(server.url("/search/dune"))
+
+    assert revalidated.status_code == 200
+    assert revalidated.from_cache and revalidated.content == b"<html>results</html>"
+    _, _, headers = server.requests[-1]
+    assert headers.get("If-None-Match") == '"v1"'
+
+
+def test_no_store_and_streamed_responses_are_not_cached(server, tmp_path):
+    server.add("/private/", b"secret", headers={"Cache-Control": "no-store"})
+    server.add("/video/", b"bytes")
+    session = _session(ResponseCache(tmp_path / "cache.db"))
+
+    for _ in range(2):
+        session.get(server.url("/private/"))
+        session.get(server.url("/video/"), stream=True).close()
+
+    assert server.hits("/private/") == 2
+    assert server.hits("/video/") == 2
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=250)
+    cache.store("https://p.example/a", 200, {}, b"a" * 100)
+    cache.store("https://p.example/b", 200, {}, b"b" * 100)
+    cache.get("https://p.example/a")  # a is now more recently used than b
+    cache.store("https://p.example/c", 200, {}, b"c" * 100)
+
+    assert cache.get("https://p.example/b") is None
+    assert cache.get("https://p.example/a") is not None
+    assert cache.get("https://p.example/c") is not None
+
+    cache.store("https://p.example/huge", 200, {}, b"x" * 300)
+    assert cache.get("https://p.example/huge") is None
+
+
+def test_ttl_rules_first_match_wins(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db", default_ttl=10, ttl_rules=[("/search", 1)])
+    assert cache.ttl_for("https://p.example/search/dune") == 1
+    assert cache.ttl_for("https://p.example/movie/1") == 10
+
+
+def test_selector_profile_counts_hits_per_host(tmp_path):
+    profile = SelectorProfile(tmp_path / "cache.db")
+    for selector in ("a.film-name", "a.film-name", "h3 a"):
+        profile.record("p.example", selector)
+    profile.record("other.example", "h3 a")
+
+    assert profile.hits("p.example") == {"a.film-name": 2, "h3 a": 1}
+    profile.forget("p.example", "h3 a")
+    assert profile.hits("p.example") == {"a.film-name": 2}
+
+
+def test_verbose_search_reports_selector_hits(server, tmp_path, capsys):
+    server.add("/search/", results_page("Dune"))
+    profile = SelectorProfile(tmp_path / "cache.db")
+    scraper = ContentScraper(selector_profile=profile)
+
+    for _ in range(2):
+        scraper.search("dune", [server.url("/search/")], verbose=True, rank=False)
+
+    host = server.base.split("//")[1]
+    [(selector, count)] = profile.hits(host).items()
+    assert count == 2
+    assert f"Selector hits for {host}" in capsys.readouterr().out
+
+
+def test_search_cache_skips_empty_results(tmp_path):
+    cache = SearchCache(tmp_path / "cache.db")
+    cache.store("https://p.example/search/", "Dune", [])
+    assert cache.get("https://p.example/search/", "dune") is None
+
+    cache.store("https://p.example/search/", "Dune", [("Dune", "/movie/1")])
+    assert cache.get("https://p.example/search/", "DUNE!") == [("Dune", "/movie/1")]
+
+
+def test_empty_provider_page_is_retried_next_search(server, tmp_path):
+    server.add("/search/", b"<html><body>Try again later</body></html>")
+    scraper = ContentScraper(result_cache=SearchCache(tmp_path / "cache.db"))
+    assert scraper.search("dune", [server.url("/search/")], rank=False) == []
+
+    server.add("/search/", results_page("Dune"))
+    results = scraper.search("dune", [server.url("/search/")], rank=False)
+    assert [title for title, _ in results] == ["Dune"]
+    assert server.hits("/search/") == 2
+
+
+def test_url_expiry_hints():
+    assert url_expiry("https://cdn.example/v.m3u8?token=x&expires=1900000000") == 1900000000
+    assert url_expiry("https://cdn.example/v.m3u8?exp=1900000000000") == 1900000000
+    assert url_expiry("https://cdn.example/expire/1900000000/v.mp4") == 1900000000
+    amz = "https://s3.example/v.mp4?X-Amz-Date=20300101T000000Z&X-Amz-Expires=3600"
+    assert url_expiry(amz) == 1893456000 + 3600  # 2030-01-01T00:00Z + 1 h
+    assert url_expiry("https://cdn.example/v.mp4?e=1") is None
+    assert url_expiry("https://embed.example/e/123") is None
+
+
+def test_resolution_cache_honours_signed_url_expiry(tmp_path):
+    cache = ResolutionCache(tmp_path / "cache.db")
+    cache.set_embed("https://p.example/movie/1", "https://embed.example/e/1")
+    assert cache.get_embed("https://p.example/movie/1") == "https://embed.example/e/1"
+
+    soon = int(time.time()) + EXPIRY_MARGIN + 3600
+    cache.set_stream("https://embed.example/e/1", f"https://cdn.example/v.m3u8?expires={soon}")
+    assert cache.get_stream("https://embed.example/e/1").endswith(str(soon))
+
+    # Within the safety margin of its deadline: not worth storing
+    almost = int(time.time()) + EXPIRY_MARGIN // 2
+    cache.set_stream("https://embed.example/e/2", f"https://cdn.example/v.m3u8?expires={almost}")
+    assert cache.get_stream("https://embed.example/e/2") is None
+
+
+def test_resolution_cache_expires_unhinted_urls_after_their_ttl(tmp_path):
+    cache = ResolutionCache(tmp_path / "cache.db", embed_ttl=0)
+    cache.set_embed("https://p.example/movie/1", "https://embed.example/e/1")
+    assert cache.get_embed("https://p.example/movie/1") is None
+
+
+def test_known_pages_skip_the_detail_fetch(server, tmp_path):
+    server.add("/movie/", b"<html><body><iframe src='https://embed.example/e/7'></iframe></body>")
+    scraper = ContentScraper(resolution_cache=ResolutionCache(tmp_path / "cache.db"))
+
+    for _ in range(2):
+        embed = scraper.fetch_embed_from_page(server.url("/movie/7"))
+        assert embed == "https://embed.example/e/7"
+    assert server.hits("/movie/") == 1
@@ -0,0 +1,125 @@
+"""End-to-end tests for the machine-readable CLI commands (batch, --format)."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import results_page
+
+REPO_DIR = Path(__file__).resolve().parent
+
+
+@pytest.fixture
+def cli(server, tmp_path):
+    """Run franken-stream against the local server with a throwaway home."""
+    server.add("/a/search/", results_page("Dune", "Dune Part Two"))
+    server.add("/a/search/nothing", b"<html><body>No results</body></html>")
+    server.add("/b/search/", b"down", status=500)
+    config_dir = tmp_path / ".franken-stream"
+    config_dir.mkdir()
+    (config_dir / "providers.json").write_text(
+        json.dumps(
+            {
+                "movie_search_bases": [server.url("/a/search/"), server.url("/b/search/")],
+                "embed_fallbacks": [],
+            }
+        )
+    )
+    env = dict(os.environ, HOME=str(tmp_path), PYTHONPATH=str(REPO_DIR), COLUMNS="200")
+
+    def run(*args: str, stdin: str = "") -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-m", "franken_stream.main", *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=tmp_path,
+            timeout=60,
+        )
+
+    return run
+
+
+def _lines(stdout):
+    return [json.loads(line) for line in stdout.splitlines()]
+
+
+def test_batch_writes_one_json_line_per_query(cli, server):
+    result = cli("batch", "-", "--no-cache", stdin="dune\n\n# skipped\nnothing\n")
+
+    assert result.returncode == 0, result.stderr
+    records = {record["query"]: record for record in _lines(result.stdout)}
+    assert sorted(records) == ["dune", "nothing"]
+    assert (records["dune"]["line"], records["nothing"]["line"]) == (1, 4)
+
+    dune = records["dune"]
+    assert [item["title"] for item in dune["results"]] == ["Dune", "Dune Part Two"]
+    assert dune["results"][0]["url"] == server.url("/movie/0")
+    assert dune["results"][0]["provider"] == server.url("/a/search/")
+    errors = {provider["provider"]: provider["error"] for provider in dune["providers"]}
+    assert errors[server.url("/a/search/")] is None
+    assert errors[server.url("/b/search/")] is not None
+
+    assert records["nothing"]["results"] == []
+
+
+def test_batch_reads_queries_from_a_file(cli, tmp_path):
+    (tmp_path / "watchlist.txt").write_text("dune\ndune part two\n", encoding="utf-8")
+    result = cli("batch", "watchlist.txt", "--no-cache", "--limit", "1")
+
+    assert result.returncode == 0, result.stderr
+    records = _lines(result.stdout)
+    assert sorted(record["line"] for record in records) == [1, 2]
+    assert all(len(record["results"]) == 1 for record in records)
+
+
+def test_watch_ndjson_streams_providers_then_ranked_results(cli):
+    result = cli("watch", "dune", "--format", "ndjson", "--no-cache")
+
+    assert result.returncode == 0, result.stderr
+    records = _lines(result.stdout)
+    assert [record["type"] for record in records] == ["provider", "provider", "results"]
+    assert {record["error"] is None for record in records[:2]} == {True, False}
+    assert records[-1]["results"][0]["title"] == "Dune"
+    assert records[-1]["results"][0]["rank"] == 1
+
+
+def test_watch_json_prints_one_document(cli):
+    result = cli("watch", "dune", "--format", "json", "--no-cache")
+
+    assert result.returncode == 0, result.stderr
+    document = json.loads(result.stdout)
+    assert [item["title"] for item in document["results"]] == ["Dune", "Dune Part Two"]
+    assert len(document["providers"]) == 2
+
+
+def test_watch_json_exits_nonzero_without_results(cli):
+    result = cli("watch", "nothing", "--format", "json", "--no-cache")
+
+    assert result.returncode == 1
+    assert json.loads(result.stdout)["results"] == []
+
+
+def test_watch_prefetches_relative_results(cli, server):
+    # The provider's hrefs are relative (/movie/0), like real search pages
+    server.add("/movie/0", b'<html><body><div id="player"><iframe src="/embed/0"></iframe>')
+    result = cli("watch", "dune", "--no-cache", "--prefetch", "1", stdin="1\n")
+
+    assert result.returncode == 0, result.stderr
+    assert "Using prefetched embed" in result.stdout
+    assert server.url("/movie/0") in result.stdout
+
+
+def test_watch_prewarms_the_hosts_of_relative_results(cli, server):
+    server.add("/", b"")
+    # The slow detail page keeps the process alive until the warm-up has run
+    server.add("/movie/0", b"<html></html>", delay=0.5)
+    result = cli("watch", "dune", "--no-cache", stdin="1\n")
+
+    assert result.returncode == 0, result.stderr
+    assert ("HEAD", "/") in [(method, path) for method, path, _ in server.requests]
@@ -0,0 +1,84 @@
+"""Tests for embed extraction from detail pages (ContentScraper._extract_embed)."""
+
+import pytest
+
+from franken_stream.scraper import (
+    DIRECT_URL_INDEX,
+    EMBED_PATTERNS,
+    ContentScraper,
+    _scan_embed_patterns,
+)
+
+PAGE_URL = "https://p.example/movie/dune-1"
+
+
+def _embed(body):
+    markup = f"<html><body>{body}</body></html>"
+    return ContentScraper._extract_embed(markup, PAGE_URL, quiet=True)
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        # A player container outranks an earlier keyword-only iframe
+        (
+            '<iframe src="https://ads.example/embed/banner"></iframe>'
+            '<div class="player-container"><iframe src="https://v.example/e/1"></iframe></div>',
+            "https://v.example/e/1",
+        ),
+        (
+            '<iframe src="https://ads.example/banner"></iframe>'
+            '<iframe src="https://v.example/watch/2"></iframe>',
+            "https://v.example/watch/2",
+        ),
+        ('<div id="player"><iframe src="/e/3"></iframe></div>', "https://p.example/e/3"),
+        ('<iframe src="//v.example/vid/4"></iframe>', "https://v.example/vid/4"),
+        (
+            '<video><source src="https://cdn.example/5.m3u8"></video>',
+            "https://cdn.example/5.m3u8",
+        ),
+        ('<a href="/about">About</a><a href="/embed/6">Play</a>', "https://p.example/embed/6"),
+        # Iframes beat videos, videos beat links, wherever they appear
+        (
+            '<a href="/embed/7">Play</a><video src="https://cdn.example/7.mp4"></video>'
+            '<iframe src="https://v.example/embed/7"></iframe>',
+            "https://v.example/embed/7",
+        ),
+    ],
+)
+def test_best_candidate_wins(body, expected):
+    assert _embed(body) == expected
+
+
+def test_regex_fallbacks_find_urls_outside_elements():
+    script = "<script>player.setup({file: 'https://cdn.example/8.m3u8'})</script>"
+    assert _embed(script) == "https://cdn.example/8.m3u8"
+    assert _embed('<div data-url="https://v.example/e/9"></div>') == "https://v.example/e/9"
+    assert _embed('<a href="#">Home</a>') is None
+
+
+def test_pattern_scan_matches_each_pattern_separately():
+    markup = (
+        '<iframe data-url="https://v.example/d" src="https://cdn.example/a.m3u8"></iframe>'
+        '<a href="https://v.example/player/b">b</a>'
+    )
+    found = _scan_embed_patterns(markup)
+    by_type = {
+        EMBED_PATTERNS[index][1]: urls
+        for index, urls in found.items()
+        if index != DIRECT_URL_INDEX
+    }
+
+    # Overlapping matches are all reported, as separate re.findall calls would
+    assert by_type["iframe src"] == ["https://cdn.example/a.m3u8"]
+    assert by_type["HLS stream"] == ["https://cdn.example/a.m3u8"]
+    assert by_type["data-url attribute"] == ["https://v.example/d"]
+    assert by_type["embed link"] == ["https://v.example/player/b"]
+    assert found[DIRECT_URL_INDEX] == ["https://cdn.example/a.m3u8"]
+    assert _scan_embed_patterns(markup.encode()) == found
+
+
+def test_embed_from_fetched_page(server):
+    server.add("/movie/", b'<div id="player"><iframe src="/embed/10"></iframe></div>')
+    embed = ContentScraper().fetch_embed_from_page(server.url("/movie/10"))
+    assert embed == server.url("/embed/10")
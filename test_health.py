@@ -0,0 +1,111 @@
+"""Tests for the provider health scoreboard (franken_stream/health.py)."""
+
+import threading
+
+import pytest
+
+from franken_stream.health import CLOSED, HALF_OPEN, OPEN, ProviderHealth
+
+PROVIDER = "https://p.example/search/"
+
+
+def test_moving_averages(tmp_path):
+    health = ProviderHealth(tmp_path / "cache.db", alpha=0.5)
+    health.record_success(PROVIDER, 1.0)
+    health.record_success(PROVIDER, 3.0)
+    health.record_failure(PROVIDER)
+
+    record = health.get(PROVIDER)
+    assert record.success_rate == pytest.approx(0.5)
+    assert record.latency == pytest.approx(2.0)
+    assert (record.samples, record.failures, record.state) == (3, 1, CLOSED)
+
+
+def test_circuit_opens_after_consecutive_failures_and_recovers(tmp_path):
+    health = ProviderHealth(tmp_path / "cache.db", failure_threshold=3, cooldown=60)
+    for _ in range(2):
+        health.record_failure(PROVIDER)
+    assert health.allow(PROVIDER)
+
+    health.record_failure(PROVIDER)
+    assert health.get(PROVIDER).state == OPEN
+    assert not health.allow(PROVIDER)
+
+    # Cooldown over: one half-open retry, and a success closes the circuit
+    health._execute("UPDATE provider_health SET opened_at = opened_at - 61")
+    assert health.get(PROVIDER).state == HALF_OPEN
+    assert health.allow(PROVIDER)
+    assert not health.allow(PROVIDER)
+    health.record_success(PROVIDER, 0.2)
+    assert health.get(PROVIDER).state == CLOSED
+
+
+def test_failed_retry_doubles_the_cooldown(tmp_path):
+    health = ProviderHealth(tmp_path / "cache.db", failure_threshold=1, cooldown=60)
+    health.record_failure(PROVIDER)
+    health._execute("UPDATE provider_health SET opened_at = opened_at - 61")
+    assert health.allow(PROVIDER)
+
+    health.record_failure(PROVIDER)
+    health._execute("UPDATE provider_health SET opened_at = opened_at - 61")
+    record = health.get(PROVIDER)
+    assert (record.trips, record.state) == (2, OPEN)
+
+
+def test_rank_puts_unknown_then_healthiest_first(tmp_path):
+    health = ProviderHealth(tmp_path / "cache.db")
+    health.record_success("https://fast.example/", 0.1)
+    health.record_success("https://slow.example/", 2.0)
+    health.record_failure("https://flaky.example/")
+
+    ranked = health.rank(
+        ["https://flaky.example/", "https://slow.example/", "https://new.example/",
+         "https://fast.example/"]
+    )
+    assert ranked == [
+        "https://new.example/", "https://fast.example/", "https://slow.example/",
+        "https://flaky.example/",
+    ]
+
+
+def test_concurrent_updates_are_not_lost(tmp_path):
+    """Separate connections, as with a TUI and a CLI search sharing the database."""
+    path = tmp_path / "cache.db"
+    stores = [ProviderHealth(path, failure_threshold=1000) for _ in range(4)]
+    barrier = threading.Barrier(len(stores))
+
+    def worker(health):
+        barrier.wait()
+        for _ in range(25):
+            health.record_failure(PROVIDER)
+
+    threads = [threading.Thread(target=worker, args=(health,)) for health in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    record = ProviderHealth(path).get(PROVIDER)
+    assert (record.samples, record.failures) == (100, 100)
+
+
+def test_only_one_half_open_retry_is_granted(tmp_path):
+    path = tmp_path / "cache.db"
+    ProviderHealth(path, failure_threshold=1).record_failure(PROVIDER)
+    ProviderHealth(path)._execute("UPDATE provider_health SET opened_at = opened_at - 1000")
+
+    stores = [ProviderHealth(path) for _ in range(8)]
+    barrier = threading.Barrier(len(stores))
+    granted = []
+
+    def worker(health):
+        barrier.wait()
+        granted.append(health.allow(PROVIDER))
+
+    threads = [threading.Thread(target=worker, args=(health,)) for health in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert granted.count(True) == 1
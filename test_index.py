@@ -0,0 +1,122 @@
+"""Tests for the local title index (franken_stream/index.py)."""
+
+import gzip
+import threading
+import time
+
+from franken_stream.index import TitleIndex
+
+BASE = "https://provider.example/search/"
+
+
+def _titles(prefix, count):
+    return [(f"{prefix} Movie {i}", f"/movie/{prefix.lower()}-{i}") for i in range(count)]
+
+
+def test_search_finds_exact_prefix_and_misspelled_titles(tmp_path):
+    index = TitleIndex(tmp_path / "index.gz")
+    index.add(BASE, [("Inception (2010)", "/movie/inception"), ("Interstellar", "/movie/inter")])
+
+    assert index.search("inception")[0] == (
+        "Inception (2010)", "https://provider.example/movie/inception"
+    )
+    assert index.search("interst")[0][0] == "Interstellar"
+    assert index.search("inceptoin")[0][0] == "Inception (2010)"
+    assert index.search("inception", providers=["https://other.example/"]) == []
+
+
+def test_save_and_reload_round_trip(tmp_path):
+    path = tmp_path / "index.gz"
+    index = TitleIndex(path)
+    index.add(BASE, _titles("Alpha", 50))
+    assert index.save()
+
+    reloaded = TitleIndex(path)
+    assert reloaded.count() == 50
+    assert reloaded.search("alpha movie 7")[0][0] == "Alpha Movie 7"
+
+
+def test_concurrent_saves_never_corrupt_the_file(tmp_path):
+    path = tmp_path / "index.gz"
+    index = TitleIndex(path)
+    errors = []
+
+    def worker(n):
+        try:
+            for round_ in range(10):
+                index.add(f"https://p{n}.example/search/", _titles(f"T{n}x{round_}", 5))
+                assert index.save()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert TitleIndex(path).count() == 8 * 10 * 5
+
+
+def test_corrupt_file_is_treated_as_empty(tmp_path):
+    path = tmp_path / "index.gz"
+    index = TitleIndex(path)
+    index.add(BASE, _titles("Beta", 20))
+    index.save()
+    # Truncated gzip stream, as left behind by an interrupted writer
+    path.write_bytes(path.read_bytes()[:200])
+
+    damaged = TitleIndex(path)
+    assert damaged.search("beta") == []
+    damaged.add(BASE, _titles("Gamma", 3))
+    assert damaged.save()
+    assert TitleIndex(path).count() == 3
+
+
+def test_garbage_payloads_are_treated_as_empty(tmp_path):
+    path = tmp_path / "index.gz"
+    # Valid gzip header, damaged deflate stream: raises zlib.error
+    bad_block = bytearray(gzip.compress(b"FSIX1\n" + b"x" * 5000))
+    bad_block[10] = 0xFF
+    payloads = (
+        b"\x1f\x8b\x08\x00garbage",
+        bytes(bad_block),
+        gzip.compress(b"FSIX1\n\x05\x00\x00\x00{bad}"),
+        gzip.compress(b'FSIX1\n\x02\x00\x00\x00{}'),
+    )
+    for payload in payloads:
+        path.write_bytes(payload)
+        assert TitleIndex(path).count() == 0
+
+
+def test_seeing_known_titles_again_does_not_dirty_the_index(tmp_path):
+    index = TitleIndex(tmp_path / "index.gz")
+    index.add(BASE, _titles("Delta", 10))
+    index.save()
+
+    assert index.add(BASE, _titles("Delta", 10)) == 0
+    assert not index._dirty
+
+
+def test_save_later_writes_in_the_background(tmp_path):
+    path = tmp_path / "index.gz"
+    index = TitleIndex(path)
+    index.add(BASE, _titles("Echo", 4))
+
+    start = time.perf_counter()
+    index.save_later(delay=0.05)
+    assert time.perf_counter() - start < 0.05
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert TitleIndex(path).count() == 4
+
+
+def test_eviction_keeps_the_most_recently_seen(tmp_path):
+    index = TitleIndex(tmp_path / "index.gz", max_titles=100)
+    for n in range(5):
+        index.add(BASE, _titles(f"Batch{n}", 40))
+    assert index.count() <= 100
+    assert index.search("batch4 movie 3")[0][0] == "Batch4 Movie 3"
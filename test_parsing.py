@@ -0,0 +1,148 @@
+"""Parity tests: the streaming scanner against BeautifulSoup."""
+
+import pytest
+import requests
+
+from conftest import results_page
+from franken_stream.parsing import (
+    PARSER_ENV,
+    available_backends,
+    compile_selector,
+    decode_markup,
+    default_backend,
+    make_soup,
+    response_markup,
+    scan_elements,
+)
+from franken_stream.scraper import ContentScraper
+
+BACKENDS = available_backends()
+TITLES = ("Amélie", "Léon: The Professional", "Das Boot", "Crème brûlée")
+
+PAGE = """<html><head>{meta}<title>Results</title></head><body>
+<div id="results" class="grid">
+  <div class="card featured"><a class="film-name" href="/movie/1" data-id="1">{0}</a></div>
+  <section><div class="card"><p><a class="film-name" href="/movie/2">{1}</a></p></div></section>
+  <ul class="list"><li><a href="/watch/3" title="Three">{2}</a></li></ul>
+  <a href="/tv/4" class="film-name extra" lang="en-GB">{3}</a>
+  <a href="#">Home</a>
+</div>
+</body></html>"""
+
+
+def _page(encoding, meta=True):
+    declared = f'<meta charset="{encoding}">' if meta else ""
+    return PAGE.format(*TITLES, meta=declared).encode(encoding)
+
+
+def _scanned_texts(markup, selector, backend, encoding=None):
+    compiled = compile_selector(selector)
+    elements = scan_elements(markup, (compiled.tag,), backend=backend, encoding=encoding)
+    return [element.get_text(strip=True) for element in elements if compiled.match(element)]
+
+
+def _soup_texts(markup, selector):
+    return [tag.get_text(strip=True) for tag in make_soup(markup, "html.parser").select(selector)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1", "cp1252", "utf-16"])
+def test_declared_charset_matches_beautifulsoup(encoding, backend):
+    markup = _page(encoding)
+    expected = _soup_texts(markup, "a.film-name")
+
+    assert expected == [TITLES[0], TITLES[1], TITLES[3]]
+    assert _scanned_texts(markup, "a.film-name", backend) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_undeclared_latin1_falls_back_like_beautifulsoup(backend):
+    markup = _page("latin-1", meta=False)
+    assert _scanned_texts(markup, "a.film-name", backend) == _soup_texts(markup, "a.film-name")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_http_charset_overrides_detection(backend):
+    markup = "<html><body><a class='film-name' href='/m'>Ｔｏｋｙｏ 東京</a></body></html>"
+    raw = markup.encode("shift_jis")
+    assert _scanned_texts(raw, "a", backend, encoding="shift_jis") == ["Ｔｏｋｙｏ 東京"]
+
+
+def test_decode_markup_order():
+    assert decode_markup("already text") == "already text"
+    assert decode_markup("é".encode("utf-8")) == "é"
+    assert decode_markup(b'<meta charset="latin-1">\xe9').endswith("é")
+    assert decode_markup(b"\xe9\x80") == "é€"  # windows-1252 fallback
+    assert decode_markup(b"\xe9", encoding="no-such-codec") == "é"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "a",
+        "div a",
+        "#results a",
+        "div.card > a",
+        "div.card a",
+        "section > div > p > a",
+        "div > a.film-name",
+        ".card.featured a",
+        "a[href*='/watch/']",
+        'a[href^="/movie/"]',
+        "a[href$='/4']",
+        "a[data-id='1']",
+        "a[title]",
+        "a[class~=extra]",
+        "a[lang|=en]",
+        "ul.list li > a",
+        "#results > a",
+        "a.film-name.extra",
+    ],
+)
+def test_selector_matches_beautifulsoup(selector, backend):
+    markup = _page("utf-8")
+    assert _scanned_texts(markup, selector, backend) == _soup_texts(markup, selector)
+
+
+def test_unsupported_selectors_are_rejected():
+    for selector in ("a:first-child", "div + a", "> a", "div >"):
+        with pytest.raises(ValueError):
+            compile_selector(selector)
+
+
+def test_search_decodes_with_the_http_charset(server):
+    body = results_page("Amélie", "Léon").decode().encode("latin-1")
+    server.add("/search/", body, headers={"Content-Type": "text/html; charset=ISO-8859-1"})
+
+    results = ContentScraper().search("amelie", [server.url("/search/")], rank=False)
+    assert [title for title, _ in results] == ["Amélie", "Léon"]
+
+
+def test_response_markup_keeps_bytes_without_a_charset(server):
+    server.add("/plain/", b"<html></html>", headers={"Content-Type": "text/html"})
+    server.add("/latin/", b"\xe9", headers={"Content-Type": "text/html; charset=latin-1"})
+
+    assert response_markup(requests.get(server.url("/plain/"))) == b"<html></html>"
+    assert response_markup(requests.get(server.url("/latin/"))) == "é"
+
+
+def test_parser_env_picks_an_installed_backend(monkeypatch):
+    default_backend.cache_clear()
+    try:
+        monkeypatch.setenv(PARSER_ENV, "html.parser")
+        assert default_backend() == "html.parser"
+
+        default_backend.cache_clear()
+        monkeypatch.setenv(PARSER_ENV, "no-such-parser")
+        assert default_backend() == available_backends()[0]
+    finally:
+        default_backend.cache_clear()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_make_soup_backends_agree(backend):
+    soup = make_soup(_page("latin-1"), backend)
+    assert [a.get_text(strip=True) for a in soup.select("a.film-name")] == [
+        TITLES[0], TITLES[1], TITLES[3]
+    ]
@@ -0,0 +1,52 @@
+"""Tests for speculative embed resolution (franken_stream/prefetch.py)."""
+
+import threading
+import time
+
+from franken_stream.prefetch import Prefetcher, TokenBucket
+from franken_stream.scraper import ContentScraper
+
+
+def _detail_page(n):
+    return f'<html><body><div id="player"><iframe src="/embed/{n}"></iframe></div></body></html>'
+
+
+def test_token_bucket_limits_the_rate():
+    bucket = TokenBucket(rate=10000)
+    start = time.perf_counter()
+    assert bucket.consume(10000)  # the initial burst is free
+    assert bucket.consume(3000)
+    assert 0.25 < time.perf_counter() - start < 1
+
+
+def test_token_bucket_wait_can_be_cancelled():
+    bucket = TokenBucket(rate=100)
+    bucket.consume(100)
+    cancel = threading.Event()
+    threading.Timer(0.05, cancel.set).start()
+    assert not bucket.consume(100, cancel)
+
+
+def test_top_results_are_resolved_ahead_of_the_choice(server):
+    for n in range(4):
+        server.add(f"/movie/{n}", _detail_page(n).encode())
+    pages = [server.url(f"/movie/{n}") for n in range(4)]
+
+    prefetcher = Prefetcher(ContentScraper(), pages, count=2, resolve_streams=False).start()
+    claimed = prefetcher.claim(pages[1], timeout=5)
+
+    assert claimed.embed_url == server.url("/embed/1")
+    assert claimed.stream_url is None
+    assert prefetcher.claim(pages[3]) is None
+    assert server.hits("/movie/3") == 0
+
+
+def test_pages_over_the_byte_budget_are_abandoned(server):
+    server.add("/movie/big", _detail_page(1).encode() + b" " * 100_000)
+    page = server.url("/movie/big")
+
+    prefetcher = Prefetcher(
+        ContentScraper(), [page], max_bytes=10_000, resolve_streams=False
+    ).start()
+
+    assert prefetcher.claim(page, timeout=5).embed_url is None
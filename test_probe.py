@@ -0,0 +1,47 @@
+"""Tests for provider probing (ContentScraper.probe_providers)."""
+
+import time
+
+from franken_stream.scraper import ContentScraper, _percentile
+
+
+def test_percentile_is_nearest_rank():
+    values = [0.5, 0.1, 0.4, 0.2, 0.3]
+    assert _percentile(values, 50) == 0.3
+    assert _percentile(values, 95) == 0.5
+    assert _percentile([0.7], 50) == 0.7
+    assert _percentile([], 50) is None
+
+
+def test_providers_are_probed_in_parallel(server):
+    for name in ("a", "b", "c"):
+        server.add(f"/{name}/", b"ok", delay=0.3)
+    urls = [server.url(f"/{name}/") for name in ("a", "b", "c")]
+
+    start = time.perf_counter()
+    stats = ContentScraper().probe_providers(urls, samples=2)
+
+    assert time.perf_counter() - start < 1.2
+    assert [stat.url for stat in stats] == urls
+    assert all(stat.healthy and stat.samples == 2 for stat in stats)
+    assert all(0.25 < stat.p50 < 1 for stat in stats)
+
+
+def test_head_unsupported_falls_back_to_a_ranged_get(server):
+    server.add("/nohead/", b"x" * 10_000, allow_head=False)
+    server.add("/down/", b"", status=503)
+
+    nohead, down = ContentScraper().probe_providers(
+        [server.url("/nohead/"), server.url("/down/")], samples=1
+    )
+
+    assert (nohead.healthy, nohead.method, nohead.status) == (True, "GET", 200)
+    assert _range_requested(server, "/nohead/")
+    assert (down.healthy, down.error) == (False, "HTTP 503")
+
+
+def _range_requested(server, prefix):
+    return any(
+        method == "GET" and path.startswith(prefix) and "Range" in headers
+        for method, path, headers in server.requests
+    )
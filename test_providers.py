@@ -0,0 +1,92 @@
+"""Tests for declarative provider rules (franken_stream/providers.py)."""
+
+import json
+
+import pytest
+
+from franken_stream.providers import ProviderManager, ProviderRules
+from franken_stream.scraper import ContentScraper
+
+SEARCH_PAGE = b"""<html><body>
+<div class="flw-item"><h3 class="film-name"><a href="/movie/dune-1" title="Dune">D...</a></h3></div>
+<div class="flw-item"><h3 class="film-name"><a href="/movie/dune-1" title="Dune">D...</a></h3></div>
+<div class="flw-item"><h3 class="film-name"><a href="#" title="Ad">Ad</a></h3></div>
+<div class="flw-item"><h3 class="film-name"><a href="/movie/dune-2" title="Dune 2">D2</a></h3></div>
+<a class="film-name" href="/movie/other" title="Other">Other</a>
+</body></html>"""
+
+DETAIL_PAGE = b"""<html><body>
+<iframe src="https://ads.example/banner"></iframe>
+<div id="player"><iframe id="iframe-embed" src="/embed/42"></iframe></div>
+</body></html>"""
+
+
+def test_result_selector_extracts_unique_titled_links():
+    rules = ProviderRules("p.example", result_selector="h3.film-name a", title_attr="title")
+    assert rules.extract_results(SEARCH_PAGE) == [
+        ("Dune", "/movie/dune-1"),
+        ("Dune 2", "/movie/dune-2"),
+    ]
+    assert rules.extract_results(SEARCH_PAGE, limit=1) == [("Dune", "/movie/dune-1")]
+
+
+def test_iframe_selector_picks_the_player():
+    rules = ProviderRules("p.example", iframe_selector="#player > iframe")
+    assert rules.extract_embed(DETAIL_PAGE) == "/embed/42"
+    assert ProviderRules("p.example").extract_embed(DETAIL_PAGE) is None
+
+
+def test_embed_url_template_placeholders():
+    rules = ProviderRules("p.example", embed_url_template="https://embed.example/{id}?s={slug}")
+    assert rules.embed_url("https://p.example/movie/dune-part-two-1234/") == (
+        "https://embed.example/1234?s=dune-part-two-1234"
+    )
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"result_selector": "a:hover"},
+        {"result_selector": ".film-name"},  # no tag to scan for
+        {"embed_url_template": "https://embed.example/{imdb}"},
+        {"results": "a"},
+        ["a"],
+    ],
+)
+def test_invalid_rules_fail_at_load_time(config):
+    with pytest.raises(ValueError):
+        ProviderRules.from_config("p.example", config)
+
+
+def test_manager_compiles_rules_and_skips_invalid_entries(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config_dir = tmp_path / ".franken-stream"
+    config_dir.mkdir()
+    (config_dir / "providers.json").write_text(
+        json.dumps(
+            {
+                "movie_search_bases": ["https://good.example/search/"],
+                "provider_rules": {
+                    "https://good.example/search/": {"result_selector": "h3 a"},
+                    "bad.example": {"result_selector": "a::before"},
+                },
+            }
+        )
+    )
+
+    manager = ProviderManager()
+    manager.load_providers()
+
+    assert list(manager.rules) == ["good.example"]
+
+
+def test_search_uses_rules_before_generic_extractors(server):
+    server.add("/search/", SEARCH_PAGE)
+    host = server.base.split("//")[1]
+    rules = {host: ProviderRules(host, result_selector="h3.film-name a", title_attr="title")}
+
+    results = ContentScraper(provider_rules=rules).search(
+        "dune", [server.url("/search/")], rank=False
+    )
+
+    assert [title for title, _ in results] == ["Dune", "Dune 2"]
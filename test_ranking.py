@@ -0,0 +1,66 @@
+"""Tests for cross-provider ranking (franken_stream/ranking.py)."""
+
+from franken_stream.ranking import normalize, rank_results, similarity
+
+
+def _titles(ranked):
+    return [result.title for result in ranked]
+
+
+def test_normalize_drops_release_tags_and_year():
+    normalized = normalize("Watch Inception (2010) 1080p HD Online Free")
+    assert normalized.words == frozenset({"inception"})
+    assert normalized.year == "2010"
+    assert normalize("Spider-Man").key == normalize("Spiderman").key
+    assert normalize("Amélie").words == frozenset({"amelie"})
+
+
+def test_similarity_tolerates_typos_but_prefers_exact():
+    query = normalize("interstellar")
+    exact, typo, other = (normalize(t) for t in ("Interstellar", "Intersteller", "Insidious"))
+    assert similarity(query, exact) > similarity(query, typo) > similarity(query, other)
+
+
+def test_best_match_comes_first_regardless_of_provider_order():
+    ranked = rank_results(
+        "the dark knight",
+        [
+            ("https://a.example/", [("Dark Shadows", "/a/1"), ("Knight and Day", "/a/2")]),
+            ("https://b.example/", [("The Dark Knight", "/b/1")]),
+        ],
+    )
+    assert _titles(ranked)[0] == "The Dark Knight"
+
+
+def test_duplicates_cluster_into_one_row():
+    ranked = rank_results(
+        "inception",
+        [
+            ("https://a.example/", [("Inception (2010)", "/a/1")]),
+            ("https://b.example/", [("Inception HD", "/b/1"), ("Insidious", "/b/2")]),
+            ("https://c.example/", [("Watch Inception 2010 Online Free", "/c/1")]),
+        ],
+    )
+    assert _titles(ranked) == ["Inception (2010)", "Insidious"]
+    assert len(ranked[0].duplicates) == 2
+
+
+def test_conflicting_years_stay_separate_and_the_asked_year_wins():
+    ranked = rank_results(
+        "dune 2021",
+        [
+            ("https://a.example/", [("Dune (1984)", "/a/1")]),
+            ("https://b.example/", [("Dune (2021)", "/b/1")]),
+        ],
+    )
+    assert _titles(ranked) == ["Dune (2021)", "Dune (1984)"]
+
+
+def test_reputation_breaks_ties_between_equal_titles():
+    batches = [
+        ("https://flaky.example/", [("Tenet (2020)", "/f/1")]),
+        ("https://solid.example/", [("Tenet (2019)", "/s/1")]),
+    ]
+    reputation = {"https://flaky.example/": 0.1, "https://solid.example/": 1.0}
+    ranked = rank_results("tenet", batches, reputation)
+    assert ranked[0].provider == "https://solid.example/"
@@ -0,0 +1,91 @@
+"""Tests for in-process yt-dlp resolution (franken_stream/resolver.py)."""
+
+import threading
+import time
+
+import pytest
+
+from franken_stream.resolver import YtDlpResolver
+
+pytest.importorskip("yt_dlp")
+
+
+def test_media_url_mirrors_get_url():
+    assert YtDlpResolver._media_url(None) is None
+    assert YtDlpResolver._media_url({"url": "https://cdn.example/a.mp4"}) == (
+        "https://cdn.example/a.mp4"
+    )
+    merged = {"requested_formats": [{"url": "https://cdn.example/v"}, {"url": "x"}]}
+    assert YtDlpResolver._media_url(merged) == "https://cdn.example/v"
+    search = {"entries": [None, {"url": "https://cdn.example/first.mp4"}]}
+    assert YtDlpResolver._media_url(search) == "https://cdn.example/first.mp4"
+    assert YtDlpResolver._media_url({"entries": []}) is None
+
+
+def test_direct_media_resolves_in_process_and_reuses_the_instance(server):
+    server.add("/video.mp4", b"\x00" * 1024, headers={"Content-Type": "video/mp4"})
+    resolver = YtDlpResolver(timeout=5)
+    url = server.url("/video.mp4")
+
+    assert resolver.get_url(url) == url
+    ydl = resolver._idle.get_nowait()
+    resolver._idle.put(ydl)
+    assert resolver.get_url(url) == url
+    assert resolver._idle.qsize() == 1 and resolver._idle.get_nowait() is ydl
+
+
+def test_failed_extraction_returns_none_and_keeps_the_instance(server):
+    resolver = YtDlpResolver(timeout=5)
+    assert resolver.get_url(server.url("/missing.mp4")) is None
+    assert resolver._idle.qsize() == 1
+
+
+def test_cancelled_resolution_never_starts(server):
+    cancel = threading.Event()
+    cancel.set()
+    assert YtDlpResolver().get_url(server.url("/video.mp4"), cancel) is None
+    assert server.requests == []
+
+
+def test_failed_extraction_prints_nothing(server, capfd):
+    assert YtDlpResolver(timeout=5).get_url(server.url("/missing.mp4")) is None
+    out, err = capfd.readouterr()
+    assert out == "" and err == ""
+
+
+class _StalledYoutubeDL:
+    """Stands in for a YoutubeDL whose extraction hangs past any socket timeout."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def extract_info(self, target, download=False):
+        self.release.wait(10)
+        return {"url": target}
+
+
+def test_stalled_extraction_is_abandoned_at_the_timeout():
+    resolver = YtDlpResolver(timeout=0.5)
+    stalled = _StalledYoutubeDL()
+    resolver._idle.put(stalled)
+
+    start = time.monotonic()
+    assert resolver.get_url("https://example.invalid/slow") is None
+    assert time.monotonic() - start < 2
+
+    # The instance rejoins the pool once its extraction ends
+    stalled.release.set()
+    assert resolver._idle.get(timeout=2) is stalled
+
+
+def test_cancel_abandons_a_running_extraction():
+    resolver = YtDlpResolver(timeout=30)
+    stalled = _StalledYoutubeDL()
+    resolver._idle.put(stalled)
+    cancel = threading.Event()
+    threading.Timer(0.3, cancel.set).start()
+
+    start = time.monotonic()
+    assert resolver.get_url("https://example.invalid/slow", cancel) is None
+    assert time.monotonic() - start < 2
+    stalled.release.set()
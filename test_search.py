@@ -0,0 +1,201 @@
+"""Tests for provider fan-out in ContentScraper.search and iter_search."""
+
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+from conftest import results_page
+from franken_stream import scraper as scraper_module
+from franken_stream.cache import ResponseCache
+from franken_stream.health import ProviderHealth
+from franken_stream.index import INDEX_PROVIDER, TitleIndex
+from franken_stream.scraper import ContentScraper
+
+REPO_DIR = Path(__file__).resolve().parent
+
+
+def test_concurrent_search_takes_the_slowest_provider_not_the_sum(server):
+    for name in ("a", "b", "c"):
+        server.add(f"/{name}/search/", results_page(f"Dune {name}"), delay=0.5)
+    bases = [server.url(f"/{name}/search/") for name in ("a", "b", "c")]
+
+    start = time.perf_counter()
+    results = ContentScraper().search("dune", bases, concurrent=True, rank=False)
+    elapsed = time.perf_counter() - start
+
+    assert [title for title, _ in results] == ["Dune a", "Dune b", "Dune c"]
+    assert elapsed < 1.2
+
+
+def test_overall_deadline_abandons_slow_providers(server):
+    server.add("/fast/search/", results_page("Dune"))
+    server.add("/slow/search/", results_page("Dune Slow"), delay=3)
+    bases = [server.url("/slow/search/"), server.url("/fast/search/")]
+
+    start = time.perf_counter()
+    results = ContentScraper().search(
+        "dune", bases, concurrent=True, overall_timeout=0.5, rank=False
+    )
+
+    assert time.perf_counter() - start < 1.5
+    assert [title for title, _ in results] == ["Dune"]
+
+
+def test_provider_timeout_reports_an_error_batch(server):
+    server.add("/slow/search/", results_page("Dune"), delay=2)
+    batches = list(
+        ContentScraper().iter_search(
+            "dune", [server.url("/slow/search/")], concurrent=True, provider_timeout=0.3
+        )
+    )
+    assert len(batches) == 1
+    assert batches[0].results == []
+    assert batches[0].error is not None
+
+
+def test_deadline_bounds_process_lifetime(server):
+    """Abandoned requests must not keep the interpreter alive at exit."""
+    server.add("/fast/search/", results_page("Dune"))
+    server.add("/slow/search/", results_page("Dune Slow"), delay=6)
+    script = textwrap.dedent(
+        f"""
+        from franken_stream.scraper import ContentScraper
+        bases = [{server.url("/slow/search/")!r}, {server.url("/fast/search/")!r}]
+        results = ContentScraper().search(
+            "dune", bases, concurrent=True, overall_timeout=1, provider_timeout=10
+        )
+        print(len(results))
+        """
+    )
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, cwd=REPO_DIR, timeout=30
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "1"
+    assert elapsed < 4
+
+
+def test_fast_first_mirror_is_the_only_one_queried(server):
+    server.add("/m1/search/", results_page("Dune"))
+    server.add("/m2/search/", results_page("Dune"))
+    mirrors = [server.url("/m1/search/"), server.url("/m2/search/")]
+    scraper = ContentScraper(mirror_groups={"site": mirrors})
+
+    batches = list(scraper.iter_search("dune", mirrors))
+
+    assert [(batch.provider, batch.error) for batch in batches] == [(mirrors[0], None)]
+    assert server.hits("/m2/") == 0
+
+
+def test_slow_mirror_is_hedged_with_the_next(server, monkeypatch):
+    monkeypatch.setattr(scraper_module, "DEFAULT_HEDGE_DELAY", 0.2)
+    server.add("/m1/search/", results_page("Dune Slow"), delay=3)
+    server.add("/m2/search/", results_page("Dune"))
+    mirrors = [server.url("/m1/search/"), server.url("/m2/search/")]
+    scraper = ContentScraper(mirror_groups={"site": mirrors})
+
+    start = time.perf_counter()
+    batches = list(scraper.iter_search("dune", mirrors))
+
+    assert time.perf_counter() - start < 1.5
+    assert [(batch.provider, batch.results[0][0]) for batch in batches] == [(mirrors[1], "Dune")]
+
+
+def test_failed_mirror_is_replaced_at_once(server):
+    server.add("/m1/search/", b"down", status=500)
+    server.add("/m2/search/", results_page("Dune"))
+    mirrors = [server.url("/m1/search/"), server.url("/m2/search/")]
+    scraper = ContentScraper(mirror_groups={"site": mirrors})
+
+    start = time.perf_counter()
+    batches = list(scraper.iter_search("dune", mirrors))
+
+    assert time.perf_counter() - start < 1
+    assert [batch.provider for batch in batches] == mirrors
+    assert batches[0].error is not None and batches[1].results
+
+
+def test_batches_stream_in_completion_order(server):
+    server.add("/slow/search/", results_page("Dune Slow"), delay=1)
+    server.add("/fast/search/", results_page("Dune"))
+    bases = [server.url("/slow/search/"), server.url("/fast/search/")]
+
+    start = time.perf_counter()
+    arrivals = []
+    for batch in ContentScraper().iter_search("dune", bases, concurrent=True):
+        arrivals.append((batch.provider, time.perf_counter() - start))
+
+    assert [provider for provider, _ in arrivals] == [bases[1], bases[0]]
+    assert arrivals[0][1] < 0.5 <= arrivals[1][1]
+
+
+def test_search_reports_each_batch_to_the_callback(server):
+    server.add("/a/search/", results_page("Dune"))
+    server.add("/b/search/", b"down", status=500)
+    bases = [server.url("/a/search/"), server.url("/b/search/")]
+    seen = []
+
+    results = ContentScraper().search("dune", bases, on_results=seen.append, rank=False)
+
+    assert sorted(batch.provider for batch in seen) == sorted(bases)
+    assert [batch.error is None for batch in seen] == [True, False]
+    assert [title for title, _ in results] == ["Dune"]
+
+
+def test_prewarm_opens_one_connection_per_origin(server, tmp_path):
+    server.add("/", b"")
+    health = ProviderHealth(tmp_path / "cache.db", failure_threshold=1)
+    health.record_failure(server.url("/down/search/"))
+    urls = [server.url("/a/search/"), server.url("/b/search/"), "ftp://ignored.example/"]
+
+    thread = ContentScraper(health=health).prewarm(urls)
+    thread.join(5)
+
+    assert [(method, path) for method, path, _ in server.requests] == [("HEAD", "/")]
+    assert ContentScraper(health=health).prewarm([server.url("/down/search/")]) is None
+
+
+def test_http_cache_hits_leave_provider_health_alone(server, tmp_path):
+    server.add("/search/", results_page("Dune"), delay=0.3)
+    base = server.url("/search/")
+    health = ProviderHealth(tmp_path / "cache.db")
+    scraper = ContentScraper(cache=ResponseCache(tmp_path / "cache.db"), health=health)
+
+    first = list(scraper.iter_search("dune", [base]))
+    again = [list(scraper.iter_search("dune", [base])) for _ in range(3)]
+
+    assert server.hits("/search/") == 1
+    assert not first[0].cached and all(batches[0].cached for batches in again)
+    record = health.get(base)
+    assert record.samples == 1 and record.latency >= 0.3
+
+
+class _SlowLoadingIndex(TitleIndex):
+    """Title index whose first read takes as long as loading a large file."""
+
+    def _load(self):
+        if not self._loaded:
+            time.sleep(0.6)
+        super()._load()
+
+
+def test_live_queries_start_before_the_title_index_loads(server, tmp_path):
+    server.add("/search/", results_page("Dune Part Two"), delay=0.6)
+    base = server.url("/search/")
+    seed = TitleIndex(tmp_path / "index.gz")
+    seed.add(base, [("Dune", "/movie/dune")])
+    assert seed.save()
+
+    scraper = ContentScraper(title_index=_SlowLoadingIndex(tmp_path / "index.gz"))
+    start = time.perf_counter()
+    batches = list(scraper.iter_search("dune", [base], concurrent=True))
+
+    assert time.perf_counter() - start < 1.0
+    assert [batch.provider for batch in batches] == [INDEX_PROVIDER, base]
+    assert batches[0].results[0][0] == "Dune"
@@ -0,0 +1,31 @@
+"""Commands that don't search must not import the heavy dependencies."""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from bench_startup import CASES, REPO_DIR, parse_importtime
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: " ".join(case.args))
+def test_command_skips_heavy_imports(case, tmp_path):
+    config_dir = tmp_path / ".franken-stream"
+    config_dir.mkdir()
+    shutil.copy(REPO_DIR / "providers.json", config_dir / "providers.json")
+    env = dict(os.environ, HOME=str(tmp_path), PYTHONPATH=str(REPO_DIR))
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "franken_stream.main", *case.args],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=REPO_DIR,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    _, modules = parse_importtime(result.stderr)
+    assert [name for name in case.forbidden if name in modules] == []
@@ -0,0 +1,143 @@
+"""Tests for the TUI search screen, driven headless through Textual's pilot."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from conftest import results_page
+from franken_stream import cache as cache_module
+from franken_stream import index as index_module
+from franken_stream.providers import ProviderManager
+from franken_stream.scraper import ContentScraper, ProviderResults
+from franken_stream.tui import FrankenStreamApp, SearchScreen, _format_progress, _get_scraper
+
+
+@pytest.fixture
+def make_app(server, tmp_path, monkeypatch):
+    """A TUI app whose providers point at the local server."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    def make(*bases, mirror_groups=None):
+        config_dir = tmp_path / ".franken-stream"
+        config_dir.mkdir(exist_ok=True)
+        config = {"movie_search_bases": [server.url(base) for base in bases]}
+        if mirror_groups:
+            config["mirror_groups"] = {
+                name: [server.url(base) for base in group]
+                for name, group in mirror_groups.items()
+            }
+        (config_dir / "providers.json").write_text(json.dumps(config))
+        app = FrankenStreamApp().app
+        app.pm = ProviderManager()
+        app.scraper = ContentScraper(mirror_groups=app.pm.get_mirror_groups())
+        return app
+
+    return make
+
+
+async def _wait_for(condition, pilot, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await pilot.pause(0.05)
+
+
+def _result_count(screen):
+    return screen.query_one("#search_results").option_count
+
+
+def test_typing_searches_once_after_the_pause(make_app, server):
+    server.add("/a/search/", results_page("Dune", "Dune Part Two"))
+    app = make_app("/a/search/")
+
+    async def run():
+        async with app.run_test() as pilot:
+            screen = SearchScreen()
+            await app.push_screen(screen)
+            await pilot.press(*"dune")
+            await _wait_for(lambda: _result_count(screen) == 2, pilot)
+            # One request for the whole word, none for "du" and "dun"
+            assert server.hits("/a/search/") == 1
+            assert server.hits("/a/search/dune") == 1
+
+            await pilot.press("backspace", "backspace", "backspace")
+            await _wait_for(lambda: _result_count(screen) == 0, pilot)
+
+    asyncio.run(run())
+
+
+def test_fast_providers_render_while_slow_ones_load(make_app, server):
+    server.add("/fast/search/", results_page("Dune"))
+    server.add("/slow/search/", results_page("Dune Slow"), delay=2)
+    app = make_app("/fast/search/", "/slow/search/")
+
+    async def run():
+        async with app.run_test() as pilot:
+            screen = SearchScreen()
+            await app.push_screen(screen)
+            await pilot.press(*"dune", "enter")
+            await _wait_for(lambda: _result_count(screen) == 1, pilot, timeout=1.5)
+            status = str(screen.query_one("#search_status").render())
+            assert "1/2 providers" in status
+
+            await _wait_for(lambda: _result_count(screen) == 2, pilot)
+
+    asyncio.run(run())
+
+
+def test_a_mirror_group_counts_as_one_provider(make_app, server):
+    server.add("/a/search/", results_page("Dune"))
+    server.add("/m1/search/", results_page("Dune Part Two"))
+    server.add("/m2/search/", results_page("Dune Part Two"), delay=2)
+    mirrors = ["/m1/search/", "/m2/search/"]
+    app = make_app("/a/search/", *mirrors, mirror_groups={"site": mirrors})
+
+    async def run():
+        async with app.run_test() as pilot:
+            screen = SearchScreen()
+            await app.push_screen(screen)
+            await pilot.press(*"dune", "enter")
+            await _wait_for(lambda: _result_count(screen) == 2, pilot)
+            await pilot.pause(0.2)
+            status = str(screen.query_one("#search_status").render())
+            # The slow mirror is never queried, and the group still completes
+            assert "2/2 providers" in status and "…" not in status
+            assert server.hits("/m2/") == 0
+
+    asyncio.run(run())
+
+
+def test_progress_marks_a_group_failed_only_when_it_is_over():
+    mirrors = ["https://m1.example/search/", "https://m2.example/search/"]
+    group = {base: "site" for base in mirrors}
+    failed = {mirrors[0]: ProviderResults(mirrors[0], [], 0.1, "HTTP 500")}
+
+    assert _format_progress(mirrors, failed, group).startswith("0/1 providers · [dim]…")
+    assert "✗ m1.example" in _format_progress(mirrors, failed, group, complete=True)
+
+    failed[mirrors[1]] = ProviderResults(mirrors[1], [], 0.1, "timeout")
+    assert _format_progress(mirrors, failed, group).startswith("1/1 providers · [red]✗")
+
+
+def test_workers_racing_for_the_scraper_share_one(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(cache_module, "DEFAULT_CACHE_PATH", tmp_path / "cache.db")
+    monkeypatch.setattr(index_module, "DEFAULT_INDEX_PATH", tmp_path / "title-index.gz")
+    app = FrankenStreamApp().app
+    start = threading.Barrier(8)
+    scrapers = []
+
+    def worker():
+        start.wait()
+        scrapers.append(_get_scraper(app))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(scrapers) == 8 and len({id(scraper) for scraper in scrapers}) == 1